@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+In-process fake of the GitHub REST and GraphQL endpoints, for tests.
+- FakeGitHubServer: HTTP/1.1 keep-alive server on 127.0.0.1
+- parse_graphql / resolve_graphql: the GraphQL subset the agent sends
+"""
+from __future__ import annotations
+import hashlib
+import itertools
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+
+def parse_graphql(query: str, variables: Dict[str, Any]) -> tuple:
+    """
+    (operation, selections) for the GraphQL subset FakeGitHubServer serves:
+    aliases, arguments, $variables and inline fragments.
+    """
+    tokens = re.findall(r'"(?:[^"\\]|\\.)*"|\.\.\.|[{}()\[\]:!$=@]|-?\d+(?:\.\d+)?|[_A-Za-z]\w*', query)
+    position = 0
+    
+    def peek() -> Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+    
+    def take(expected: Optional[str] = None) -> str:
+        nonlocal position
+        token = peek()
+        if token is None or (expected is not None and token != expected):
+            raise ValueError(f"GraphQL syntax error near {token!r}")
+        position += 1
+        return token
+    
+    def value() -> Any:
+        token = take()
+        if token == '$':
+            return variables.get(take())
+        if token == '[':
+            items = []
+            while peek() != ']':
+                items.append(value())
+            take(']')
+            return items
+        if token == '{':
+            fields = {}
+            while peek() != '}':
+                name = take()
+                take(':')
+                fields[name] = value()
+            take('}')
+            return fields
+        if token.startswith('"'):
+            return json.loads(token)
+        if re.fullmatch(r'-?\d+', token):
+            return int(token)
+        return {'true': True, 'false': False, 'null': None}.get(token, token)
+    
+    def selection_set() -> List[tuple]:
+        take('{')
+        selections = []
+        while peek() != '}':
+            if peek() == '...':
+                take()
+                take('on')
+                selections.append(('fragment', take(), selection_set()))
+                continue
+            alias = name = take()
+            if peek() == ':':
+                take()
+                name = take()
+            arguments = {}
+            if peek() == '(':
+                take()
+                while peek() != ')':
+                    key = take()
+                    take(':')
+                    arguments[key] = value()
+                take(')')
+            selections.append(('field', alias, name, arguments, selection_set() if peek() == '{' else None))
+        take('}')
+        return selections
+    
+    operation = 'query'
+    if peek() in ('query', 'mutation'):
+        operation = take()
+        while peek() != '{':  # name and variable definitions
+            take()
+    return operation, selection_set()
+
+def resolve_graphql(value: Any, selections: List[tuple]) -> Any:
+    """Apply a selection set to dicts whose callable fields take the arguments"""
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [resolve_graphql(item, selections) for item in value]
+    result = {}
+    for selection in selections:
+        if selection[0] == 'fragment':
+            if value.get('__typename') == selection[1]:
+                result.update(resolve_graphql(value, selection[2]))
+            continue
+        _, alias, name, arguments, subselections = selection
+        field_value = value.get(name)
+        if callable(field_value):
+            field_value = field_value(**arguments)
+        result[alias] = resolve_graphql(field_value, subselections) if subselections else field_value
+    return result
+
+class FakeGitHubServer:
+    """
+    In-process fake of the GitHub REST and GraphQL endpoints the agent uses.
+    WHY: The whole client and transport path can be tested and benchmarked
+    offline - point HttpTransport at `url` and `github_repo` at `repo_name`.
+    
+    Speaks HTTP/1.1 keep-alive on 127.0.0.1 and answers If-None-Match with
+    304 like GitHub. `fail_next` holds statuses to
+    return for the next requests (fault injection); `latency_s` delays
+    every response.
+    """
+    
+    def __init__(self, owner: str = 'octo', repo: str = 'demo', latency_s: float = 0.0):
+        self.owner = owner
+        self.repo = repo
+        self.latency_s = latency_s
+        self.issues: Dict[int, Dict[str, Any]] = {}
+        self.comments: Dict[int, Dict[str, Any]] = {}
+        self.pulls: Dict[int, Dict[str, Any]] = {}
+        self.check_runs: Dict[str, List[Dict[str, Any]]] = {}
+        self.requests: List[tuple] = []  # (method, path) in arrival order
+        self.connections = 0
+        self.not_modified = 0  # conditional GETs answered 304
+        self.fail_next: List[int] = []
+        self._numbers = itertools.count(1)
+        self._comment_ids = itertools.count(1)
+        self._epoch = datetime.now(timezone.utc).replace(microsecond=0)
+        self._ticks = itertools.count()
+        self._lock = threading.RLock()  # route handlers call add_issue()
+        self._server = None
+    
+    @property
+    def repo_name(self) -> str:
+        return f"{self.owner}/{self.repo}"
+    
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> 'FakeGitHubServer':
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        fake = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, like api.github.com
+            
+            def setup(self):
+                super().setup()
+                with fake._lock:
+                    fake.connections += 1
+            
+            def _serve(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                status, payload, *extra = fake.handle(self.command, self.path, json.loads(raw) if raw else None)
+                if fake.latency_s:
+                    time.sleep(fake.latency_s)
+                data = json.dumps(payload).encode()
+                etag = f'"{hashlib.sha1(data).hexdigest()}"'
+                if self.command == 'GET' and status == 200 and self.headers.get('If-None-Match') == etag:
+                    with fake._lock:
+                        fake.not_modified += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                if self.command == 'GET':
+                    self.send_header('ETag', etag)
+                for name, value in (extra[0] if extra else {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+            
+            do_GET = do_POST = do_PATCH = _serve
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='fake-github', daemon=True).start()
+        return self
+    
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def __enter__(self) -> 'FakeGitHubServer':
+        return self.start()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+    
+    def _now(self) -> str:
+        """A logical clock one second per change: distinct, ordered updated_at values"""
+        return (self._epoch + timedelta(seconds=next(self._ticks))).strftime('%Y-%m-%dT%H:%M:%SZ')
+    
+    def add_issue(self, title: str, body: str = '', state: str = 'open',
+                  labels: tuple = ()) -> Dict[str, Any]:
+        with self._lock:
+            number = next(self._numbers)
+            self.issues[number] = {
+                'number': number,
+                'title': title,
+                'body': body,
+                'state': state,
+                'labels': [{'name': label} for label in labels],
+                'html_url': f"https://github.com/{self.repo_name}/issues/{number}",
+                'created_at': self._now(),
+                'updated_at': self._now()
+            }
+            return self.issues[number]
+    
+    def update_issue(self, number: int, **changes: Any) -> Dict[str, Any]:
+        """Change an issue server-side, bumping updated_at like GitHub"""
+        with self._lock:
+            return self._update_issue({}, changes, number)[1]
+    
+    def add_pull(self, title: str, conclusions: tuple = ('success',)) -> Dict[str, Any]:
+        """An open PR whose head commit has one check run per conclusion (None = running)"""
+        with self._lock:
+            number = next(self._numbers)
+            sha = hashlib.sha1(str(number).encode()).hexdigest()
+            self.pulls[number] = {
+                'number': number,
+                'title': title,
+                'state': 'open',
+                'head': {'sha': sha},
+                'html_url': f"https://github.com/{self.repo_name}/pull/{number}"
+            }
+            self.set_checks(number, conclusions)
+            return self.pulls[number]
+    
+    def set_checks(self, number: int, conclusions: tuple) -> None:
+        """Replace a PR's check runs, as a new CI run would"""
+        with self._lock:
+            self.check_runs[self.pulls[number]['head']['sha']] = [
+                {'name': f"check-{i}", 'status': 'completed' if conclusion else 'in_progress',
+                 'conclusion': conclusion}
+                for i, conclusion in enumerate(conclusions)
+            ]
+    
+    def close_pull(self, number: int, merged: bool = False) -> None:
+        with self._lock:
+            self.pulls[number]['state'] = 'merged' if merged else 'closed'
+    
+    def handle(self, method: str, target: str, body: Any) -> tuple:
+        """(status, payload[, headers]) for one request"""
+        from urllib.parse import parse_qsl, urlsplit
+        url = urlsplit(target)
+        query = dict(parse_qsl(url.query))
+        with self._lock:
+            self.requests.append((method, url.path))
+            if self.fail_next:
+                # An int status, or (status, headers) e.g. (403, {'Retry-After': '1'})
+                failure = self.fail_next.pop(0)
+                status, headers = failure if isinstance(failure, tuple) else (failure, {})
+                message = 'API rate limit exceeded' if status in (403, 429) else 'Injected failure'
+                return status, {'message': message}, headers
+        
+        if (method, url.path) == ('POST', '/graphql'):
+            with self._lock:
+                return self._graphql(body or {})
+        prefix = f"/repos/{self.repo_name}"
+        if url.path.startswith(prefix + '/'):
+            route = url.path[len(prefix):]
+            for route_method, pattern, handler in self.ROUTES:
+                match = re.fullmatch(pattern, route)
+                if match and route_method == method:
+                    with self._lock:
+                        return handler(self, query, body or {}, *match.groups())
+        return 404, {'message': 'Not Found'}
+    
+    def _list_issues(self, query, body):
+        state = query.get('state', 'open')
+        since = query.get('since', '')
+        issues = [issue for issue in self.issues.values()
+                  if (state == 'all' or issue['state'] == state) and issue['updated_at'] >= since]
+        if query.get('sort') == 'updated':
+            issues.sort(key=lambda issue: issue['updated_at'], reverse=query.get('direction') != 'asc')
+        
+        # Page-number pagination with a Link header, as GitHub does
+        per_page, page = int(query.get('per_page', 30)), int(query.get('page', 1))
+        headers = {}
+        if page * per_page < len(issues):
+            from urllib.parse import urlencode
+            headers['Link'] = f'<{self.url}/repos/{self.repo_name}/issues?{urlencode({**query, "page": page + 1})}>; rel="next"'
+        return 200, issues[(page - 1) * per_page:page * per_page], headers
+    
+    def _create_issue(self, query, body):
+        if not body.get('title'):
+            return 422, {'message': 'Validation Failed'}
+        return 201, self.add_issue(body['title'], body.get('body', ''), labels=tuple(body.get('labels', ())))
+    
+    def _get_issue(self, query, body, number):
+        issue = self.issues.get(int(number))
+        return (200, issue) if issue else (404, {'message': 'Not Found'})
+    
+    def _update_issue(self, query, body, number):
+        issue = self.issues.get(int(number))
+        if not issue:
+            return 404, {'message': 'Not Found'}
+        issue.update({key: body[key] for key in ('title', 'body', 'state') if key in body})
+        issue['updated_at'] = self._now()
+        return 200, issue
+    
+    def _create_comment(self, query, body, number):
+        issue = self.issues.get(int(number))
+        if not issue:
+            return 404, {'message': 'Not Found'}
+        comment_id = next(self._comment_ids)
+        self.comments[comment_id] = {
+            'id': comment_id,
+            'issue_number': issue['number'],
+            'body': body.get('body', ''),
+            'html_url': f"{issue['html_url']}#issuecomment-{comment_id}",
+            'created_at': self._now(),
+            'updated_at': self._now()
+        }
+        return 201, self.comments[comment_id]
+    
+    def _list_pulls(self, query, body):
+        return 200, [pull for pull in self.pulls.values() if pull['state'] == query.get('state', 'open')]
+    
+    def _list_check_runs(self, query, body, sha):
+        runs = self.check_runs.get(sha, [])
+        return 200, {'total_count': len(runs), 'check_runs': runs}
+    
+    def _graphql(self, body: Dict[str, Any]) -> tuple:
+        """Execute a query or mutation; a failing top-level field nulls only itself"""
+        try:
+            operation, selections = parse_graphql(body.get('query', ''), body.get('variables') or {})
+        except ValueError as e:
+            return 200, {'errors': [{'message': str(e)}]}
+        root = self._graphql_mutations() if operation == 'mutation' else {'repository': self._gql_repository}
+        data, errors = {}, []
+        for selection in selections:
+            alias = selection[1]
+            try:
+                data.update(resolve_graphql(root, [selection]))
+            except LookupError as e:
+                data[alias] = None
+                errors.append({'type': 'NOT_FOUND', 'message': e.args[0], 'path': [alias]})
+        return 200, {'data': data, **({'errors': errors} if errors else {})}
+    
+    def _gql_repository(self, owner: str, name: str) -> Dict[str, Any]:
+        if f"{owner}/{name}" != self.repo_name:
+            raise LookupError(f"Could not resolve to a Repository with the name '{owner}/{name}'.")
+        
+        def issue(number: int) -> Dict[str, Any]:
+            if number not in self.issues:
+                raise LookupError(f"Could not resolve to an Issue with the number of {number}.")
+            return self._gql_issue(self.issues[number])
+        
+        def issues(states=('OPEN', 'CLOSED'), first=100, after=None, **_):
+            states = [states] if isinstance(states, str) else states
+            nodes = [self._gql_issue(i) for i in self.issues.values() if i['state'].upper() in states]
+            start = int(after or 0)
+            end = start + first
+            return {'totalCount': len(nodes), 'nodes': nodes[start:end],
+                    'pageInfo': {'hasNextPage': end < len(nodes), 'endCursor': str(min(end, len(nodes)))}}
+        
+        def pull_requests(states=('OPEN',), first=100, after=None, **_):
+            states = [states] if isinstance(states, str) else states
+            nodes = [self._gql_pull(p) for p in self.pulls.values() if p['state'].upper() in states]
+            start = int(after or 0)
+            end = start + first
+            return {'totalCount': len(nodes), 'nodes': nodes[start:end],
+                    'pageInfo': {'hasNextPage': end < len(nodes), 'endCursor': str(min(end, len(nodes)))}}
+        
+        def pull_request(number: int) -> Dict[str, Any]:
+            if number not in self.pulls:
+                raise LookupError(f"Could not resolve to a PullRequest with the number of {number}.")
+            return self._gql_pull(self.pulls[number])
+        
+        return {'issue': issue, 'issues': issues, 'pullRequests': pull_requests, 'pullRequest': pull_request}
+    
+    def _gql_comment(self, comment: Dict[str, Any]) -> Dict[str, Any]:
+        return {'id': f"IC_{comment['id']}", 'databaseId': comment['id'], 'body': comment['body'],
+                'url': comment['html_url'], 'updatedAt': comment['updated_at']}
+    
+    def _gql_issue(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        def comments(first=None, last=None, **_):
+            nodes = [self._gql_comment(c) for c in self.comments.values() if c['issue_number'] == issue['number']]
+            return {'totalCount': len(nodes), 'nodes': nodes[-last:] if last else nodes[:first]}
+        
+        return {'id': f"I_{issue['number']}", 'number': issue['number'], 'title': issue['title'],
+                'state': issue['state'].upper(), 'body': issue['body'], 'url': issue['html_url'],
+                'updatedAt': issue['updated_at'], 'comments': comments}
+    
+    def _gql_pull(self, pull: Dict[str, Any]) -> Dict[str, Any]:
+        sha = pull['head']['sha']
+        runs = [
+            {'__typename': 'CheckRun', 'name': run['name'], 'status': run['status'].upper(),
+             'conclusion': (run['conclusion'] or '').upper() or None}
+            for run in self.check_runs.get(sha, [])
+        ]
+        commit = {'oid': sha, 'statusCheckRollup': {'contexts': lambda first=100, **_: {'nodes': runs[:first]}}}
+        return {'id': f"PR_{pull['number']}", 'number': pull['number'], 'title': pull['title'],
+                'state': pull['state'].upper(), 'url': pull['html_url'],
+                'commits': lambda last=1, **_: {'nodes': [{'commit': commit}]}}
+    
+    def _graphql_mutations(self) -> Dict[str, Any]:
+        def add_comment(input):
+            number = int(str(input.get('subjectId', '')).partition('_')[2] or 0)
+            status, comment = self._create_comment({}, {'body': input.get('body', '')}, number)
+            if status != 201:
+                raise LookupError(f"Could not resolve to a node with the global id of '{input.get('subjectId')}'.")
+            return {'commentEdge': {'node': self._gql_comment(comment)}}
+        
+        def update_comment(input):
+            comment = self.comments.get(int(str(input.get('id', '')).partition('_')[2] or 0))
+            if comment is None:
+                raise LookupError(f"Could not resolve to a node with the global id of '{input.get('id')}'.")
+            comment.update(body=input.get('body', ''), updated_at=self._now())
+            return {'issueComment': self._gql_comment(comment)}
+        
+        return {'addComment': add_comment, 'updateIssueComment': update_comment}
+    
+    ROUTES = [
+        ('GET', r'/issues', _list_issues),
+        ('POST', r'/issues', _create_issue),
+        ('GET', r'/issues/(\d+)', _get_issue),
+        ('PATCH', r'/issues/(\d+)', _update_issue),
+        ('POST', r'/issues/(\d+)/comments', _create_comment),
+        ('GET', r'/pulls', _list_pulls),
+        ('GET', r'/commits/(\w+)/check-runs', _list_check_runs),
+    ]
@@ -19,34 +19,65 @@ ARCHITECTURAL DECISIONS:
 - Performance optimized from start
 """
 
+import time
+_IMPORT_STARTED = time.perf_counter()  # start of the 'import agent_boot' startup phase
+
 import asyncio
+import bisect
+import copy
 import json
 import logging
 import os
 import sys
 import subprocess
 import re
+import random
+import socket
+import itertools
+import threading
+import traceback
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, TypedDict, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Protocol, TypedDict, Union
 import hashlib
-import time
-from functools import lru_cache, wraps
-from contextlib import asynccontextmanager
-
-# Performance: Configure logging efficiently
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('agent_boot.log', mode='a')
-    ]
+from functools import cached_property, lru_cache, wraps
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+
+_STDLIB_IMPORTED = time.perf_counter()
+
+if __package__ in (None, ''):
+    # Run as a script or imported as a top-level module: make `tools.agent.*` importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# Split out of this module; re-exported here so callers keep importing from agent_boot
+from tools.agent.utils.external import (
+    ExternalCallError, NotFoundError, deadline_scope, detach_deadline, remaining_s, clamp_timeout
 )
+from tools.agent.utils.github_transport import GitHubResponse, GitHubTransport, GhCliTransport, HttpTransport
+from tools.agent.utils.github_cache import ResponseCache
+from tools.agent.utils.github_batch import GraphQLBatcher
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 logger = logging.getLogger(__name__)
 
+def configure_logging(debug: bool = False, log_file: str = 'agent_boot.log') -> None:
+    """
+    Attach console and file handlers to the root logger.
+    WHY: Importing the module must not touch the filesystem; the CLI opts in,
+    and the log file is only opened when the first record is written.
+    """
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler(log_file, mode='a', delay=True)
+        ]
+    )
+
 # ============================================================================
 # CORE PATTERNS - Teaching through implementation
 # ============================================================================
@@ -68,8 +99,114 @@ class Priority(Enum):
     LOW = 4
     DEFERRED = 5
 
+class OverflowPolicy(Enum):
+    """What submit() does when the bounded task queue is full"""
+    BLOCK = 'block'              # wait for space (backpressure)
+    DROP_OLDEST = 'drop_oldest'  # evict the oldest, least urgent queued task
+    REJECT = 'reject'            # fail the new task immediately
+
 # Type definitions for clarity and IDE support
-class ConfigDict(TypedDict):
+class TuningDict(TypedDict, total=False):
+    """Optional runtime tuning knobs - defaults live in DEFAULT_TUNING"""
+    loop_lag_monitor: bool
+    loop_lag_interval_ms: float
+    loop_lag_threshold_ms: float
+    task_aging_interval_s: float
+    min_workers: int
+    max_workers: int
+    worker_scale_up_depth: int
+    worker_idle_ttl_s: float
+    task_queue_maxsize: int
+    queue_overflow_policy: str
+    coalesce_window_ms: float
+    session_history_size: int
+    session_spill_path: Optional[str]
+    startup_budget_ms: float
+    branch_check: bool
+    default_branch: str
+    auto_pull: bool
+    external_call_timeout_s: float
+    external_call_budget_s: float
+    retry_base_delay_ms: float
+    retry_max_delay_ms: float
+    breaker_failure_threshold: int
+    breaker_reset_s: float
+    command_deadline_factor: float
+    drain_timeout_s: float
+    task_spill_path: str
+    pr_status_cache_ttl_s: float
+    process_concurrency: int
+    git_timeout_s: float
+    github_transport: str
+    github_api_url: str
+    github_pool_size: int
+    github_repo: Optional[str]
+    graphql_batch_window_ms: float
+    graphql_batch_max: int
+    github_cache: bool
+    github_cache_path: Optional[str]
+    github_cache_ttl_s: Optional[float]
+    github_stale_s: float
+    github_sync_state_path: str
+    bulk_issue_concurrency: int
+    bulk_issue_rate_per_min: float
+    bulk_issue_burst: float
+    bulk_issue_journal_path: str
+    progress_comment_debounce_ms: float
+    pr_watch_min_interval_s: float
+    pr_watch_max_interval_s: float
+
+DEFAULT_TUNING = TuningDict(
+    loop_lag_monitor=True,
+    loop_lag_interval_ms=50.0,
+    loop_lag_threshold_ms=100.0,
+    task_aging_interval_s=5.0,
+    min_workers=3,
+    max_workers=8,
+    worker_scale_up_depth=4,
+    worker_idle_ttl_s=30.0,
+    task_queue_maxsize=1000,
+    queue_overflow_policy='block',
+    coalesce_window_ms=50.0,
+    session_history_size=100,
+    session_spill_path=None,
+    startup_budget_ms=500.0,
+    branch_check=False,
+    default_branch='dev',
+    auto_pull=True,
+    external_call_timeout_s=10.0,
+    external_call_budget_s=30.0,
+    retry_base_delay_ms=200.0,
+    retry_max_delay_ms=2000.0,
+    breaker_failure_threshold=5,
+    breaker_reset_s=30.0,
+    command_deadline_factor=10.0,
+    drain_timeout_s=5.0,
+    task_spill_path='.agent_boot/spill.jsonl',
+    pr_status_cache_ttl_s=2.0,
+    process_concurrency=4,
+    git_timeout_s=120.0,
+    github_transport='gh',
+    github_api_url='https://api.github.com',
+    github_pool_size=4,
+    github_repo=None,
+    graphql_batch_window_ms=5.0,
+    graphql_batch_max=25,
+    github_cache=True,
+    github_cache_path='.agent_boot/github_cache.json',
+    github_cache_ttl_s=None,  # None: cache_ttl_seconds
+    github_stale_s=600.0,
+    github_sync_state_path='.agent_boot/github_sync.json',
+    bulk_issue_concurrency=3,
+    bulk_issue_rate_per_min=60.0,  # under GitHub's 80 content-creating requests/minute
+    bulk_issue_burst=5.0,
+    bulk_issue_journal_path='.agent_boot/bulk_issues.jsonl',
+    progress_comment_debounce_ms=2000.0,
+    pr_watch_min_interval_s=5.0,
+    pr_watch_max_interval_s=120.0,
+)
+
+class ConfigDict(TuningDict):
     """Configuration structure - explicit is better than implicit"""
     project_root: str
     canonical_docs: Dict[str, str]
@@ -139,10 +276,154 @@ def get_file_hash(filepath: Path) -> str:
             hasher.update(chunk)
     return hasher.hexdigest()
 
+class SingleFlight:
+    """
+    Share one execution among identical concurrent calls.
+    WHY: Ten dashboards polling at once should cost one `gh` call, not ten.
+    
+    Calls with the same key join the execution already in flight; with
+    `ttl_s` > 0 a successful result is also served from cache for that long.
+    Every caller gets its own shallow copy of the result.
+    """
+    
+    def __init__(self, ttl_s: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        self.ttl_s = ttl_s
+        self.clock = clock
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._cache: Dict[str, tuple] = {}  # key -> (expires_at, result)
+    
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> tuple:
+        """Return (result, outcome) where outcome is 'executed', 'shared' or 'cached'"""
+        cached = self._cache.get(key)
+        if cached and cached[0] > self.clock():
+            return copy.copy(cached[1]), 'cached'
+        self._cache.pop(key, None)
+        
+        future = self._inflight.get(key)
+        outcome = 'shared'
+        if future is None:
+            outcome = 'executed'
+            future = self._inflight[key] = asyncio.ensure_future(self._run(func))
+            future.add_done_callback(lambda done: self._finish(key, done))
+        
+        # Shielded: one caller's cancellation (e.g. its deadline) must not cancel the others
+        result = await asyncio.shield(future)
+        return copy.copy(result), outcome
+    
+    @staticmethod
+    async def _run(func: Callable[[], Awaitable[Any]]) -> Any:
+        # Shared by every caller, so not bound by the deadline of whichever came first
+        detach_deadline()
+        return await func()
+    
+    def _finish(self, key: str, future: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if self.ttl_s <= 0 or future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        if isinstance(result, dict) and not result.get('success', True):
+            return  # failures are not cached
+        now = self.clock()
+        # Keys are arbitrary call arguments: drop expired results rather than keep every one
+        self._cache = {name: entry for name, entry in self._cache.items() if entry[0] > now}
+        self._cache[key] = (now + self.ttl_s, result)
+
+def single_flight(ttl_s: Union[float, str] = 0.0):
+    """
+    Decorate an async method so identical concurrent calls share one execution.
+    `ttl_s` is seconds of result caching, or the name of a config key holding it.
+    Outcomes are counted in context.metrics as single_flight_<outcome>_total.
+    """
+    def decorator(func):
+        attr = f"_single_flight_{func.__name__}"
+        
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            flight = self.__dict__.get(attr)
+            if flight is None:
+                ttl = self.context.config.get(ttl_s, 0.0) if isinstance(ttl_s, str) else ttl_s
+                flight = self.__dict__[attr] = SingleFlight(ttl)
+            key = json.dumps([args, kwargs], sort_keys=True, default=str)
+            result, outcome = await flight.do(key, lambda: func(self, *args, **kwargs))
+            metric = f"single_flight_{outcome}_total"
+            self.context.metrics[metric] = self.context.metrics.get(metric, 0) + 1
+            return result
+        return wrapper
+    return decorator
+
 # ============================================================================
 # CORE AGENT SYSTEM - Complete implementation
 # ============================================================================
 
+class SessionLog:
+    """
+    Per-key counters plus a ring buffer of the most recent entries.
+    WHY: A long-running session must not grow with every task; totals and
+    counts are all reporting needs, and history beyond the buffer can be
+    spilled to an append-only JSONL file instead of kept in memory.
+    
+    List-compatible where callers rely on it: append, extend, count, and len
+    and iteration over the recent entries. `total` counts every entry.
+    """
+    
+    SPILL_BATCH = 64
+    
+    def __init__(self, entries: Any = (), maxlen: int = 100,
+                 key: Optional[Callable[[Any], str]] = None,
+                 spill_path: Optional[Union[str, Path]] = None,
+                 labels: Optional[Dict[str, Any]] = None):
+        self.recent: Deque[Any] = deque(maxlen=maxlen)
+        self.counts: Dict[str, int] = {}
+        self.total = 0
+        self.spilled = 0
+        self.key = key or str
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.labels = labels or {}
+        self._pending: List[Any] = []
+        self.extend(entries)
+    
+    def configure(self, maxlen: int, spill_path: Optional[Union[str, Path]] = None,
+                  labels: Optional[Dict[str, Any]] = None) -> None:
+        """Resize the ring buffer and set where evicted entries spill (keeps counts)"""
+        if maxlen != self.recent.maxlen:
+            self.recent = deque(self.recent, maxlen=maxlen)
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.labels.update(labels or {})
+    
+    def append(self, entry: Any) -> None:
+        key = self.key(entry)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.total += 1
+        if len(self.recent) == self.recent.maxlen and self.spill_path is not None:
+            self._pending.append(self.recent[0])
+            if len(self._pending) >= self.SPILL_BATCH:
+                self.flush()
+        self.recent.append(entry)
+    
+    def extend(self, entries: Any) -> None:
+        for entry in entries:
+            self.append(entry)
+    
+    def count(self, key: str) -> int:
+        return self.counts.get(key, 0)
+    
+    def flush(self) -> None:
+        """Append evicted entries to the spill file"""
+        if not self._pending or self.spill_path is None:
+            return
+        pending, self._pending = self._pending, []
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spill_path, 'a') as f:
+            for entry in pending:
+                f.write(json.dumps({**self.labels, 'entry': entry}, default=str) + '\n')
+        self.spilled += len(pending)
+    
+    def __len__(self) -> int:
+        return len(self.recent)
+    
+    def __iter__(self):
+        return iter(self.recent)
+
 @dataclass
 class AgentContext:
     """
@@ -151,20 +432,41 @@ class AgentContext:
     """
     status: AgentStatus = AgentStatus.INITIALIZING
     config: ConfigDict = field(default_factory=dict)
-    tasks_completed: List[str] = field(default_factory=list)
-    errors: List[Dict[str, Any]] = field(default_factory=list)
+    tasks_completed: SessionLog = field(default_factory=lambda: SessionLog(key=str))
+    errors: SessionLog = field(default_factory=lambda: SessionLog(key=lambda error: error.get('phase', 'task')))
     metrics: Dict[str, float] = field(default_factory=dict)
     session_id: str = field(default_factory=lambda: hashlib.sha256(
         f"{datetime.now(timezone.utc).isoformat()}".encode()
     ).hexdigest()[:8])
     
+    # Bounded history: field name -> kind recorded with spilled entries
+    SESSION_LOGS = {'tasks_completed': 'task', 'errors': 'error'}
+    
+    def __post_init__(self) -> None:
+        # Sized and spilled as configured
+        spill_path = self.config.get('session_spill_path')
+        if spill_path:
+            spill_path = Path(self.config.get('project_root', '.')) / spill_path
+        for name, kind in self.SESSION_LOGS.items():
+            getattr(self, name).configure(
+                self.config.get('session_history_size', 100),
+                spill_path=spill_path,
+                labels={'kind': kind, 'session_id': self.session_id}
+            )
+    
+    def flush(self) -> None:
+        """Write out history still waiting to be spilled"""
+        for name in self.SESSION_LOGS:
+            getattr(self, name).flush()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Serialize context for logging/persistence"""
         return {
             'session_id': self.session_id,
             'status': self.status.name,
-            'tasks_completed': len(self.tasks_completed),
-            'errors': len(self.errors),
+            'tasks_completed': self.tasks_completed.total,
+            'tasks_by_type': dict(self.tasks_completed.counts),
+            'errors': self.errors.total,
             'metrics': self.metrics
         }
 
@@ -178,79 +480,570 @@ class AgentModule(Protocol):
     async def shutdown(self) -> None: ...
 
 # ============================================================================
-# GITHUB INTEGRATION - Full GitHub API integration
+# ENVIRONMENT PROBES - Cached with TTL for fast CLI startup
 # ============================================================================
 
-class GitHubIntegration:
+@dataclass(frozen=True)
+class ProbeSpec:
     """
-    GitHub API integration for issue and PR management.
-    WHY: Seamless integration with GitHub workflow.
+    How to run one environment probe.
+    WHY: Probes are data, so they can be cached and run concurrently.
     """
-    
-    def __init__(self, context: AgentContext):
-        self.context = context
-        self.repo = self._get_repo_info()
-    
-    def _get_repo_info(self) -> Dict[str, str]:
-        """Extract GitHub repo info from git remote"""
+    name: str
+    argv: tuple
+    parse: Callable[[int, str], Any]  # (returncode, stdout) -> cached value
+    timeout_s: float = 5.0
+    stamp_file: Optional[str] = None  # file whose mtime invalidates the cached value
+
+PROBES: Dict[str, ProbeSpec] = {
+    'gh_auth': ProbeSpec(
+        'gh_auth', ('gh', 'auth', 'status'),
+        parse=lambda returncode, stdout: returncode == 0
+    ),
+    'remote_url': ProbeSpec(
+        'remote_url', ('git', 'remote', 'get-url', 'origin'),
+        parse=lambda returncode, stdout: stdout.strip() if returncode == 0 else '',
+        stamp_file='.git/config'
+    ),
+    'current_branch': ProbeSpec(
+        'current_branch', ('git', 'branch', '--show-current'),
+        parse=lambda returncode, stdout: stdout.strip() if returncode == 0 else '',
+        stamp_file='.git/HEAD'
+    ),
+}
+
+class ProbeCache:
+    """
+    Persistent cache of environment probe results under .agent_boot/.
+    WHY: A warm CLI start should not fork gh/git to relearn what it knew a minute ago.
+
+    Entries expire after `ttl_seconds` (config: cache_ttl_seconds) or as soon
+    as the probe's stamp file changes (e.g. .git/HEAD after a checkout).
+    Cold probes run concurrently. Plain values such as the last fetch time
+    can be stored with record().
+    """
+
+    def __init__(self, root: Path, ttl_seconds: float = 300,
+                 specs: Optional[Dict[str, ProbeSpec]] = None):
+        self.root = Path(root)
+        self.path = self.root / '.agent_boot' / 'probes.json'
+        self.ttl_seconds = ttl_seconds
+        self.specs = PROBES if specs is None else specs
+        self.runs = 0  # subprocesses spawned by this instance
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        """Atomic write so concurrent CLI invocations never read half a file"""
         try:
-            result = subprocess.run(
-                ['git', 'remote', 'get-url', 'origin'],
-                capture_output=True, text=True, check=True
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+            temp_path.write_text(json.dumps(self.entries, indent=2))
+            temp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist probe cache: {e}")
+
+    def _stamp(self, name: str) -> Optional[float]:
+        spec = self.specs.get(name)
+        if not spec or not spec.stamp_file:
+            return None
+        try:
+            return (self.root / spec.stamp_file).stat().st_mtime
+        except OSError:
+            return None
+
+    def peek(self, name: str) -> tuple:
+        """(fresh, value) for a cached entry, without probing"""
+        entry = self.entries.get(name)
+        if not entry:
+            return False, None
+        if time.time() - entry['at'] > self.ttl_seconds:
+            return False, entry['value']
+        if entry.get('stamp') != self._stamp(name):
+            return False, entry['value']
+        return True, entry['value']
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Fresh cached value or `default`"""
+        fresh, value = self.peek(name)
+        return value if fresh else default
+
+    def age(self, name: str) -> Optional[float]:
+        """Seconds since the entry was recorded, or None"""
+        entry = self.entries.get(name)
+        return time.time() - entry['at'] if entry else None
+
+    def record(self, name: str, value: Any, save: bool = True) -> None:
+        self.entries[name] = {'value': value, 'at': time.time(), 'stamp': self._stamp(name)}
+        if save:
+            self._save()
+
+    def invalidate(self, name: str) -> None:
+        if self.entries.pop(name, None) is not None:
+            self._save()
+
+    async def ensure(self, names) -> Dict[str, Any]:
+        """Values for `names`, running all stale probes concurrently"""
+        stale = [name for name in names if not self.peek(name)[0]]
+        if stale:
+            values = await asyncio.gather(*(self._run(self.specs[name]) for name in stale))
+            for name, value in zip(stale, values):
+                self.record(name, value, save=False)
+            self._save()
+        return {name: self.entries[name]['value'] for name in names}
+
+    def ensure_sync(self, names) -> Dict[str, Any]:
+        """Blocking variant of ensure() for synchronous call sites"""
+        stale = [name for name in names if not self.peek(name)[0]]
+        for name in stale:
+            spec = self.specs[name]
+            self.runs += 1
+            try:
+                result = subprocess.run(
+                    list(spec.argv), capture_output=True, text=True, timeout=spec.timeout_s,
+                    cwd=self.root
+                )
+                value = spec.parse(result.returncode, result.stdout)
+            except (subprocess.SubprocessError, OSError):
+                value = spec.parse(127, '')
+            self.record(name, value, save=False)
+        if stale:
+            self._save()
+        return {name: self.entries[name]['value'] for name in names}
+
+    async def _run(self, spec: ProbeSpec) -> Any:
+        """Run one probe as a native async subprocess"""
+        self.runs += 1
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *spec.argv, cwd=self.root,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
             )
-            url = result.stdout.strip()
-            # Parse owner/repo from URL
-            match = re.search(r'github\.com[:/]([^/]+)/([^.]+)', url)
-            if match:
-                return {'owner': match.group(1), 'repo': match.group(2).replace('.git', '')}
-        except Exception as e:
-            logger.warning(f"Could not get repo info: {e}")
-        return {'owner': '', 'repo': ''}
+        except OSError:
+            return spec.parse(127, '')
+
+        timeout = clamp_timeout(spec.timeout_s)
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Probe {spec.name} timed out after {timeout:.1f}s")
+            return spec.parse(124, '')
+        finally:
+            # Also on cancellation: never leave the child running
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+        return spec.parse(process.returncode, stdout.decode(errors='replace'))
+
+# Probes a module needs before it can be built
+MODULE_PROBES: Dict[str, tuple] = {
+    'github': ('gh_auth', 'remote_url'),
+}
+
+# ============================================================================
+# RESILIENCE - Retries and circuit breakers for external calls
+# ============================================================================
+
+class CircuitOpenError(Exception):
+    """Raised without calling out while an endpoint's breaker is open"""
+
+class ProcessRunner:
+    """
+    Shared async runner for gh/git child processes.
+    WHY: Blocking subprocess.run inside a coroutine freezes the event loop and
+    every worker; native async processes let GitHub latency overlap other work.
     
-    async def create_issue(self, title: str, body: str, labels: List[str] = None) -> TaskResult:
+    At most `max_concurrency` children run at once. A timeout or cancellation
+    kills the child. stdout is read in chunks and can be streamed line by line
+    through `on_line`; every call's duration is recorded per command.
+    """
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, max_concurrency: int = 4, default_timeout_s: float = 10.0, window: int = 100):
+        self.max_concurrency = max(1, max_concurrency)
+        self.default_timeout_s = default_timeout_s
+        self.window = window
+        self.active = 0
+        self.counters = {'calls': 0, 'failures': 0, 'timeouts': 0, 'killed': 0}
+        self.durations_ms: Dict[str, Deque[float]] = {}
+        # Semaphores bind to an event loop, so keep one per running loop
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+    
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            self._semaphores = {other: sem for other, sem in self._semaphores.items() if not other.is_closed()}
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+    
+    @staticmethod
+    def command_name(argv: List[str]) -> str:
+        """'gh pr', 'git pull' - the granularity timings are kept at"""
+        return ' '.join(Path(argv[0]).name if i == 0 else arg for i, arg in enumerate(argv[:2]))
+    
+    async def run(self, argv: List[str], timeout_s: Optional[float] = None,
+                  cwd: Optional[Union[str, Path]] = None,
+                  on_line: Optional[Callable[[str], None]] = None,
+                  input: Optional[bytes] = None) -> subprocess.CompletedProcess:
         """
-        Create a GitHub issue using gh CLI.
-        WHY: Direct integration with development workflow.
+        Run argv to completion (bounded by the current deadline), feeding
+        `input` to its stdin when given.
+        Raises subprocess.TimeoutExpired on timeout and OSError if it cannot start.
         """
-        try:
-            cmd = ['gh', 'issue', 'create', '--title', title, '--body', body]
-            if labels:
-                cmd.extend(['--label', ','.join(labels)])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                issue_url = result.stdout.strip()
-                logger.info(f"✅ Created GitHub issue: {issue_url}")
-                return TaskResult(
-                    success=True,
-                    data={'url': issue_url},
-                    error=None,
-                    duration_ms=0,
-                    timestamp=datetime.now(timezone.utc).isoformat()
+        timeout = clamp_timeout(timeout_s or self.default_timeout_s)
+        name = self.command_name(argv)
+        
+        async with self._semaphore():
+            self.active += 1
+            self.counters['calls'] += 1
+            start_time = time.perf_counter()
+            process = None
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *argv, cwd=cwd,
+                    stdin=asyncio.subprocess.PIPE if input is not None else None,
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
                 )
-            else:
-                raise Exception(result.stderr)
-        except Exception as e:
-            logger.error(f"Failed to create issue: {e}")
-            return TaskResult(
-                success=False,
-                data=None,
-                error=str(e),
-                duration_ms=0,
-                timestamp=datetime.now(timezone.utc).isoformat()
-            )
+                stdout, stderr = await asyncio.wait_for(self._communicate(process, on_line, input), timeout)
+            except asyncio.TimeoutError:
+                self.counters['timeouts'] += 1
+                raise subprocess.TimeoutExpired(argv, timeout)
+            finally:
+                self.active -= 1
+                if process is not None and process.returncode is None:
+                    # Timed out or cancelled: never leave the child running
+                    self.counters['killed'] += 1
+                    process.kill()
+                    await process.wait()
+                durations = self.durations_ms.setdefault(name, deque(maxlen=self.window))
+                durations.append((time.perf_counter() - start_time) * 1000)
+        
+        if process.returncode != 0:
+            self.counters['failures'] += 1
+        return subprocess.CompletedProcess(argv, process.returncode, stdout, stderr)
     
-    async def list_issues(self, state: str = 'open') -> List[Dict[str, Any]]:
-        """List GitHub issues"""
+    async def _communicate(self, process: asyncio.subprocess.Process,
+                           on_line: Optional[Callable[[str], None]],
+                           input: Optional[bytes] = None) -> tuple:
+        """Read stdout in chunks (streaming complete lines) while collecting stderr"""
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        # Written concurrently so a child that answers before reading all input cannot deadlock
+        stdin_task = asyncio.ensure_future(self._feed(process, input)) if input is not None else None
         try:
-            result = subprocess.run(
-                ['gh', 'issue', 'list', '--state', state, '--json', 'number,title,state,labels'],
-                capture_output=True, text=True, check=True
-            )
-            return json.loads(result.stdout)
-        except Exception as e:
-            logger.error(f"Failed to list issues: {e}")
-            return []
+            chunks: List[bytes] = []
+            partial: List[bytes] = []
+            while True:
+                chunk = await process.stdout.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if on_line is None:
+                    continue
+                if b'\n' not in chunk:
+                    partial.append(chunk)
+                    continue
+                lines = chunk.split(b'\n')
+                lines[0] = b''.join(partial) + lines[0]
+                partial = [lines.pop()]
+                for line in lines:
+                    on_line(line.decode(errors='replace'))
+            if on_line is not None and any(partial):
+                on_line(b''.join(partial).decode(errors='replace'))
+            stderr = await stderr_task
+            if stdin_task is not None:
+                await stdin_task
+            await process.wait()
+        finally:
+            stderr_task.cancel()
+            if stdin_task is not None:
+                stdin_task.cancel()
+        return b''.join(chunks).decode(errors='replace'), stderr.decode(errors='replace')
+    
+    @staticmethod
+    async def _feed(process: asyncio.subprocess.Process, data: bytes) -> None:
+        try:
+            process.stdin.write(data)
+            await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the child exited without reading everything
+        finally:
+            process.stdin.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            'active': self.active,
+            'max_concurrency': self.max_concurrency,
+            'by_command': {
+                name: {
+                    'count': len(durations),
+                    'average_ms': sum(durations) / len(durations),
+                    'max_ms': max(durations)
+                }
+                for name, durations in self.durations_ms.items() if durations
+            }
+        }
+
+# Used when no runner is passed in (e.g. standalone modules)
+DEFAULT_PROCESS_RUNNER = ProcessRunner()
+
+async def run_external(argv: List[str], timeout_s: float,
+                       runner: Optional[ProcessRunner] = None) -> subprocess.CompletedProcess:
+    """
+    Run a command through the process runner; raise ExternalCallError on failure.
+    WHY: One funnel for gh calls gives retries a uniform failure signal.
+    """
+    timeout = clamp_timeout(timeout_s)
+    if timeout <= 0:
+        raise ExternalCallError(f"{argv[0]} not started - command deadline passed")
+    try:
+        result = await (runner or DEFAULT_PROCESS_RUNNER).run(argv, timeout_s=timeout)
+    except subprocess.TimeoutExpired:
+        raise ExternalCallError(f"{argv[0]} timed out after {timeout:.1f}s",
+                                transient=timeout == timeout_s)
+    
+    if result.returncode != 0:
+        stderr = result.stderr.strip()
+        raise ExternalCallError(
+            stderr or f"{argv[0]} exited with {result.returncode}",
+            transient=bool(ExternalCallError.TRANSIENT.search(stderr))
+        )
+    return result
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter"""
+    max_retries: int = 3
+    base_delay_s: float = 0.2
+    max_delay_s: float = 2.0
+    
+    def delay(self, attempt: int) -> float:
+        # Full jitter spreads retries from many callers instead of synchronising them
+        return random.uniform(0, min(self.max_delay_s, self.base_delay_s * (2 ** attempt)))
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive failures; after
+    `reset_timeout_s` one trial call is let through (half-open), and its
+    outcome closes or re-opens the breaker.
+    WHY: A hung or flapping dependency should cost one timeout, not one per call.
+    """
+    
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout_s: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.clock = clock
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.opens = 0
+        self._trial_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if self.clock() - self.opened_at >= self.reset_timeout_s:
+            return self.HALF_OPEN
+        return self.OPEN
+    
+    def allow(self) -> bool:
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+    
+    def retry_in(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout_s - (self.clock() - self.opened_at))
+    
+    def release_trial(self) -> None:
+        """The trial ended without an outcome (cancelled); let the next call try"""
+        self._trial_in_flight = False
+    
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        trial_failed = self._trial_in_flight
+        self._trial_in_flight = False
+        if trial_failed or (self.opened_at is None and self.consecutive_failures >= self.failure_threshold):
+            self.opened_at = self.clock()
+            self.opens += 1
+
+class TokenBucket:
+    """
+    `rate_per_s` sustained with bursts up to `capacity`; pause() stops it.
+    WHY: Spacing writes client-side keeps bulk jobs under GitHub's secondary
+    (abuse) limits instead of finding them through 403s.
+    """
+    
+    def __init__(self, rate_per_s: float, capacity: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
+        self.rate_per_s = rate_per_s
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = capacity
+        self.updated_at = clock()
+        self.paused_until = 0.0
+    
+    async def acquire(self) -> None:
+        while True:
+            now = self.clock()
+            if now < self.paused_until:
+                await self.sleep(self.paused_until - now)
+                continue
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_s)
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await self.sleep((1 - self.tokens) / self.rate_per_s)
+    
+    def pause(self, seconds: float) -> None:
+        """Hand out nothing for `seconds`, then restart from an empty bucket"""
+        self.paused_until = max(self.paused_until, self.clock() + seconds)
+        self.tokens = 0.0
+        self.updated_at = self.paused_until
+
+class ResilienceLayer:
+    """
+    Retry transient failures and fail fast on unhealthy endpoints.
+    WHY: During a GitHub outage every call should return quickly with an
+    error instead of stacking timeouts; the per-call budget caps retries.
+    """
+    
+    def __init__(self, context: AgentContext, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+                 runner: Optional[ProcessRunner] = None):
+        config = context.config
+        self.context = context
+        self.runner = runner or ProcessRunner(config.get('process_concurrency', 4))
+        self.policy = RetryPolicy(
+            max_retries=config.get('max_retries', 3),
+            base_delay_s=config.get('retry_base_delay_ms', 200.0) / 1000,
+            max_delay_s=config.get('retry_max_delay_ms', 2000.0) / 1000
+        )
+        self.timeout_s = config.get('external_call_timeout_s', 10.0)
+        self.budget_s = config.get('external_call_budget_s', 30.0)
+        self.failure_threshold = config.get('breaker_failure_threshold', 5)
+        self.reset_timeout_s = config.get('breaker_reset_s', 30.0)
+        self.clock = clock
+        self.sleep = sleep
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+    
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        if endpoint not in self.breakers:
+            self.breakers[endpoint] = CircuitBreaker(self.failure_threshold, self.reset_timeout_s, self.clock)
+            self.counters[endpoint] = {'calls': 0, 'retries': 0, 'failures': 0, 'short_circuits': 0}
+        return self.breakers[endpoint]
+    
+    def _count(self, endpoint: str, counter: str) -> None:
+        self.counters[endpoint][counter] += 1
+        metric = f"external_{counter}_total"
+        self.context.metrics[metric] = self.context.metrics.get(metric, 0) + 1
+    
+    @staticmethod
+    def is_transient(error: Exception) -> bool:
+        if isinstance(error, ExternalCallError):
+            return error.transient
+        return isinstance(error, (asyncio.TimeoutError, ConnectionError))
+    
+    async def call(self, endpoint: str, func: Callable[[], Awaitable[Any]], retry: bool = True) -> Any:
+        """
+        Call `func` through `endpoint`'s breaker, retrying transient failures.
+        Pass retry=False for non-idempotent calls (creating issues, posting comments).
+        """
+        breaker = self.breaker(endpoint)
+        if not breaker.allow():
+            self._count(endpoint, 'short_circuits')
+            raise CircuitOpenError(f"Circuit open for {endpoint} - retry in {breaker.retry_in():.0f}s")
+        
+        self._count(endpoint, 'calls')
+        deadline = self.clock() + self.budget_s
+        attempt = 0
+        while True:
+            try:
+                result = await func()
+            except asyncio.CancelledError:
+                # A cancelled call says nothing about the endpoint, but must not
+                # hold the half-open trial slot forever
+                breaker.release_trial()
+                raise
+            except Exception as e:
+                if not self.is_transient(e):
+                    breaker.record_success()  # the endpoint answered; the request was bad
+                    raise
+                breaker.record_failure()
+                delay = self.policy.delay(attempt)
+                remaining = remaining_s()
+                if (not retry or attempt >= self.policy.max_retries
+                        or breaker.state != CircuitBreaker.CLOSED
+                        or self.clock() + delay > deadline
+                        or (remaining is not None and delay >= remaining)):
+                    self._count(endpoint, 'failures')
+                    raise
+                attempt += 1
+                self._count(endpoint, 'retries')
+                logger.debug(f"Retrying {endpoint} in {delay:.2f}s (attempt {attempt}): {e}")
+                await self.sleep(delay)
+            else:
+                breaker.record_success()
+                return result
+    
+    async def run(self, endpoint: str, argv: List[str], retry: bool = True) -> subprocess.CompletedProcess:
+        """run_external() through call()"""
+        return await self.call(endpoint, lambda: run_external(argv, self.timeout_s, self.runner), retry=retry)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            endpoint: {
+                **self.counters[endpoint],
+                'state': breaker.state,
+                'consecutive_failures': breaker.consecutive_failures,
+                'opens': breaker.opens
+            }
+            for endpoint, breaker in self.breakers.items()
+        }
+
+# ============================================================================
+# GITHUB TRANSPORTS - see utils/github_transport.py, github_cache.py, github_batch.py
+# ============================================================================
+
+def make_github_transport(config: Dict[str, Any], probes: ProbeCache,
+                          runner: Optional[ProcessRunner] = None) -> GitHubTransport:
+    """github_transport: 'gh' (default) or 'http' (token from GH_TOKEN / GITHUB_TOKEN)"""
+    timeout_s = config.get('external_call_timeout_s', 10.0)
+    if config.get('github_transport', 'gh') == 'http':
+        return HttpTransport(
+            config.get('github_api_url', 'https://api.github.com'),
+            token=os.environ.get('GH_TOKEN') or os.environ.get('GITHUB_TOKEN'),
+            pool_size=config.get('github_pool_size', 4),
+            timeout_s=timeout_s
+        )
+    return GhCliTransport(probes, runner or DEFAULT_PROCESS_RUNNER, timeout_s)
 
 # ============================================================================
 # USER JOURNEY: Documentation Management with Auto-Update
@@ -337,8 +1130,8 @@ Session ID: {self.context.session_id}
 
 ## Current Status
 - Agent Status: {self.context.status.name}
-- Tasks Completed: {len(self.context.tasks_completed)}
-- Active Errors: {len(self.context.errors)}
+- Tasks Completed: {self.context.tasks_completed.total}
+- Active Errors: {self.context.errors.total}
 
 ## Performance Metrics
 """
@@ -387,53 +1180,276 @@ Session ID: {self.context.session_id}
 # GITHUB INTEGRATION: Issue and PR Management
 # ============================================================================
 
-import subprocess
-import shlex
-
 class GitHubIntegration:
     """
     GitHub API integration for issue and PR management.
     WHY: Automate GitHub workflows directly from agent.
+    
+    The one client for GitHub: every call goes through the resilience layer
+    to a pluggable transport (gh CLI or pooled HTTPS, see github_transport).
     """
     
-    def __init__(self, context: AgentContext):
+    def __init__(self, context: AgentContext, probes: Optional[ProbeCache] = None,
+                 resilience: Optional[ResilienceLayer] = None,
+                 transport: Optional[GitHubTransport] = None):
         self.context = context
-        self.gh_available = self._check_gh_cli()
+        self.probes = probes or ProbeCache(
+            Path(context.config.get('project_root', '.')),
+            context.config.get('cache_ttl_seconds', 300)
+        )
+        self.resilience = resilience or ResilienceLayer(context)
+        self.transport = transport or make_github_transport(context.config, self.probes, self.resilience.runner)
+        self._issue_ids: Dict[int, str] = {}  # issue number -> GraphQL node id
     
-    def _check_gh_cli(self) -> bool:
-        """Check if GitHub CLI is available and authenticated"""
-        try:
-            result = subprocess.run(
-                ['gh', 'auth', 'status'],
-                capture_output=True,
-                text=True,
-                timeout=5
+    @cached_property
+    def cache(self) -> Optional[ResponseCache]:
+        """Read cache (None when github_cache is off)"""
+        config = self.context.config
+        if not config.get('github_cache', True):
+            return None
+        path = config.get('github_cache_path', '.agent_boot/github_cache.json')
+        ttl_s = config.get('github_cache_ttl_s')
+        return ResponseCache(
+            Path(config.get('project_root', '.')) / path if path else None,
+            ttl_s=config.get('cache_ttl_seconds', 300) if ttl_s is None else ttl_s,
+            stale_s=config.get('github_stale_s', 600.0)
+        )
+    
+    @cached_property
+    def batcher(self) -> GraphQLBatcher:
+        return GraphQLBatcher(
+            self._send_graphql,
+            window_s=self.context.config.get('graphql_batch_window_ms', 5.0) / 1000,
+            max_batch=self.context.config.get('graphql_batch_max', 25)
+        )
+    
+    async def prepare(self) -> None:
+        """
+        Resolve the repository and availability with async probes, once per client.
+        WHY: repo and gh_available fall back to blocking probes for sync callers;
+        resolved here first, they never stall the event loop (e.g. in the daemon).
+        """
+        if 'repo' not in self.__dict__:
+            configured = self.context.config.get('github_repo')
+            url = None if configured else (await self.probes.ensure(('remote_url',)))['remote_url']
+            self.repo = self._parse_repo(configured, url)
+        if 'gh_available' not in self.__dict__:
+            self.gh_available = self._checked_availability(await self.transport.probe())
+    
+    @cached_property
+    def gh_available(self) -> bool:
+        """Probed on first use, not at construction (see prepare())"""
+        return self._checked_availability(self.transport.available())
+    
+    def _checked_availability(self, available: bool) -> bool:
+        if not available:
+            logger.warning(f"GitHub not available via the {self.transport.name} transport")
+        return available
+    
+    def _unavailable(self) -> TaskResult:
+        return TaskResult(
+            success=False,
+            data=None,
+            error=f"GitHub not available via the {self.transport.name} transport",
+            duration_ms=0,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+    
+    @cached_property
+    def repo(self) -> Dict[str, str]:
+        """owner/repo from github_repo, else parsed from the origin remote URL (see prepare())"""
+        configured = self.context.config.get('github_repo')
+        url = None if configured else self.probes.ensure_sync(('remote_url',))['remote_url']
+        return self._parse_repo(configured, url)
+    
+    @staticmethod
+    def _parse_repo(configured: Optional[str], url: Optional[str]) -> Dict[str, str]:
+        if configured:
+            owner, _, name = configured.partition('/')
+            return {'owner': owner, 'repo': name}
+        match = re.search(r'github\.com[:/]([^/]+)/([^.]+)', url or '')
+        if match:
+            return {'owner': match.group(1), 'repo': match.group(2).replace('.git', '')}
+        return {'owner': '', 'repo': ''}
+    
+    def repo_path(self, suffix: str) -> str:
+        repo = self.repo
+        if not repo['owner']:
+            raise ValueError("GitHub repository unknown - set github_repo or add a github.com origin")
+        return f"repos/{repo['owner']}/{repo['repo']}/{suffix}"
+    
+    async def api(self, endpoint: str, method: str, path: str, body: Any = None,
+                  headers: Optional[Dict[str, str]] = None,
+                  retry: Optional[bool] = None, revalidate: bool = False) -> GitHubResponse:
+        """
+        One request through the resilience layer as endpoint 'github <endpoint>'.
+        Only reads retry by default - a timed-out write may still have happened.
+        GETs are served through the cache and revalidated with If-None-Match;
+        revalidate=True skips the TTL and always asks (a 304 is still cheap).
+        """
+        def call(request_headers: Optional[Dict[str, str]]) -> Awaitable[GitHubResponse]:
+            return self.resilience.call(
+                f"github {endpoint}",
+                lambda: self.transport.request(method, path, body, request_headers),
+                retry=method == 'GET' if retry is None else retry
             )
-            return result.returncode == 0
-        except (subprocess.SubprocessError, FileNotFoundError):
-            logger.warning("GitHub CLI not available or not authenticated")
-            return False
+        
+        if method != 'GET' or self.cache is None or headers:
+            response = await call(headers)
+            if self.cache is not None and method != 'GET' and path != 'graphql':
+                self._expire_reads([self._rest_resource(path)])  # a write: those reads revalidate
+            return response
+        
+        async def fetch(previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            etag = previous and previous.get('etag')
+            response = await call({'If-None-Match': etag} if etag else None)
+            if response.status == 304:
+                return previous  # unchanged - and not counted against the rate limit
+            return {'value': {'status': response.status, 'raw': response.raw,
+                              'headers': {'link': response.headers.get('link', '')}},
+                    'etag': response.headers.get('etag')}
+        
+        value = await self.cache.get(f"GET {path}", fetch, max_age_s=0 if revalidate else None)
+        return GitHubResponse(value['status'], value['headers'], value['raw'])
     
-    async def create_issue_from_epic(self, epic: 'Epic') -> TaskResult:
+    async def _send_graphql(self, document: str, variables: Dict[str, Any], mutation: bool) -> Dict[str, Any]:
+        # Queries are POSTs too, so say explicitly that they are safe to retry
+        response = await self.api('graphql.mutation' if mutation else 'graphql.query', 'POST', 'graphql',
+                                  {'query': document, 'variables': variables}, retry=not mutation)
+        if mutation and self.cache is not None:
+            self._expire_reads([self.GRAPHQL_RESOURCES.get(name) for name in re.findall(r'(\w+)\(input:', document)])
+        return response.data or {}
+    
+    # GraphQL root fields and mutations -> the REST resource they read or write
+    GRAPHQL_RESOURCES = {
+        'issue': 'issues', 'issues': 'issues', 'addComment': 'issues', 'updateIssueComment': 'issues',
+        'pullRequest': 'pulls', 'pullRequests': 'pulls'
+    }
+    
+    @staticmethod
+    def _rest_resource(path: str) -> Optional[str]:
+        """'repos/o/r/issues/5/comments' -> 'issues' (None outside a repository)"""
+        parts = path.partition('?')[0].split('/')
+        return parts[3] if len(parts) > 3 and parts[0] == 'repos' else None
+    
+    def _expire_reads(self, resources: List[Optional[str]]) -> None:
         """
-        Create GitHub issue from epic.
-        WHY: Sync project management with GitHub.
+        Expire the cached REST and GraphQL reads of the written resources.
+        WHY: Expiring everything on each write would make a bulk run discard
+        every cached read; an unknown resource still expires them all.
+        """
+        if not resources or None in resources:
+            self.cache.expire()
+            return
+        prefixes = []
+        for resource in sorted(set(resources)):
+            prefixes += [f"GET {self.repo_path(resource)}", f"graphql {resource} "]
+        self.cache.expire(*prefixes)
+    
+    async def _repository_query(self, selection: str, max_age_s: Optional[float] = None,
+                                **variables: tuple) -> Dict[str, Any]:
+        """A batched read of `selection` on this repository; max_age_s overrides the cache TTL"""
+        repo = self.repo
+        if not repo['owner']:
+            raise ValueError("GitHub repository unknown - set github_repo or add a github.com origin")
+        field = f"repository(owner: $owner, name: $name) {{ {selection} }}"
+        field_variables = {'owner': ('String!', repo['owner']), 'name': ('String!', repo['repo']), **variables}
+        if self.cache is None:
+            return await self.batcher.query(field, field_variables)
+        
+        # GraphQL has no ETags: within the TTL serve cached, then refetch (still batched)
+        async def fetch(previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            return {'value': await self.batcher.query(field, field_variables)}
+        
+        root = re.match(r'\w+', selection).group()
+        key = f"graphql {self.GRAPHQL_RESOURCES.get(root, root)} {json.dumps([field, field_variables])}"
+        return await self.cache.get(key, fetch, max_age_s=max_age_s)
+    
+    @staticmethod
+    def _issue(data: Dict[str, Any]) -> Dict[str, Any]:
+        """REST issue -> the shape callers use (upper-case state, label names)"""
+        return {
+            'number': data['number'],
+            'title': data['title'],
+            'state': data['state'].upper(),
+            'body': data.get('body') or '',
+            'labels': [label['name'] for label in data.get('labels', [])],
+            'url': data.get('html_url'),
+            'updated_at': data.get('updated_at')
+        }
+    
+    async def iter_issues(self, since: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Issues (not PRs) in any state updated at or after `since`, least recently
+        updated first, page by page. Pages are always revalidated, so an
+        unchanged page costs a 304.
+        """
+        from urllib.parse import urlencode
+        params = {'state': 'all', 'sort': 'updated', 'direction': 'asc', 'per_page': 100}
+        if since:
+            params['since'] = since
+        query = urlencode(params)
+        while query:
+            response = await self.api('issues.list', 'GET', self.repo_path(f"issues?{query}"), revalidate=True)
+            for issue in response.iter_items():
+                if 'pull_request' not in issue:
+                    yield self._issue(issue)
+            query = response.next_page_query()
+    
+    async def list_issues(self, state: str = 'open') -> List[Dict[str, Any]]:
+        """Issues (not PRs) in `state`: 'open', 'closed' or 'all'"""
+        response = await self.api('issues.list', 'GET', self.repo_path(f"issues?state={state}&per_page=100"))
+        return [self._issue(issue) for issue in response.data or [] if 'pull_request' not in issue]
+    
+    async def create_issue(self, title: str, body: str, labels: List[str] = None) -> TaskResult:
+        """
+        Create a GitHub issue.
+        WHY: Direct integration with development workflow.
         """
         if not self.gh_available:
+            return self._unavailable()
+        
+        try:
+            issue = await self.open_issue(title, body, labels)
+            logger.info(f"✅ Created GitHub issue: {issue['html_url']}")
+            return TaskResult(
+                success=True,
+                data={'issue_number': str(issue['number']), 'url': issue['html_url']},
+                error=None,
+                duration_ms=0,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            )
+        except Exception as e:
+            logger.error(f"Failed to create GitHub issue: {e}")
             return TaskResult(
                 success=False,
                 data=None,
-                error="GitHub CLI not available",
+                error=str(e),
                 duration_ms=0,
                 timestamp=datetime.now(timezone.utc).isoformat()
             )
+    
+    async def open_issue(self, title: str, body: str, labels: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Create an issue and return it; raises on failure (never retried)"""
+        response = await self.api('issues.create', 'POST', self.repo_path('issues'),
+                                  {'title': title, 'body': body, 'labels': labels or []})
+        return response.data
+    
+    async def create_issue_from_epic(self, epic: 'Epic') -> TaskResult:
+        """
+        Create GitHub issue from epic.
+        WHY: Sync project management with GitHub.
+        """
+        return await self.create_issue(*self.epic_issue(epic))
+    
+    @staticmethod
+    def epic_issue(epic: 'Epic') -> tuple:
+        """(title, body, labels) of the issue tracking an epic"""
+        # Map priority to GitHub labels
+        priority_label = f"priority:p{epic.priority.value - 1}"
         
-        try:
-            # Map priority to GitHub labels
-            priority_label = f"priority:p{epic.priority.value - 1}"
-            
-            # Create issue body
-            body = f"""{epic.description}
+        # Create issue body
+        body = f"""{epic.description}
 
 ## Acceptance Criteria
 - [ ] Implementation complete
@@ -445,127 +1461,169 @@ class GitHubIntegration:
 - **Completion:** {epic.completion_percentage}%
 - **Created:** {epic.created_at}
 """
-            
-            # Execute gh command
-            cmd = [
-                'gh', 'issue', 'create',
-                '--title', f"📋 {epic.title}",
-                '--body', body,
-                '--label', priority_label
-            ]
-            
-            if epic.tags:
-                for tag in epic.tags:
-                    cmd.extend(['--label', tag])
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
+        return f"📋 {epic.title}", body, [priority_label, *epic.tags]
+    
+    async def issue_states(self) -> List[Dict[str, Any]]:
+        """Number, title and state of every issue (the first page is batched with other reads)"""
+        issues, cursor = [], None
+        while True:
+            data = await self._repository_query(
+                "issues(first: 100, after: $after, states: [OPEN, CLOSED]) { "
+                "pageInfo { hasNextPage endCursor } nodes { id number title state } }",
+                after=('String', cursor)
             )
-            
-            if result.returncode == 0:
-                # Extract issue number from output
-                issue_url = result.stdout.strip()
-                issue_number = issue_url.split('/')[-1] if issue_url else None
-                
-                return TaskResult(
-                    success=True,
-                    data={'issue_number': issue_number, 'url': issue_url},
-                    error=None,
-                    duration_ms=0,
-                    timestamp=datetime.now(timezone.utc).isoformat()
-                )
-            else:
-                return TaskResult(
-                    success=False,
-                    data=None,
-                    error=result.stderr,
-                    duration_ms=0,
-                    timestamp=datetime.now(timezone.utc).isoformat()
-                )
-                
-        except Exception as e:
-            logger.error(f"Failed to create GitHub issue: {e}")
-            return TaskResult(
-                success=False,
-                data=None,
-                error=str(e),
-                duration_ms=0,
-                timestamp=datetime.now(timezone.utc).isoformat()
+            issues.extend(data['issues']['nodes'])
+            if not data['issues']['pageInfo']['hasNextPage']:
+                break
+            cursor = data['issues']['pageInfo']['endCursor']
+        for issue in issues:
+            self._issue_ids[issue['number']] = issue['id']
+        return [{'number': i['number'], 'title': i['title'], 'state': i['state']} for i in issues]
+    
+    async def issue_counts(self) -> Dict[str, int]:
+        """Open and closed issue totals, without fetching the issues (one batched request)"""
+        open_issues, closed_issues = await asyncio.gather(
+            self._repository_query("issues(states: OPEN) { totalCount }"),
+            self._repository_query("issues(states: CLOSED) { totalCount }")
+        )
+        return {'open': open_issues['issues']['totalCount'], 'closed': closed_issues['issues']['totalCount']}
+    
+    async def issue_comments(self, issue_number: Union[int, str]) -> List[Dict[str, Any]]:
+        """Ids and bodies of an issue's latest comments (batched with other reads)"""
+        data = await self._repository_query(
+            "issue(number: $number) { id comments(last: 100) { nodes { id databaseId body url } } }",
+            number=('Int!', int(issue_number))
+        )
+        self._issue_ids[int(issue_number)] = data['issue']['id']
+        return [
+            {'id': comment['databaseId'], 'node_id': comment['id'], 'body': comment['body'], 'url': comment['url']}
+            for comment in data['issue']['comments']['nodes']
+        ]
+    
+    async def issue_node_id(self, issue_number: Union[int, str]) -> str:
+        """GraphQL id for mutations; known without a request after issue_states()"""
+        number = int(issue_number)
+        if number not in self._issue_ids:
+            data = await self._repository_query("issue(number: $number) { id }", number=('Int!', number))
+            self._issue_ids[number] = data['issue']['id']
+        return self._issue_ids[number]
+    
+    async def comment_on_issue(self, issue_number: Union[int, str], body: str) -> Dict[str, Any]:
+        """Post a comment; concurrent posts share one aliased mutation"""
+        subject_id = await self.issue_node_id(issue_number)
+        data = await self.batcher.mutate(
+            "addComment(input: {subjectId: $subject, body: $body}) { commentEdge { node { id databaseId url } } }",
+            {'subject': ('ID!', subject_id), 'body': ('String!', body)}
+        )
+        comment = data['commentEdge']['node']
+        return {'id': comment['databaseId'], 'node_id': comment['id'], 'html_url': comment['url']}
+    
+    async def edit_comment(self, node_id: str, body: str) -> Dict[str, Any]:
+        """Replace a comment's body; concurrent edits share one aliased mutation"""
+        data = await self.batcher.mutate(
+            "updateIssueComment(input: {id: $id, body: $body}) { issueComment { id databaseId url } }",
+            {'id': ('ID!', node_id), 'body': ('String!', body)}
+        )
+        comment = data['issueComment']
+        return {'id': comment['databaseId'], 'node_id': comment['id'], 'html_url': comment['url']}
+    
+    # StatusContext states mapped onto CheckRun conclusions
+    STATUS_CONCLUSIONS = {'SUCCESS': 'SUCCESS', 'FAILURE': 'FAILURE', 'ERROR': 'FAILURE'}
+    
+    async def list_pull_requests(self, max_age_s: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Open PRs with a gh-style statusCheckRollup, checks included, 100 per query"""
+        nodes, cursor = [], None
+        while True:
+            data = await self._repository_query(
+                "pullRequests(states: OPEN, first: 100, after: $after) { "
+                "pageInfo { hasNextPage endCursor } nodes { number title state "
+                "commits(last: 1) { nodes { commit { statusCheckRollup { contexts(first: 100) { nodes { "
+                "... on CheckRun { name conclusion } ... on StatusContext { context state } } } } } } } } }",
+                max_age_s=max_age_s, after=('String', cursor)
             )
+            nodes.extend(data['pullRequests']['nodes'])
+            if not data['pullRequests']['pageInfo']['hasNextPage']:
+                break
+            cursor = data['pullRequests']['pageInfo']['endCursor']
+        pulls = []
+        for pull in nodes:
+            checks = []
+            for commit in pull['commits']['nodes']:
+                for context in ((commit['commit'].get('statusCheckRollup') or {}).get('contexts') or {}).get('nodes', []):
+                    if 'context' in context:
+                        checks.append({'name': context['context'],
+                                       'conclusion': self.STATUS_CONCLUSIONS.get(context.get('state'))})
+                    else:
+                        checks.append({'name': context.get('name'), 'conclusion': context.get('conclusion')})
+            pulls.append({'number': pull['number'], 'title': pull['title'], 'state': pull['state'],
+                          'statusCheckRollup': checks})
+        return pulls
+    
+    async def pull_request_states(self, numbers: List[int]) -> List[str]:
+        """
+        OPEN / CLOSED / MERGED for each PR, all in one batched request.
+        A PR that no longer resolves counts as CLOSED; any other failure raises,
+        since guessing would report a merged PR as closed.
+        """
+        async def state(number: int) -> str:
+            try:
+                data = await self._repository_query("pullRequest(number: $number) { state }",
+                                                    max_age_s=0, number=('Int!', number))
+            except NotFoundError:
+                return 'CLOSED'
+            return data['pullRequest']['state']
+        
+        return list(await asyncio.gather(*(state(number) for number in numbers)))
     
+    @staticmethod
+    def rollup_status(checks: List[Dict[str, Any]]) -> str:
+        """passing / failing / pending for a PR's checks (unknown without any)"""
+        if not checks:
+            return 'unknown'
+        if all(check.get('conclusion') == 'SUCCESS' for check in checks):
+            return 'passing'
+        if any(check.get('conclusion') == 'FAILURE' for check in checks):
+            return 'failing'
+        return 'pending'
+    
+    @single_flight(ttl_s='pr_status_cache_ttl_s')
     async def check_pr_status(self) -> TaskResult:
         """
         Check status of open PRs.
         WHY: Monitor PR health and CI status.
         """
         if not self.gh_available:
-            return TaskResult(
-                success=False,
-                data=None,
-                error="GitHub CLI not available",
-                duration_ms=0,
-                timestamp=datetime.now(timezone.utc).isoformat()
-            )
+            return self._unavailable()
         
         try:
-            # Get PR list
-            result = subprocess.run(
-                ['gh', 'pr', 'list', '--json', 'number,title,state,statusCheckRollup'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            prs = await self.list_pull_requests()
             
-            if result.returncode == 0:
-                prs = json.loads(result.stdout) if result.stdout else []
-                
-                pr_summary = {
-                    'total': len(prs),
-                    'passing': 0,
-                    'failing': 0,
-                    'pending': 0,
-                    'details': []
-                }
-                
-                for pr in prs:
-                    status = 'unknown'
-                    checks = pr.get('statusCheckRollup', [])
-                    
-                    if checks:
-                        if all(check.get('conclusion') == 'SUCCESS' for check in checks):
-                            status = 'passing'
-                            pr_summary['passing'] += 1
-                        elif any(check.get('conclusion') == 'FAILURE' for check in checks):
-                            status = 'failing'
-                            pr_summary['failing'] += 1
-                        else:
-                            status = 'pending'
-                            pr_summary['pending'] += 1
-                    
-                    pr_summary['details'].append({
-                        'number': pr['number'],
-                        'title': pr['title'],
-                        'status': status
-                    })
+            pr_summary = {
+                'total': len(prs),
+                'passing': 0,
+                'failing': 0,
+                'pending': 0,
+                'details': []
+            }
+            
+            for pr in prs:
+                status = self.rollup_status(pr.get('statusCheckRollup', []))
+                if status != 'unknown':
+                    pr_summary[status] += 1
                 
-                return TaskResult(
-                    success=True,
-                    data=pr_summary,
-                    error=None,
-                    duration_ms=0,
-                    timestamp=datetime.now(timezone.utc).isoformat()
-                )
-            else:
-                return TaskResult(
-                    success=False,
-                    data=None,
-                    error=result.stderr,
-                    duration_ms=0,
-                    timestamp=datetime.now(timezone.utc).isoformat()
-                )
+                pr_summary['details'].append({
+                    'number': pr['number'],
+                    'title': pr['title'],
+                    'status': status
+                })
+            
+            return TaskResult(
+                success=True,
+                data=pr_summary,
+                error=None,
+                duration_ms=0,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            )
                 
         except Exception as e:
             logger.error(f"Failed to check PR status: {e}")
@@ -577,6 +1635,292 @@ class GitHubIntegration:
                 timestamp=datetime.now(timezone.utc).isoformat()
             )
 
+class PRWatcher:
+    """
+    Poll open PRs on an adaptive interval and report only what changed.
+    WHY: Re-fetching and re-processing the full PR list on every tick is
+    wasteful; dashboards want "check X on #12 flipped to FAILURE", not a snapshot.
+    
+    Polls every `min_interval_s` while something changed last time or checks
+    are still running, doubling up to `max_interval_s` while all is quiet.
+    Snapshots go through the client's cache, so a poll right after another
+    caller's fetch costs no request. The first poll sets the baseline.
+    
+    Events are dicts: pr_opened, pr_merged, pr_closed, pr_status_changed and
+    check_changed (with check, previous and current). Consume them with
+    `async for event in watcher.events()`, or start() with a sink - e.g.
+    blackboard_sink() to publish them on the engines' Blackboard.
+    """
+    
+    def __init__(self, github: 'GitHubIntegration', min_interval_s: float = 5.0,
+                 max_interval_s: float = 120.0, sink: Optional[Callable[[Dict[str, Any]], Any]] = None):
+        self.github = github
+        self.min_interval_s = min_interval_s
+        self.max_interval_s = max(min_interval_s, max_interval_s)
+        self.interval_s = min_interval_s
+        self.sink = sink
+        self.snapshot: Optional[Dict[int, Dict[str, Any]]] = None
+        self.polls = 0
+        self.events_total = 0
+        self.errors = 0
+        self._task: Optional[asyncio.Task] = None
+    
+    @staticmethod
+    def blackboard_sink(board: Any, key: str = 'github.pr_events', keep: int = 100) -> Callable[[Dict[str, Any]], None]:
+        """
+        A sink that publishes events on a Blackboard (engines/blackboard.py):
+        `key` holds the latest `keep` events and f"{key}.last" the newest.
+        """
+        def publish(event: Dict[str, Any]) -> None:
+            board.set(key, [*board.get(key, []), event][-keep:])
+            board.set(f"{key}.last", event)
+        return publish
+    
+    @staticmethod
+    def take_snapshot(pulls: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """number -> title, rollup status and per-check conclusions"""
+        return {
+            pr['number']: {
+                'title': pr['title'],
+                'status': GitHubIntegration.rollup_status(pr['statusCheckRollup']),
+                'checks': {check['name']: check.get('conclusion') for check in pr['statusCheckRollup']}
+            }
+            for pr in pulls
+        }
+    
+    @staticmethod
+    def diff(previous: Dict[int, Dict[str, Any]], current: Dict[int, Dict[str, Any]],
+             final_states: Optional[Dict[int, str]] = None) -> List[Dict[str, Any]]:
+        """Change events between two snapshots; final_states says how vanished PRs ended"""
+        at = datetime.now(timezone.utc).isoformat()
+        events = []
+        for number in sorted(previous.keys() - current.keys()):
+            merged = (final_states or {}).get(number) == 'MERGED'
+            events.append({'type': 'pr_merged' if merged else 'pr_closed', 'number': number,
+                           'title': previous[number]['title'], 'at': at})
+        for number, pr in sorted(current.items()):
+            before = previous.get(number)
+            if before is None:
+                events.append({'type': 'pr_opened', 'number': number, 'title': pr['title'],
+                               'status': pr['status'], 'at': at})
+                continue
+            for name in sorted(before['checks'].keys() | pr['checks'].keys()):
+                was, now = before['checks'].get(name), pr['checks'].get(name)
+                if was != now:
+                    events.append({'type': 'check_changed', 'number': number, 'title': pr['title'],
+                                   'check': name, 'previous': was, 'current': now, 'at': at})
+            if before['status'] != pr['status']:
+                events.append({'type': 'pr_status_changed', 'number': number, 'title': pr['title'],
+                               'previous': before['status'], 'current': pr['status'], 'at': at})
+        return events
+    
+    async def poll(self) -> List[Dict[str, Any]]:
+        """Fetch one snapshot, diff it against the last and adapt the interval"""
+        self.polls += 1
+        pulls = await self.github.list_pull_requests(max_age_s=self.min_interval_s)
+        current = self.take_snapshot(pulls)
+        previous = self.snapshot
+        if previous is None:
+            events = []
+        else:
+            # Raises on failure before the snapshot moves on, so the next poll retries the diff
+            gone = sorted(previous.keys() - current.keys())
+            final_states = dict(zip(gone, await self.github.pull_request_states(gone))) if gone else {}
+            events = self.diff(previous, current, final_states)
+        self.snapshot = current
+        
+        running = any(pr['status'] == 'pending' for pr in current.values())
+        self.interval_s = self.min_interval_s if events or running else min(self.interval_s * 2, self.max_interval_s)
+        self.events_total += len(events)
+        return events
+    
+    async def events(self) -> AsyncIterator[Dict[str, Any]]:
+        """Change events, forever; errors back off to the max interval"""
+        while True:
+            try:
+                for event in await self.poll():
+                    yield event
+            # Breaker trips, a missing gh (OSError) and malformed payloads must not end the watch
+            except (ExternalCallError, CircuitOpenError, OSError, ValueError, KeyError, TypeError) as e:
+                self.errors += 1
+                self.interval_s = self.max_interval_s
+                logger.warning(f"PR watch poll failed: {e}")
+            await asyncio.sleep(self.interval_s)
+    
+    def start(self) -> None:
+        """Feed events to the sink in the background until stop()"""
+        if self.sink is None:
+            raise ValueError("PRWatcher.start() needs a sink")
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._pump())
+    
+    async def _pump(self) -> None:
+        detach_deadline()  # outlives the command that started it
+        async for event in self.events():
+            try:
+                if asyncio.iscoroutine(outcome := self.sink(event)):
+                    await outcome
+            except Exception as e:
+                logger.warning(f"PR watch sink failed on {event['type']}: {e}")
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'polls': self.polls,
+            'events': self.events_total,
+            'errors': self.errors,
+            'interval_s': self.interval_s,
+            'watching': len(self.snapshot or {})
+        }
+
+@dataclass
+class IssueSpec:
+    """One issue to create in bulk; `key` identifies it in the journal"""
+    key: str
+    title: str
+    body: str = ''
+    labels: List[str] = field(default_factory=list)
+
+class BulkIssueCreator:
+    """
+    Create many issues with bounded concurrency and client-side rate limiting.
+    WHY: Serial creation of hundreds of issues takes hours, and unthrottled
+    creation trips GitHub's secondary (abuse) limits.
+    
+    Completed items are appended to a JSONL journal, so a rerun resumes
+    instead of duplicating. Items whose exact title already exists on GitHub
+    are skipped too (covers a crash between create and journal write). A
+    rate-limit answer pauses every worker for Retry-After and requeues the
+    item; other failures are reported, not retried - a failed create may
+    still have happened.
+    """
+    
+    MAX_ATTEMPTS = 5
+    DEFAULT_RATE_LIMIT_WAIT_S = 60.0  # GitHub: wait at least a minute without Retry-After
+    
+    def __init__(self, github: 'GitHubIntegration', journal_path: Optional[Path] = None,
+                 concurrency: int = 3, rate_per_min: float = 60.0, burst: float = 5.0,
+                 on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 bucket: Optional[TokenBucket] = None):
+        self.github = github
+        self.journal_path = journal_path
+        self.concurrency = max(1, concurrency)
+        self.bucket = bucket or TokenBucket(rate_per_min / 60, capacity=burst)
+        self.on_progress = on_progress
+        self.progress = {'total': 0, 'created': 0, 'skipped': 0, 'failed': 0, 'rate_limited': 0}
+        self.issues: Dict[str, Dict[str, Any]] = {}  # key -> journal entry
+        self.failures: Dict[str, str] = {}
+    
+    def load_journal(self) -> Dict[str, Dict[str, Any]]:
+        entries = {}
+        if self.journal_path is None or not self.journal_path.exists():
+            return entries
+        for line in self.journal_path.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line torn by a crash
+            entries[entry['key']] = entry
+        return entries
+    
+    def _complete(self, item: IssueSpec, issue_number: Any, url: str, journal: bool = True) -> None:
+        entry = {'key': item.key, 'title': item.title, 'issue_number': str(issue_number), 'url': url}
+        self.issues[item.key] = entry
+        if journal and self.journal_path is not None:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, 'a') as journal_file:
+                journal_file.write(json.dumps(entry) + '\n')
+    
+    async def run(self, items: List[IssueSpec], dedupe_existing: bool = True) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        journaled = self.load_journal()
+        existing = {}
+        if dedupe_existing:
+            async for issue in self.github.iter_issues():
+                existing.setdefault(issue['title'], issue)
+        
+        queue: Deque[tuple] = deque()
+        for item in items:
+            self.progress['total'] += 1
+            if item.key in journaled:
+                self.issues[item.key] = journaled[item.key]
+                self.progress['skipped'] += 1
+            elif item.title in existing:
+                self._complete(item, existing[item.title]['number'], existing[item.title]['url'])
+                self.progress['skipped'] += 1
+            else:
+                queue.append((item, 1))
+        self._report(start_time)
+        
+        await asyncio.gather(*(self._worker(queue, start_time) for _ in range(min(self.concurrency, len(queue)))))
+        return {
+            **self.progress,
+            'duration_s': round(time.perf_counter() - start_time, 3),
+            'issues': self.issues,
+            'failures': self.failures
+        }
+    
+    async def _worker(self, queue: Deque[tuple], start_time: float) -> None:
+        while queue:
+            item, attempt = queue.popleft()
+            await self.bucket.acquire()
+            try:
+                issue = await self.github.open_issue(item.title, item.body, item.labels)
+            except (ExternalCallError, CircuitOpenError) as e:
+                wait_s = self._rate_limit_wait(e)
+                if wait_s is not None and attempt < self.MAX_ATTEMPTS:
+                    self.progress['rate_limited'] += 1
+                    logger.warning(f"GitHub rate limit - pausing issue creation for {wait_s:.0f}s")
+                    self.bucket.pause(wait_s)
+                    queue.append((item, attempt + 1))
+                    continue
+                self._fail(item, e)
+            except Exception as e:
+                self._fail(item, e)
+            else:
+                self._complete(item, issue['number'], issue['html_url'])
+                self.progress['created'] += 1
+                self.github.context.metrics['bulk_issues_created_total'] = (
+                    self.github.context.metrics.get('bulk_issues_created_total', 0) + 1)
+            self._report(start_time)
+    
+    def _rate_limit_wait(self, error: Exception) -> Optional[float]:
+        """Seconds to pause when `error` means "slow down", else None"""
+        if isinstance(error, CircuitOpenError):
+            return self.github.resilience.breaker('github issues.create').retry_in()
+        if error.retry_after_s is not None:
+            return error.retry_after_s
+        if 'rate limit' in str(error).lower():
+            return self.DEFAULT_RATE_LIMIT_WAIT_S
+        return None
+    
+    def _fail(self, item: IssueSpec, error: Exception) -> None:
+        logger.error(f"Could not create issue '{item.title}': {error}")
+        self.failures[item.key] = str(error)
+        self.progress['failed'] += 1
+    
+    def _report(self, start_time: float) -> None:
+        elapsed_s = time.perf_counter() - start_time
+        finished = self.progress['created'] + self.progress['skipped'] + self.progress['failed']
+        remaining = self.progress['total'] - finished
+        rate_per_s = self.progress['created'] / elapsed_s if elapsed_s > 0 else 0.0
+        snapshot = {
+            **self.progress,
+            'remaining': remaining,
+            'rate_per_min': round(rate_per_s * 60, 1),
+            'eta_s': round(remaining / rate_per_s, 1) if rate_per_s else None
+        }
+        if self.on_progress is not None:
+            self.on_progress(snapshot)
+        elif remaining == 0 or finished % 10 == 0:
+            logger.info(f"Bulk issues: {finished}/{snapshot['total']} done "
+                        f"({snapshot['created']} created, {snapshot['failed']} failed, ETA {snapshot['eta_s']}s)")
+
 # ============================================================================
 # DEV TOOLS: Epic Manager
 # ============================================================================
@@ -612,49 +1956,339 @@ class Epic:
             'completion_percentage': self.completion_percentage
         }
 
+# "**Field:** value" lines written by EpicManager._persist_epics
+_EPIC_FIELD = re.compile(r'\*\*(ID|Status|Priority|Completion|Assignee|Tags|Created|Updated):\*\* ?(.*?)\s*$')
+
+def parse_epics_markdown(lines: Iterable[str]) -> Iterator[Epic]:
+    """
+    Epics from EPICS.md lines, in one streaming pass.
+    WHY: Loading must recover every persisted field, or a load-then-save
+    resets every epic to TODO/NORMAL.
+    
+    Each "## Title" starts an epic, followed by its header block of field
+    lines; everything after the header is description, minus the closing
+    "---". Written files (with ID lines) end the header at its first blank
+    line, and a "---" then "## " inside a description only starts an epic
+    when an ID line follows. ID-less files split on every heading and take
+    the first value of each field from the whole leading block of fields,
+    healing files where old loaders folded stale blocks into descriptions;
+    they get the title-derived id, so ids are stable either way.
+    """
+    title, fields, body = None, {}, []
+    in_header = False
+    last = ''        # last non-blank line of the current epic
+    pending = None   # a heading after "---", waiting to see whether an ID line follows
+    
+    def finish() -> Epic:
+        written = 'ID' in fields
+        while body and not body[-1].strip():
+            body.pop()
+        # Written files close each epic with one "---"; old ones stacked several
+        while body and body[-1].strip() == '---':
+            body.pop()
+            while body and not body[-1].strip():
+                body.pop()
+            if written:
+                break
+        start = next((i for i, line in enumerate(body) if line.strip()), len(body))
+        priority = Priority.__members__.get(fields.get('Priority', '').upper(), Priority.NORMAL)
+        try:
+            completion = float(fields.get('Completion', '0').rstrip('%') or 0)
+        except ValueError:
+            completion = 0.0
+        epic = Epic(
+            id=fields.get('ID') or hashlib.md5(title.encode()).hexdigest()[:8],
+            title=title,
+            description='\n'.join(body[start:]),
+            status=fields.get('Status') or 'TODO',
+            priority=priority,
+            assignee=fields.get('Assignee') or None,
+            tags=[tag.strip() for tag in fields.get('Tags', '').split(',') if tag.strip()],
+            completion_percentage=completion
+        )
+        for name, attribute in (('Created', 'created_at'), ('Updated', 'updated_at')):
+            if fields.get(name):
+                setattr(epic, attribute, fields[name])
+        return epic
+    
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if pending is not None:
+            if not line.strip():
+                pending.append(line)
+                continue
+            if line.startswith('**ID:**'):
+                yield finish()
+                title, fields, body, in_header, last = pending[0][3:].strip(), {}, [], True, ''
+            else:
+                body.extend(pending)  # just a heading inside the description
+                last = pending[0].strip()
+            pending = None
+        
+        if line.startswith('## ') and 'ID' not in fields:
+            if title is not None:
+                yield finish()
+            title, fields, body, in_header, last = line[3:].strip(), {}, [], True, ''
+            continue
+        if line.startswith('## ') and last == '---':
+            pending = [line]
+            continue
+        if title is None:
+            continue
+        
+        if in_header:
+            match = _EPIC_FIELD.match(line)
+            if match:
+                fields.setdefault(match.group(1), match.group(2))
+                continue
+            if not line.strip():
+                in_header = 'ID' not in fields
+                continue
+            in_header = False
+        body.append(line)
+        if line.strip():
+            last = line.strip()
+    
+    if pending is not None:
+        body.extend(pending)
+    if title is not None:
+        yield finish()
+
+class EpicIndex(dict):
+    """
+    epic_id -> Epic, with secondary indexes kept up to date on every write.
+    WHY: Title lookups, filtered listings and the list view must not scan or
+    re-sort every epic once there are tens of thousands of them.
+    
+    Title, status, tag and priority map to insertion-ordered id sets, and
+    `ordered()` is a bisect-maintained list in list-view order. Epics are
+    mutable, so call reindex(epic_id) after changing an indexed field.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._indexes: Dict[str, Dict[Any, Dict[str, None]]] = {
+            'title': {}, 'status': {}, 'tag': {}, 'priority': {}
+        }
+        self._entries: Dict[str, tuple] = {}  # epic_id -> what it was indexed under
+        self._order: List[tuple] = []
+    
+    @staticmethod
+    def order_key(epic: Epic) -> tuple:
+        """List view order: in progress, then the rest, then done; by title"""
+        return (epic.status != 'IN_PROGRESS', epic.status == 'DONE', epic.title, epic.id)
+    
+    def _index_keys(self, epic: Epic) -> List[tuple]:
+        return [('title', epic.title), ('status', epic.status), ('priority', epic.priority),
+                *(('tag', tag) for tag in epic.tags)]
+    
+    def _add(self, epic_id: str, epic: Epic) -> None:
+        keys, order_key = self._index_keys(epic), self.order_key(epic)
+        for index, key in keys:
+            self._indexes[index].setdefault(key, {})[epic_id] = None
+        bisect.insort(self._order, order_key)
+        self._entries[epic_id] = (keys, order_key)
+    
+    def _remove(self, epic_id: str) -> None:
+        keys, order_key = self._entries.pop(epic_id)
+        for index, key in keys:
+            ids = self._indexes[index][key]
+            del ids[epic_id]
+            if not ids:
+                del self._indexes[index][key]
+        del self._order[bisect.bisect_left(self._order, order_key)]
+    
+    def __setitem__(self, epic_id: str, epic: Epic) -> None:
+        if epic_id in self._entries:
+            self._remove(epic_id)
+        super().__setitem__(epic_id, epic)
+        self._add(epic_id, epic)
+    
+    def __delitem__(self, epic_id: str) -> None:
+        super().__delitem__(epic_id)
+        self._remove(epic_id)
+    
+    def pop(self, epic_id: str, *default: Any) -> Any:
+        if epic_id not in self:
+            return super().pop(epic_id, *default)
+        epic = self[epic_id]
+        del self[epic_id]
+        return epic
+    
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for epic_id, epic in dict(*args, **kwargs).items():
+            self[epic_id] = epic
+    
+    def clear(self) -> None:
+        super().clear()
+        for index in self._indexes.values():
+            index.clear()
+        self._entries.clear()
+        self._order.clear()
+    
+    def reindex(self, epic_id: str) -> None:
+        """Refresh the indexes after an epic's title, status, priority or tags changed"""
+        self._remove(epic_id)
+        self._add(epic_id, self[epic_id])
+    
+    def title_id(self, title: str) -> Optional[str]:
+        """The id of the first epic with this exact title"""
+        return next(iter(self._indexes['title'].get(title, ())), None)
+    
+    def ids(self, index: str, key: Any) -> List[str]:
+        """Ids under one key of the 'title', 'status', 'tag' or 'priority' index"""
+        return list(self._indexes[index].get(key, ()))
+    
+    def ordered(self, status: Optional[str] = None, tag: Optional[str] = None,
+                priority: Optional[Priority] = None) -> List[Epic]:
+        """Epics in list-view order; filters intersect, starting from the smallest bucket"""
+        filters = [(index, key) for index, key in (('status', status), ('tag', tag), ('priority', priority))
+                   if key is not None]
+        if not filters:
+            return [self[key[-1]] for key in self._order]
+        buckets = sorted((self._indexes[index].get(key, {}) for index, key in filters), key=len)
+        matches = [self[epic_id] for epic_id in buckets[0] if all(epic_id in bucket for bucket in buckets[1:])]
+        return sorted(matches, key=self.order_key)
+
+class Debouncer:
+    """
+    Run only the latest action per key, once `delay_s` passes without a newer one.
+    WHY: Ten quick updates to one epic should cost one GitHub call, not ten.
+    
+    Under a steady stream of updates a key still runs every `max_delay_s`.
+    Actions for the same key never overlap; flush() runs everything now.
+    """
+    
+    def __init__(self, delay_s: float, max_delay_s: Optional[float] = None):
+        self.delay_s = delay_s
+        self.max_delay_s = delay_s * 10 if max_delay_s is None else max_delay_s
+        self.scheduled_total = 0
+        self.executed_total = 0
+        self._pending: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._first_at: Dict[str, float] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+    
+    def schedule(self, key: str, action: Callable[[], Awaitable[Any]]) -> None:
+        """Replace any pending action for key and restart its quiet period"""
+        loop = asyncio.get_running_loop()
+        self.scheduled_total += 1
+        self._pending[key] = action
+        first_at = self._first_at.setdefault(key, loop.time())
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        delay = max(0.0, min(self.delay_s, first_at + self.max_delay_s - loop.time()))
+        self._timers[key] = loop.call_later(delay, self._fire, key)
+    
+    def _fire(self, key: str) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        self._first_at.pop(key, None)
+        action = self._pending.pop(key, None)
+        if action is not None:
+            task = asyncio.ensure_future(self._run(key, action, self._running.get(key)))
+            self._running[key] = task
+            task.add_done_callback(lambda done, key=key: self._running.get(key) is done and self._running.pop(key))
+    
+    async def _run(self, key: str, action: Callable[[], Awaitable[Any]],
+                   previous: Optional[asyncio.Task]) -> None:
+        detach_deadline()  # runs after the command that scheduled it (copied context)
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        self.executed_total += 1
+        try:
+            await action()
+        except Exception as e:
+            logger.warning(f"Debounced action for {key} failed: {e}")
+    
+    async def flush(self) -> None:
+        """Run pending actions now and wait for all running ones"""
+        for key in list(self._pending):
+            self._fire(key)
+        if self._running:
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {'scheduled': self.scheduled_total, 'executed': self.executed_total, 'pending': len(self._pending)}
+
 class EpicManager:
     """
     Complete epic management with CRUD operations.
     WHY: Demonstrates state management patterns.
     """
     
-    def __init__(self, context: AgentContext):
+    def __init__(self, context: AgentContext, resilience: Optional[ResilienceLayer] = None,
+                 github: Optional[GitHubIntegration] = None):
         self.context = context
+        self.resilience = resilience or ResilienceLayer(context)
+        self._github = github
         self.epics_path = Path(context.config.get('project_root', '.')) / 'docs' / 'roadmap' / 'EPICS.md'
-        self.epics: Dict[str, Epic] = {}
-        self.github_issues: Dict[str, str] = {}  # epic_id -> issue_number
+        self.epics = EpicIndex()
+        self.sync_state_path = Path(context.config.get('project_root', '.')) / context.config.get(
+            'github_sync_state_path', '.agent_boot/github_sync.json')
+        self.sync_state = self._load_sync_state()
         self._load_epics()
+        # issue_number -> node id of our progress comment, edited in place
+        self.progress_comments: Dict[str, str] = dict(self.sync_state.get('progress_comments', {}))
+        self.progress_debouncer = Debouncer(context.config.get('progress_comment_debounce_ms', 2000.0) / 1000)
+        self._progress_sent: Dict[str, str] = {}  # issue_number -> last body sent
+        # epic_id -> issue_number; links to epics no longer in EPICS.md are dropped
+        self.github_issues: Dict[str, str] = {
+            epic_id: number for epic_id, number in self.sync_state.get('issues', {}).items()
+            if epic_id in self.epics
+        }
+    
+    @property
+    def github(self) -> GitHubIntegration:
+        """The shared client when given one, else our own (built on first use)"""
+        if self._github is None:
+            self._github = GitHubIntegration(self.context, resilience=self.resilience)
+        return self._github
+    
+    def _load_sync_state(self) -> Dict[str, Any]:
+        """Watermark and issue links from the last sync"""
+        try:
+            return json.loads(self.sync_state_path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable sync state ({e}) - next sync is a full one")
+            return {}
+    
+    def _save_sync_state(self) -> None:
+        self.sync_state['issues'] = self.github_issues
+        self.sync_state['progress_comments'] = self.progress_comments
+        try:
+            self.sync_state_path.parent.mkdir(parents=True, exist_ok=True)
+            self.sync_state_path.write_text(json.dumps(self.sync_state, indent=2))
+        except OSError as e:
+            logger.warning(f"Could not save sync state: {e}")
+    
+    def link_issue(self, epic_id: str, issue_number: Union[int, str]) -> None:
+        """Remember which issue tracks an epic (kept across sessions)"""
+        self.github_issues[epic_id] = str(issue_number)
+        self._save_sync_state()
     
     def _load_epics(self) -> None:
         """Load epics from markdown with error recovery"""
-        if not self.epics_path.exists():
-            logger.info("No existing epics file found, starting fresh")
-            return
-        
         try:
-            content = self.epics_path.read_text()
-            # Parse markdown structure (simplified for example)
-            # In production, use a proper markdown parser
-            current_epic = None
-            for line in content.split('\n'):
-                if line.startswith('## '):
-                    # New epic
-                    title = line[3:].strip()
-                    epic_id = hashlib.md5(title.encode()).hexdigest()[:8]
-                    current_epic = Epic(id=epic_id, title=title, description="")
-                    self.epics[epic_id] = current_epic
-                elif current_epic and line.strip():
-                    current_epic.description += line + "\n"
-                    
+            with open(self.epics_path, encoding='utf-8') as f:
+                for epic in parse_epics_markdown(f):
+                    if epic.id in self.epics:
+                        # Duplicate title in an ID-less file: keep both, deterministically
+                        epic.id = hashlib.md5(f"{epic.title}#{len(self.epics)}".encode()).hexdigest()[:8]
+                    self.epics[epic.id] = epic
+        except FileNotFoundError:
+            logger.info("No existing epics file found, starting fresh")
         except Exception as e:
             logger.error(f"Failed to load epics: {e}")
     
     def find_epic_by_title(self, title: str) -> Optional[Epic]:
         """Find epic by title."""
-        for epic in self.epics.values():
-            if epic.title == title:
-                return epic
-        return None
+        epic_id = self.epics.title_id(title)
+        return self.epics[epic_id] if epic_id else None
     
     @measure_performance
     async def update_epic(self, epic_id: str, status: Optional[str] = None, 
@@ -686,11 +2320,12 @@ class EpicManager:
             
             if updated:
                 epic.updated_at = datetime.now(timezone.utc).isoformat()
+                self.epics.reindex(epic_id)
                 await self._persist_epics()
                 
-                # Update GitHub issue if it exists
+                # Update GitHub issue if it exists (debounced - only the final state is sent)
                 if epic_id in self.github_issues:
-                    await self._update_github_issue(epic_id, epic)
+                    await self._schedule_progress(epic_id)
             
             return TaskResult(
                 success=True,
@@ -710,24 +2345,26 @@ class EpicManager:
                 timestamp=datetime.now(timezone.utc).isoformat()
             )
     
-    async def _update_github_issue(self, epic_id: str, epic: Epic) -> None:
-        """
-        Update GitHub issue with epic progress.
-        WHY: Keep GitHub in sync with local state.
-        """
-        try:
-            issue_number = self.github_issues.get(epic_id)
-            if not issue_number:
-                return
-            
-            # Create progress bar
-            progress = int(epic.completion_percentage)
-            filled = '█' * (progress // 10)
-            empty = '░' * (10 - (progress // 10))
-            progress_bar = f"[{filled}{empty}] {progress}%"
-            
-            # Create comment body
-            comment = f"""
+    PROGRESS_MARKER = '<!-- agent-boot:epic-progress -->'
+    
+    async def _schedule_progress(self, epic_id: str) -> None:
+        if self.progress_debouncer.delay_s <= 0:
+            await self._update_github_issue(epic_id)
+        else:
+            self.progress_debouncer.schedule(epic_id, lambda: self._update_github_issue(epic_id))
+    
+    async def flush_progress(self) -> None:
+        """Send debounced progress comments now (e.g. at shutdown)"""
+        await self.progress_debouncer.flush()
+    
+    def _progress_comment(self, epic: Epic) -> str:
+        # Create progress bar
+        progress = int(epic.completion_percentage)
+        filled = '█' * (progress // 10)
+        empty = '░' * (10 - (progress // 10))
+        progress_bar = f"[{filled}{empty}] {progress}%"
+        
+        return f"""{self.PROGRESS_MARKER}
 ### 📊 Epic Progress Update
 
 **Status:** {epic.status}
@@ -737,28 +2374,63 @@ class EpicManager:
 ---
 *Updated by Agent Boot*
 """
+    
+    async def _update_github_issue(self, epic_id: str) -> None:
+        """
+        Update GitHub issue with epic progress.
+        WHY: Keep GitHub in sync with local state.
+        
+        One bot-owned comment per issue (found by its marker) is edited in
+        place with the epic's current state.
+        """
+        try:
+            issue_number = self.github_issues.get(epic_id)
+            epic = self.epics.get(epic_id)
+            if not issue_number or epic is None:
+                return
+            body = self._progress_comment(epic)
+            if self._progress_sent.get(issue_number) == body:
+                return
             
-            # Post comment to issue
-            cmd = ['gh', 'issue', 'comment', issue_number, '--body', comment]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            comment_id = self.progress_comments.get(issue_number)
+            if comment_id is None:
+                comment_id = next((comment['node_id'] for comment in reversed(await self.github.issue_comments(issue_number))
+                                   if self.PROGRESS_MARKER in comment['body']), None)
+            if comment_id is not None:
+                try:
+                    await self.github.edit_comment(comment_id, body)
+                except NotFoundError:
+                    comment_id = None  # deleted on GitHub - post a fresh one
+            if comment_id is None:
+                # Writes are not retried - a retry could post it twice
+                comment_id = (await self.github.comment_on_issue(issue_number, body))['node_id']
             
-            if result.returncode == 0:
-                logger.info(f"Updated GitHub issue #{issue_number} with progress")
-            else:
-                logger.warning(f"Could not update GitHub issue: {result.stderr}")
+            self.progress_comments[issue_number] = comment_id
+            self._progress_sent[issue_number] = body
+            self._save_sync_state()
+            logger.info(f"Updated GitHub issue #{issue_number} with progress")
                 
         except Exception as e:
-            logger.warning(f"GitHub update failed (non-critical): {e}")
+            # Nothing was recorded as sent, so a transient failure is simply tried again later
+            retry = (isinstance(e, (CircuitOpenError, ConnectionError, asyncio.TimeoutError))
+                     or (isinstance(e, ExternalCallError) and e.transient))
+            if retry and self.progress_debouncer.delay_s > 0:
+                self.progress_debouncer.schedule(epic_id, lambda: self._update_github_issue(epic_id))
+            logger.warning(f"GitHub update failed (non-critical{', will retry' if retry else ''}): {e}")
     
     @measure_performance
-    async def list_epics(self) -> TaskResult:
+    async def list_epics(self, status: Optional[str] = None, tag: Optional[str] = None,
+                         priority: Optional[Union[Priority, str]] = None) -> TaskResult:
         """
-        List all epics with their status.
+        List epics with their status, optionally filtered.
         WHY: Overview of project state.
         """
         try:
+            if isinstance(priority, str):
+                priority = Priority[priority.upper()]
             epic_list = []
-            for epic in self.epics.values():
+            # Already in status-then-title order (see EpicIndex.order_key)
+            for epic in self.epics.ordered(status=status, tag=tag, priority=priority):
                 epic_summary = {
                     'id': epic.id,
                     'title': epic.title,
@@ -768,9 +2440,6 @@ class EpicManager:
                 }
                 epic_list.append(epic_summary)
             
-            # Sort by status and completion
-            epic_list.sort(key=lambda x: (x['status'] != 'IN_PROGRESS', x['status'] == 'DONE', x['title']))
-            
             return TaskResult(
                 success=True,
                 data={'epics': epic_list, 'total': len(epic_list)},
@@ -789,50 +2458,57 @@ class EpicManager:
                 timestamp=datetime.now(timezone.utc).isoformat()
             )
     
+    @single_flight()
     @measure_performance
-    async def sync_with_github(self) -> TaskResult:
+    async def sync_with_github(self, full: bool = False) -> TaskResult:
         """
         Sync epic status with GitHub issues.
         WHY: Keep local and remote state consistent.
+        
+        Only issues updated since the stored watermark are fetched, so a sync
+        costs in proportion to what changed; full=True rescans everything.
         """
         try:
-            synced = 0
+            since = None if full else self.sync_state.get('watermark')
+            watermark = since
+            affected = set()
+            fetched = 0
             
-            # Get all issues
-            result = subprocess.run(
-                ['gh', 'issue', 'list', '--state', 'all', '--json', 'number,title,state,body'],
-                capture_output=True, text=True
-            )
-            
-            if result.returncode != 0:
-                raise Exception(f"GitHub CLI failed: {result.stderr}")
-            
-            issues = json.loads(result.stdout) if result.stdout else []
+            # Built once per sync instead of scanning every epic per issue
+            by_number = {number: epic_id for epic_id, number in self.github_issues.items()}
             
-            # Match issues to epics by title
-            for issue in issues:
-                for epic_id, epic in self.epics.items():
-                    if epic.title in issue['title']:
-                        # Update epic status based on issue state
-                        if issue['state'] == 'CLOSED':
-                            epic.status = 'DONE'
-                            epic.completion_percentage = 100.0
-                        elif issue['state'] == 'OPEN' and epic.status == 'TODO':
-                            epic.status = 'IN_PROGRESS'
-                            epic.completion_percentage = max(epic.completion_percentage, 10.0)
-                        
-                        # Store issue number
-                        self.github_issues[epic_id] = str(issue['number'])
-                        synced += 1
-                        break
+            async for issue in self.github.iter_issues(since):
+                fetched += 1
+                if issue['updated_at'] and (watermark is None or issue['updated_at'] > watermark):
+                    watermark = issue['updated_at']
+                epic_id = self._match_issue(issue, by_number)
+                if epic_id is None:
+                    continue
+                
+                # Update epic status based on issue state
+                epic = self.epics[epic_id]
+                if issue['state'] == 'CLOSED':
+                    epic.status = 'DONE'
+                    epic.completion_percentage = 100.0
+                elif issue['state'] == 'OPEN' and epic.status == 'TODO':
+                    epic.status = 'IN_PROGRESS'
+                    epic.completion_percentage = max(epic.completion_percentage, 10.0)
+                self.epics.reindex(epic_id)
+                
+                # Store issue number
+                self.github_issues[epic_id] = str(issue['number'])
+                affected.add(epic_id)
             
             # Save updates
-            if synced > 0:
+            if affected:
                 await self._persist_epics()
+            self.sync_state['watermark'] = watermark
+            self._save_sync_state()
             
             return TaskResult(
                 success=True,
-                data={'synced': synced, 'total_issues': len(issues)},
+                data={'synced': len(affected), 'total_issues': fetched,
+                      'full': since is None, 'watermark': watermark},
                 error=None,
                 duration_ms=0,
                 timestamp=datetime.now(timezone.utc).isoformat()
@@ -848,6 +2524,20 @@ class EpicManager:
                 timestamp=datetime.now(timezone.utc).isoformat()
             )
     
+    def _match_issue(self, issue: Dict[str, Any], by_number: Dict[str, str]) -> Optional[str]:
+        """The epic an issue tracks: known link, exact title, then title substring"""
+        epic_id = by_number.get(str(issue['number']))
+        if epic_id in self.epics:
+            return epic_id
+        title = issue['title']
+        epic_id = self.epics.title_id(title) or self.epics.title_id(title.removeprefix('📋').strip())
+        if epic_id:
+            return epic_id
+        for epic_id, epic in self.epics.items():
+            if epic.title in title:
+                return epic_id
+        return None
+    
     @measure_performance
     async def create_epic(self, title: str, description: str, **kwargs) -> TaskResult:
         """
@@ -899,7 +2589,7 @@ class EpicManager:
         Persist epics to markdown with atomic write.
         WHY: Data persistence must be reliable.
         """
-        content = f"# Epics\n> Updated: {datetime.now(timezone.utc).strftime('%Y-%m-%d')}\n\n"
+        parts = [f"# Epics\n> Updated: {datetime.now(timezone.utc).strftime('%Y-%m-%d')}\n\n"]
         
         # Sort by priority and status
         sorted_epics = sorted(
@@ -907,25 +2597,33 @@ class EpicManager:
             key=lambda e: (e.priority.value, e.status, e.created_at)
         )
         
+        # Every field parse_epics_markdown reads back; completion keeps its decimals only when it has some
         for epic in sorted_epics:
-            content += f"""
+            parts.append(f"""
 ## {epic.title}
 
+**ID:** {epic.id}  
 **Status:** {epic.status}  
 **Priority:** {epic.priority.name}  
-**Completion:** {epic.completion_percentage:.0f}%  
-**Created:** {epic.created_at}  
+**Completion:** {epic.completion_percentage:g}%  
+""")
+            if epic.assignee:
+                parts.append(f"**Assignee:** {epic.assignee}  \n")
+            if epic.tags:
+                parts.append(f"**Tags:** {', '.join(epic.tags)}  \n")
+            description = epic.description.strip('\n')
+            parts.append(f"""**Created:** {epic.created_at}  
 **Updated:** {epic.updated_at}  
 
-{epic.description}
+{description}
 
 ---
-"""
+""")
         
         # Atomic write
         self.epics_path.parent.mkdir(parents=True, exist_ok=True)
         temp_path = self.epics_path.with_suffix('.tmp')
-        temp_path.write_text(content)
+        temp_path.write_text(''.join(parts), encoding='utf-8')
         temp_path.replace(self.epics_path)
 
 # ============================================================================
@@ -1049,6 +2747,25 @@ class PerformanceMonitor:
             'bundle_size_kb': 200,
             'memory_usage_mb': 100
         }
+        # Command name -> count, timeouts, worst duration and budget
+        self.budget_violations: Dict[str, Dict[str, float]] = {}
+    
+    async def record_budget_violation(self, command: str, duration_ms: float,
+                                      budget_ms: float, timed_out: bool = False) -> None:
+        """Count a command that overran its budget (or hit its deadline)"""
+        entry = self.budget_violations.setdefault(
+            command, {'count': 0, 'timeouts': 0, 'worst_ms': 0.0, 'budget_ms': budget_ms}
+        )
+        entry['count'] += 1
+        entry['timeouts'] += int(timed_out)
+        entry['worst_ms'] = max(entry['worst_ms'], duration_ms)
+        self.context.metrics['budget_violations_total'] = sum(
+            violation['count'] for violation in self.budget_violations.values()
+        )
+        logger.warning(
+            f"Command {command} {'timed out' if timed_out else 'over budget'}: "
+            f"{duration_ms:.0f}ms (budget={budget_ms:.0f}ms)"
+        )
     
     async def record_metric(self, name: str, value: float) -> None:
         """Record performance metric with rolling window"""
@@ -1068,12 +2785,18 @@ class PerformanceMonitor:
         if name in self.thresholds and value > self.thresholds[name]:
             logger.warning(f"Performance threshold violated: {name}={value:.2f} (threshold={self.thresholds[name]})")
     
+    async def record_metrics(self, batch: List[tuple]) -> None:
+        """Record a batch of (name, value) pairs"""
+        for name, value in batch:
+            await self.record_metric(name, value)
+    
     def get_performance_report(self) -> Dict[str, Any]:
         """Generate comprehensive performance report"""
         report = {
             'timestamp': datetime.now(timezone.utc).isoformat(),
             'metrics': {},
-            'violations': []
+            'violations': [],
+            'budget_violations': {name: dict(entry) for name, entry in self.budget_violations.items()}
         }
         
         for name, values in self.metrics.items():
@@ -1097,39 +2820,755 @@ class PerformanceMonitor:
         
         return report
 
-# ============================================================================
-# MAIN AGENT ORCHESTRATOR
-# ============================================================================
-
-class TrackingEnforcer:
+class LoopLagMonitor:
     """
-    Enforces systematic tracking updates.
-    WHY: Prevents context loss between sessions.
-    
-    ENFORCEMENT RULES:
-    1. Every 3 changes = forced update
-    2. Every 5 minutes = forced update
-    3. Context switch = forced update
-    4. Error occurrence = immediate update
+    Event-loop lag monitor with blocking-stack capture.
+    WHY: One blocking call inside a coroutine freezes every worker sharing the loop.
+
+    A sentinel task sleeps for `interval_ms` and records how late it woke up
+    (the scheduling delay) as `event_loop_lag_ms`. A watchdog thread notices
+    when the sentinel has not checked in for longer than `threshold_ms` and
+    snapshots the loop thread's stack while it is still blocked.
     """
-    
-    def __init__(self, context: AgentContext):
-        self.context = context
-        self.last_update = time.time()
-        self.pending_updates = []
-        self.update_interval = 300  # 5 minutes
-        self.changes_since_update = 0
-        self.critical_threshold = 3  # Force update after 3 changes
-        self.current_task = None
-        self.task_start_time = None
-    
-    def track_change(self, change_type: str, description: str, **details) -> bool:
-        """
-        Track any significant change.
-        WHY: Every change must be recorded immediately.
-        """
-        self.pending_updates.append({
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+
+    METRIC = 'event_loop_lag_ms'
+
+    def __init__(self, perf_monitor: PerformanceMonitor, interval_ms: float = 50.0,
+                 threshold_ms: float = 100.0, max_stalls: int = 20):
+        self.perf_monitor = perf_monitor
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=max_stalls)
+        self.perf_monitor.thresholds[self.METRIC] = threshold_ms
+
+        self._sentinel: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = 0.0
+        self._captured_beat: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._sentinel is not None and not self._sentinel.done()
+
+    def start(self) -> None:
+        """Start the sentinel on the running loop and the watchdog thread"""
+        if self.running:
+            return
+
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop_event.clear()
+        self._sentinel = asyncio.get_running_loop().create_task(self._sentinel_loop())
+        self._watchdog = threading.Thread(
+            target=self._watch, name='loop-lag-watchdog', daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop sentinel and watchdog"""
+        self._stop_event.set()
+        if self._sentinel:
+            self._sentinel.cancel()
+            await asyncio.gather(self._sentinel, return_exceptions=True)
+            self._sentinel = None
+        if self._watchdog:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    async def _sentinel_loop(self) -> None:
+        """Measure how late the loop schedules a fixed-interval sleep"""
+        interval = self.interval_ms / 1000
+
+        while True:
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            now = time.perf_counter()
+            lag_ms = max(0.0, (now - expected) * 1000)
+
+            stalled_beat = self._captured_beat
+            self._last_beat = now
+
+            # Attach the final lag to the stack captured during the stall
+            if stalled_beat is not None and self.stalls and self.stalls[-1]['beat'] == stalled_beat:
+                self.stalls[-1]['lag_ms'] = lag_ms
+                self._captured_beat = None
+
+            await self.perf_monitor.record_metric(self.METRIC, lag_ms)
+
+    def _watch(self) -> None:
+        """Watchdog thread: snapshot the loop thread's stack while it is blocked"""
+        poll_s = max(self.interval_ms, 10.0) / 1000
+
+        while not self._stop_event.wait(poll_s):
+            beat = self._last_beat
+            blocked_ms = (time.perf_counter() - beat) * 1000 - self.interval_ms
+            if blocked_ms <= self.threshold_ms or self._captured_beat == beat:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+
+            stack = traceback.format_stack(frame)
+            self._captured_beat = beat
+            self.stalls.append({
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'beat': beat,
+                'blocked_ms': blocked_ms,
+                'lag_ms': None,
+                'stack': stack
+            })
+            logger.warning(
+                f"Event loop blocked for >{blocked_ms:.0f}ms at:\n{''.join(stack[-3:])}"
+            )
+
+    def get_report(self) -> Dict[str, Any]:
+        """Summarize lag thresholds and captured stalls"""
+        return {
+            'interval_ms': self.interval_ms,
+            'threshold_ms': self.threshold_ms,
+            'stalls': [
+                {key: value for key, value in stall.items() if key != 'beat'}
+                for stall in self.stalls
+            ]
+        }
+
+class StartupProfiler:
+    """
+    Phase timings for one CLI run, printed in the style of `python -X importtime`.
+    WHY: Cold-start cost is invisible until each phase is measured.
+    
+    Phases nest; like importtime, a phase is listed after its children with
+    its self time (excluding children) and cumulative time.
+    """
+    
+    def __init__(self):
+        self.phases: List[Dict[str, Any]] = []
+        self._stack: List[Dict[str, Any]] = []
+    
+    @contextmanager
+    def phase(self, name: str):
+        entry = {'name': name, 'depth': len(self._stack), 'children_ms': 0.0}
+        self._stack.append(entry)
+        start_time = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            self._stack.pop()
+            self.record(name, (time.perf_counter() - start_time) * 1000, entry=entry)
+    
+    def record(self, name: str, cumulative_ms: float, children_ms: float = 0.0,
+               depth: Optional[int] = None, entry: Optional[Dict[str, Any]] = None) -> None:
+        """Add a phase measured elsewhere (e.g. the module import)"""
+        if entry is None:
+            entry = {'name': name, 'depth': len(self._stack) if depth is None else depth,
+                     'children_ms': children_ms}
+        entry['cumulative_ms'] = cumulative_ms
+        entry['self_ms'] = cumulative_ms - entry.pop('children_ms')
+        if self._stack:
+            self._stack[-1]['children_ms'] += cumulative_ms
+        self.phases.append(entry)
+    
+    @property
+    def total_ms(self) -> float:
+        return sum(phase['cumulative_ms'] for phase in self.phases if phase['depth'] == 0)
+    
+    def report(self, budget_ms: Optional[float] = None) -> Dict[str, Any]:
+        return {
+            'phases': [dict(phase) for phase in self.phases],
+            'total_ms': self.total_ms,
+            'budget_ms': budget_ms,
+            'within_budget': budget_ms is None or self.total_ms <= budget_ms
+        }
+    
+    def format(self, budget_ms: Optional[float] = None) -> str:
+        lines = ["startup time: self [us] | cumulative | phase"]
+        for phase in self.phases:
+            lines.append(
+                f"startup time: {phase['self_ms'] * 1000:>9.0f} | "
+                f"{phase['cumulative_ms'] * 1000:>10.0f} | {'  ' * phase['depth']}{phase['name']}"
+            )
+        budget = f" (budget {budget_ms:.0f} ms)" if budget_ms is not None else ""
+        lines.append(f"startup total: {self.total_ms:.1f} ms{budget}")
+        return "\n".join(lines)
+
+# ============================================================================
+# TASK SCHEDULING
+# ============================================================================
+
+def task_priority(task: Dict[str, Any]) -> Priority:
+    """Resolve a task's priority from a Priority, its name or its value"""
+    value = task.get('priority', Priority.NORMAL)
+    if isinstance(value, Priority):
+        return value
+    if isinstance(value, str) and value.upper() in Priority.__members__:
+        return Priority[value.upper()]
+    try:
+        return Priority(int(value))
+    except (TypeError, ValueError):
+        logger.warning(f"Unknown task priority {value!r}, using NORMAL")
+        return Priority.NORMAL
+
+@dataclass
+class QueuedTask:
+    """
+    Envelope for a queued task.
+    WHY: Scheduling metadata travels with the task instead of inside it.
+    """
+    task: Dict[str, Any]
+    priority: Priority = Priority.NORMAL
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    seq: int = 0
+    wait_ms: float = 0.0
+    futures: List[asyncio.Future] = field(default_factory=list)
+    coalesce_key: Optional[str] = None
+
+    def resolve(self, result: TaskResult) -> None:
+        """Deliver the result to every caller still waiting on it"""
+        for future in self.futures:
+            if not future.done():
+                future.set_result(result)
+
+class PriorityTaskQueue(asyncio.Queue):
+    """
+    Priority scheduler for agent tasks.
+    WHY: Urgent work must not wait behind a burst of background tasks.
+
+    Keeps one FIFO deque per Priority level. A waiting task is promoted one
+    level for every `aging_interval_s` it has waited, so DEFERRED work is
+    never starved. Plain task dicts are wrapped in a QueuedTask on put.
+    """
+
+    def __init__(self, maxsize: int = 0, aging_interval_s: float = 5.0, wait_window: int = 100):
+        self.aging_interval_s = aging_interval_s
+        self.wait_window = wait_window
+        self.on_put: Optional[Callable[[], None]] = None  # e.g. WorkerPool.maybe_scale
+        self.dropped_total = 0
+        self.rejected_total = 0
+        super().__init__(maxsize)
+
+    # asyncio.Queue storage hooks (same extension points as asyncio.PriorityQueue)
+    def _init(self, maxsize: int) -> None:
+        self._levels: Dict[Priority, Deque[QueuedTask]] = {p: deque() for p in Priority}
+        self._wait_ms: Dict[Priority, Deque[float]] = {
+            p: deque(maxlen=self.wait_window) for p in Priority
+        }
+        self._seq = itertools.count()
+
+    def _put(self, item: Union[QueuedTask, Dict[str, Any]]) -> None:
+        if not isinstance(item, QueuedTask):
+            item = QueuedTask(task=item, priority=task_priority(item))
+        item.seq = next(self._seq)
+        self._levels[item.priority].append(item)
+        if self.on_put:
+            self.on_put()
+
+    def _get(self) -> QueuedTask:
+        now = time.perf_counter()
+        selected: Optional[Priority] = None
+        selected_key = None
+
+        # Only the head of each level can win: FIFO within a level
+        for priority, level in self._levels.items():
+            if not level:
+                continue
+            head = level[0]
+            key = (self._effective_level(priority, now - head.enqueued_at), head.seq)
+            if selected_key is None or key < selected_key:
+                selected, selected_key = priority, key
+
+        item = self._levels[selected].popleft()
+        item.wait_ms = (now - item.enqueued_at) * 1000
+        self._wait_ms[selected].append(item.wait_ms)
+        return item
+
+    def _effective_level(self, priority: Priority, waited_s: float) -> int:
+        """Priority value after aging promotions"""
+        if self.aging_interval_s <= 0:
+            return priority.value
+        promotions = int(waited_s / self.aging_interval_s)
+        return max(Priority.CRITICAL.value, priority.value - promotions)
+
+    def evict_oldest(self, at_most: Priority = Priority.CRITICAL) -> Optional[QueuedTask]:
+        """
+        Remove the oldest task of the least urgent non-empty level, but only
+        from levels no more urgent than `at_most` (None when there is none).
+        """
+        for priority in reversed(Priority):
+            if priority.value < at_most.value:
+                break
+            level = self._levels[priority]
+            if level:
+                item = level.popleft()
+                self.dropped_total += 1
+                self.task_done()  # balance the put so join() still completes
+                return item
+        return None
+
+    def drain_nowait(self) -> List[QueuedTask]:
+        """Remove and return every queued task, most urgent first"""
+        items = []
+        for priority in Priority:
+            level = self._levels[priority]
+            while level:
+                items.append(level.popleft())
+                self.task_done()
+        return items
+
+    def qsize(self) -> int:
+        return sum(len(level) for level in self._levels.values())
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def depth(self) -> Dict[str, int]:
+        """Queue depth per priority level"""
+        return {priority.name: len(level) for priority, level in self._levels.items()}
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-priority depth and wait-time metrics"""
+        wait_stats = {}
+        for priority, waits in self._wait_ms.items():
+            if waits:
+                wait_stats[priority.name] = {
+                    'count': len(waits),
+                    'average': sum(waits) / len(waits),
+                    'max': max(waits)
+                }
+
+        return {
+            'depth': self.depth(),
+            'total': self.qsize(),
+            'maxsize': self.maxsize,
+            'dropped_total': self.dropped_total,
+            'rejected_total': self.rejected_total,
+            'wait_ms': wait_stats
+        }
+
+async def await_results(futures: List[asyncio.Future],
+                        timeout: Optional[float] = None) -> List[TaskResult]:
+    """
+    Await many submitted tasks at once, in submission order.
+    WHY: Bulk producers should not hand-roll gather/timeout handling.
+
+    Futures still pending after `timeout` seconds yield a failed TaskResult
+    (they keep running; the caller simply stops waiting for them).
+    """
+    if futures:
+        await asyncio.wait(futures, timeout=timeout)
+
+    results = []
+    for future in futures:
+        if future.done() and not future.cancelled():
+            results.append(future.result())
+        else:
+            results.append(TaskResult(
+                success=False,
+                data=None,
+                error="Timed out waiting for task result" if not future.cancelled() else "Task cancelled",
+                duration_ms=(timeout or 0) * 1000,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            ))
+    return results
+
+def merge_docs_tasks(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fold update_docs tasks into one devlog write plus one status refresh"""
+    return {'type': 'update_docs', 'entries': [task.get('content', '') for task in tasks]}
+
+def merge_metric_tasks(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fold performance_check tasks into one batched metric record"""
+    return {
+        'type': 'performance_check',
+        'metrics': [(task.get('metric_name'), task.get('value')) for task in tasks]
+    }
+
+class TaskCoalescer:
+    """
+    Coalescing stage in front of the task queue.
+    WHY: A burst of redundant work should cost one write, not N.
+
+    Mergeable task types are buffered for `window_ms` and flushed as one
+    batched task whose result fans out to every caller. Idempotent task
+    types that are already waiting in the queue are collapsed onto the
+    queued instance instead of being queued again.
+    """
+
+    MERGEABLE: Dict[str, Callable[[List[Dict[str, Any]]], Dict[str, Any]]] = {
+        'update_docs': merge_docs_tasks,
+        'performance_check': merge_metric_tasks,
+    }
+    # Same type and arguments -> same outcome, so one run can answer every
+    # identical request still waiting: security_test is a pure check of its
+    # input and update_status rewrites the status file from current state.
+    # create_epic is neither merged nor collapsed - each call creates an epic.
+    IDEMPOTENT = {'security_test', 'update_status'}
+
+    def __init__(self, sink: Callable[[QueuedTask], Awaitable[bool]],
+                 window_ms: float = 50.0, max_batch: int = 100):
+        self.sink = sink  # enqueues a task, returns False if it was not accepted
+        self.window_ms = window_ms
+        self.max_batch = max_batch
+        self.merged_total = 0
+        self.collapsed_total = 0
+
+        self._batches: Dict[str, List[QueuedTask]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._pending: Dict[str, QueuedTask] = {}
+        self._flushes: set = set()
+
+    async def submit(self, queued: QueuedTask) -> None:
+        """Merge, collapse or pass the task through to the sink"""
+        task_type = queued.task.get('type')
+
+        if task_type in self.MERGEABLE and self.window_ms > 0:
+            batch = self._batches.setdefault(task_type, [])
+            batch.append(queued)
+            if len(batch) >= self.max_batch:
+                await self.flush(task_type)
+            elif task_type not in self._timers:
+                self._timers[task_type] = asyncio.get_running_loop().call_later(
+                    self.window_ms / 1000, self._schedule_flush, task_type
+                )
+            return
+
+        if task_type in self.IDEMPOTENT:
+            key = self.collapse_key(queued.task)
+            pending = self._pending.get(key)
+            if pending is not None:
+                pending.futures.extend(queued.futures)
+                self.collapsed_total += 1
+                return
+            queued.coalesce_key = key
+            if await self.sink(queued):
+                self._pending[key] = queued
+            return
+
+        await self.sink(queued)
+
+    @staticmethod
+    def collapse_key(task: Dict[str, Any]) -> str:
+        """Identity of an idempotent task: its type and arguments, not its priority"""
+        args = {key: value for key, value in task.items() if key != 'priority'}
+        return json.dumps(args, sort_keys=True, default=str)
+
+    def forget(self, queued: QueuedTask) -> None:
+        """Stop collapsing onto a task once it has left the queue"""
+        if queued.coalesce_key and self._pending.get(queued.coalesce_key) is queued:
+            del self._pending[queued.coalesce_key]
+
+    def _schedule_flush(self, task_type: str) -> None:
+        flush = asyncio.ensure_future(self.flush(task_type))
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+
+    async def flush(self, task_type: str) -> None:
+        """Send the buffered batch for one task type as a single task"""
+        timer = self._timers.pop(task_type, None)
+        if timer:
+            timer.cancel()
+        batch = self._batches.pop(task_type, [])
+        if not batch:
+            return
+
+        if len(batch) == 1:
+            await self.sink(batch[0])
+            return
+
+        merged = self.MERGEABLE[task_type]([queued.task for queued in batch])
+        merged['batch_size'] = len(batch)
+        self.merged_total += len(batch) - 1
+        await self.sink(QueuedTask(
+            task=merged,
+            priority=min((queued.priority for queued in batch), key=lambda p: p.value),
+            enqueued_at=min(queued.enqueued_at for queued in batch),
+            futures=[future for queued in batch for future in queued.futures]
+        ))
+
+    async def flush_all(self) -> None:
+        """Flush every open batch now (e.g. before shutdown)"""
+        for task_type in list(self._batches):
+            await self.flush(task_type)
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'window_ms': self.window_ms,
+            'open_batches': {task_type: len(batch) for task_type, batch in self._batches.items()},
+            'merged_total': self.merged_total,
+            'collapsed_total': self.collapsed_total
+        }
+
+class WorkerPool:
+    """
+    Event-driven, autoscaling worker pool.
+    WHY: Idle workers should cost nothing; bursts should get more parallelism.
+
+    Core workers block on queue.get() without polling. Every put wakes the
+    scaler, which adds workers while the backlog per idle worker or the
+    observed task latency is above target. Extra workers retire after
+    `idle_ttl_s` without work. Shutdown drains the queue for a bounded time,
+    then cancels; tasks interrupted mid-run are handed back to the caller.
+    """
+
+    LATENCY_SMOOTHING = 0.2  # EWMA weight of the newest observation
+
+    def __init__(self, queue: PriorityTaskQueue,
+                 handler: Callable[[QueuedTask], Awaitable[Any]],
+                 min_workers: int = 3, max_workers: int = 8,
+                 scale_up_depth: int = 4, latency_target_ms: float = 200.0,
+                 idle_ttl_s: float = 30.0):
+        self.queue = queue
+        self.handler = handler
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.scale_up_depth = max(1, scale_up_depth)
+        self.latency_target_ms = latency_target_ms
+        self.idle_ttl_s = idle_ttl_s
+
+        self.workers: Dict[str, asyncio.Task] = {}
+        self.busy = 0
+        self.latency_ewma_ms = 0.0
+        self.spawned_total = 0
+        self.retired_total = 0
+        self.interrupted: List[QueuedTask] = []
+        self._ids = itertools.count()
+        self._started = False
+
+    def start(self) -> None:
+        """Start core workers and subscribe to queue puts"""
+        self._started = True
+        self.queue.on_put = self.maybe_scale
+        for _ in range(self.min_workers):
+            self._spawn(core=True)
+
+    def _spawn(self, core: bool) -> None:
+        worker_id = f"worker-{next(self._ids)}"
+        self.workers[worker_id] = asyncio.get_running_loop().create_task(
+            self._worker(worker_id, core)
+        )
+        self.spawned_total += 1
+        logger.debug(f"Spawned {'core' if core else 'extra'} worker {worker_id}")
+
+    def desired_workers(self) -> int:
+        """Worker count needed for the current backlog and latency"""
+        idle = len(self.workers) - self.busy
+        backlog = self.queue.qsize()
+        if backlog <= idle:
+            return len(self.workers)
+
+        desired = self.busy + -(-backlog // self.scale_up_depth)  # ceil division
+        if self.latency_ewma_ms > self.latency_target_ms:
+            desired += 1
+        return min(self.max_workers, max(self.min_workers, desired, len(self.workers)))
+
+    def maybe_scale(self) -> None:
+        """Scale up on demand - called on every put, never on a timer"""
+        if not self._started:
+            return
+        for _ in range(self.desired_workers() - len(self.workers)):
+            self._spawn(core=False)
+
+    async def _worker(self, worker_id: str, core: bool) -> None:
+        """Process queued tasks; extra workers retire when idle"""
+        try:
+            while True:
+                if core:
+                    queued = await self.queue.get()
+                else:
+                    try:
+                        queued = await asyncio.wait_for(self.queue.get(), timeout=self.idle_ttl_s)
+                    except asyncio.TimeoutError:
+                        self.retired_total += 1
+                        logger.debug(f"Worker {worker_id} retired after {self.idle_ttl_s}s idle")
+                        return
+
+                self.busy += 1
+                start_time = time.perf_counter()
+                try:
+                    await self.handler(queued)
+                except asyncio.CancelledError:
+                    self.interrupted.append(queued)
+                    raise
+                except Exception as e:
+                    logger.error(f"Worker {worker_id} error: {e}")
+                finally:
+                    self.busy -= 1
+                    self.queue.task_done()
+                    latency_ms = queued.wait_ms + (time.perf_counter() - start_time) * 1000
+                    self.latency_ewma_ms += self.LATENCY_SMOOTHING * (latency_ms - self.latency_ewma_ms)
+        finally:
+            self.workers.pop(worker_id, None)
+
+    async def drain(self, timeout_s: float) -> bool:
+        """Let workers finish queued work for up to `timeout_s`; True if the queue emptied"""
+        if not self._started:
+            return self.queue.empty()
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout=timeout_s)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def stop(self) -> None:
+        """Cancel all workers and wait for them to exit"""
+        self._started = False
+        self.queue.on_put = None
+        workers = list(self.workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, utilization and latency"""
+        return {
+            'workers': len(self.workers),
+            'busy': self.busy,
+            'min_workers': self.min_workers,
+            'max_workers': self.max_workers,
+            'latency_ewma_ms': self.latency_ewma_ms,
+            'spawned_total': self.spawned_total,
+            'retired_total': self.retired_total,
+            'interrupted_total': len(self.interrupted)
+        }
+
+# ============================================================================
+# STARTUP SEQUENCE - Dependency graph of async steps
+# ============================================================================
+
+@dataclass(frozen=True)
+class StartupStep:
+    """One startup step and the steps that must finish before it"""
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    requires: tuple = ()
+
+class StartupGraph:
+    """
+    Run startup steps on demand, each at most once, dependencies first.
+    WHY: Independent steps (git freshness, gh probe, directories) overlap
+    instead of queueing behind each other, and a command only waits for
+    the steps it actually needs.
+    """
+    
+    def __init__(self, steps: List[StartupStep],
+                 on_timing: Optional[Callable[[str, float], None]] = None):
+        self.steps = {step.name: step for step in steps}
+        self.on_timing = on_timing
+        self.timings: Dict[str, float] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._check_acyclic()
+    
+    def _check_acyclic(self) -> None:
+        visiting, done = set(), set()
+        
+        def visit(name: str) -> None:
+            if name not in self.steps:
+                raise ValueError(f"Unknown startup step: {name}")
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Startup step cycle through: {name}")
+            visiting.add(name)
+            for required in self.steps[name].requires:
+                visit(required)
+            visiting.discard(name)
+            done.add(name)
+        
+        for name in self.steps:
+            visit(name)
+    
+    def _schedule(self, name: str) -> asyncio.Task:
+        task = self._tasks.get(name)
+        if task is None:
+            task = self._tasks[name] = asyncio.ensure_future(self._run(self.steps[name]))
+            task.add_done_callback(self._log_failure)
+        return task
+    
+    async def _run(self, step: StartupStep) -> Any:
+        # Shared and memoized: not bound by the deadline of whichever command started it
+        detach_deadline()
+        if step.requires:
+            await asyncio.gather(*(self._schedule(name) for name in step.requires))
+        
+        start_time = time.perf_counter()
+        try:
+            return await step.run()
+        finally:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            self.timings[step.name] = duration_ms
+            if self.on_timing:
+                self.on_timing(step.name, duration_ms)
+    
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Startup step failed: {task.exception()}")
+    
+    async def ensure(self, names: tuple) -> None:
+        """Wait for the named steps (and their dependencies), starting any not yet running"""
+        if names:
+            # Shielded: a command cancelled by its deadline must not cancel shared steps
+            await asyncio.gather(*(asyncio.shield(self._schedule(name)) for name in names))
+    
+    def start(self, names: Optional[tuple] = None) -> None:
+        """Start steps in the background without waiting for them"""
+        for name in (self.steps if names is None else names):
+            self._schedule(name)
+    
+    def done(self, name: str) -> bool:
+        task = self._tasks.get(name)
+        return task is not None and task.done()
+    
+    async def cancel(self) -> None:
+        """Cancel steps still running (e.g. on shutdown)"""
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+# Startup steps a module needs before it can be used
+MODULE_STEPS: Dict[str, tuple] = {
+    'docs': ('dirs', 'git_freshness'),
+    'epics': ('dirs', 'epic_store'),
+    'github': ('gh_probe',),
+}
+
+# ============================================================================
+# MAIN AGENT ORCHESTRATOR
+# ============================================================================
+
+class TrackingEnforcer:
+    """
+    Enforces systematic tracking updates.
+    WHY: Prevents context loss between sessions.
+    
+    ENFORCEMENT RULES:
+    1. Every 3 changes = forced update
+    2. Every 5 minutes = forced update
+    3. Context switch = forced update
+    4. Error occurrence = immediate update
+    """
+    
+    def __init__(self, context: AgentContext):
+        self.context = context
+        self.last_update = time.time()
+        self.pending_updates = []
+        self.update_interval = 300  # 5 minutes
+        self.changes_since_update = 0
+        self.critical_threshold = 3  # Force update after 3 changes
+        self.current_task = None
+        self.task_start_time = None
+    
+    def track_change(self, change_type: str, description: str, **details) -> bool:
+        """
+        Track any significant change.
+        WHY: Every change must be recorded immediately.
+        """
+        self.pending_updates.append({
+            'timestamp': datetime.now(timezone.utc).isoformat(),
             'type': change_type,
             'description': description,
             'details': details
@@ -1203,6 +3642,40 @@ class TrackingEnforcer:
         self.changes_since_update = 0
         self.last_update = time.time()
 
+@dataclass(frozen=True)
+class CommandSpec:
+    """
+    Declarative command definition.
+    WHY: Dispatch is one table lookup, and each command names the modules it needs.
+    """
+    name: str
+    handler: Callable[..., Awaitable[TaskResult]]
+    modules: tuple = ()
+    budget_ms: Optional[float] = None  # None: the configured performance_budget_ms
+
+# Command name -> spec, filled by the @command / @task_handler decorators
+COMMAND_REGISTRY: Dict[str, CommandSpec] = {}
+TASK_REGISTRY: Dict[str, CommandSpec] = {}
+
+def command(name: str, modules: tuple = (), budget_ms: Optional[float] = None,
+            registry: Optional[Dict[str, CommandSpec]] = None):
+    """Register an AgentBoot coroutine method as the handler for `name`"""
+    target = COMMAND_REGISTRY if registry is None else registry
+    
+    def decorator(func):
+        target[name] = CommandSpec(name=name, handler=func, modules=tuple(modules), budget_ms=budget_ms)
+        return func
+    return decorator
+
+def task_handler(name: str, modules: tuple = ()):
+    """Register an AgentBoot coroutine method as the handler for queued tasks of type `name`"""
+    return command(name, modules, registry=TASK_REGISTRY)
+
+# Budget for commands that call GitHub; the deadline is a multiple of it
+NETWORK_BUDGET_MS = 2000
+# Bulk GitHub jobs are rate limited on purpose and legitimately take minutes
+BULK_BUDGET_MS = 15 * 60 * 1000
+
 class AgentBoot:
     """
     Main agent orchestrator - coordinates all modules.
@@ -1224,6 +3697,7 @@ class AgentBoot:
             max_retries=3,
             enable_telemetry=False
         )
+        default_config.update(DEFAULT_TUNING)
         
         # Merge with provided config
         if config:
@@ -1231,20 +3705,150 @@ class AgentBoot:
         
         self.context = AgentContext(config=default_config)
         
-        # Initialize all modules
-        self.docs_manager = DocumentationManager(self.context)
-        self.epic_manager = EpicManager(self.context)
-        self.security_lab = SecurityLab(self.context)
+        # Core modules; feature modules (see MODULES) are built on first use
+        self.probes = ProbeCache(
+            Path(self.context.config['project_root']),
+            self.context.config['cache_ttl_seconds']
+        )
+        self.process_runner = ProcessRunner(
+            self.context.config['process_concurrency'],
+            self.context.config['external_call_timeout_s']
+        )
+        self.resilience = ResilienceLayer(self.context, runner=self.process_runner)
         self.perf_monitor = PerformanceMonitor(self.context)
-        self.github = GitHubIntegration(self.context)
         self.tracking_enforcer = TrackingEnforcer(self.context)
+        self.loop_monitor = LoopLagMonitor(
+            self.perf_monitor,
+            interval_ms=self.context.config['loop_lag_interval_ms'],
+            threshold_ms=self.context.config['loop_lag_threshold_ms']
+        )
         
-        # Task queue for async operations
-        self.task_queue: asyncio.Queue = asyncio.Queue()
-        self.workers: List[asyncio.Task] = []
+        # Priority-ordered task queue for async operations
+        self.task_queue = PriorityTaskQueue(
+            maxsize=self.context.config['task_queue_maxsize'],
+            aging_interval_s=self.context.config['task_aging_interval_s']
+        )
+        self.overflow_policy = OverflowPolicy(self.context.config['queue_overflow_policy'])
+        self.coalescer = TaskCoalescer(
+            self._enqueue,
+            window_ms=self.context.config['coalesce_window_ms']
+        )
+        self.worker_pool = WorkerPool(
+            self.task_queue,
+            self._handle_queued_task,
+            min_workers=self.context.config['min_workers'],
+            max_workers=self.context.config['max_workers'],
+            scale_up_depth=self.context.config['worker_scale_up_depth'],
+            latency_target_ms=self.context.config['performance_budget_ms'],
+            idle_ttl_s=self.context.config['worker_idle_ttl_s']
+        )
         
         # Automatic tracking reminder
         self.tracking_task: Optional[asyncio.Task] = None
+        
+        # Set by the CLI's --profile-startup; module construction reports into it
+        self.profiler: Optional[StartupProfiler] = None
+        
+        # Startup steps run on demand; see MODULE_STEPS
+        self.startup = StartupGraph([
+            StartupStep('dirs', self._step_dirs),
+            StartupStep('git_freshness', self._step_git_freshness),
+            StartupStep('epic_store', self._step_epic_store, requires=('git_freshness',)),
+            StartupStep('gh_probe', self._step_gh_probe),
+        ], on_timing=self._record_startup_timing)
+    
+    # ------------------------------------------------------------------------
+    # Lazily built modules
+    # ------------------------------------------------------------------------
+    
+    # Module name (as declared by commands) -> attribute holding it
+    MODULES = {
+        'docs': 'docs_manager',
+        'epics': 'epic_manager',
+        'security': 'security_lab',
+        'github': 'github',
+    }
+    
+    @cached_property
+    def docs_manager(self) -> DocumentationManager:
+        return self._build_module('docs', DocumentationManager)
+    
+    @cached_property
+    def epic_manager(self) -> 'EpicManager':
+        return self._build_module('epics', lambda context: EpicManager(context, self.resilience, self.github))
+    
+    @cached_property
+    def security_lab(self) -> SecurityLab:
+        return self._build_module('security', SecurityLab)
+    
+    @cached_property
+    def github(self) -> GitHubIntegration:
+        return self._build_module('github', lambda context: GitHubIntegration(context, self.probes, self.resilience))
+    
+    @cached_property
+    def pr_watcher(self) -> PRWatcher:
+        # One per agent, so a daemon keeps its baseline between watch_prs calls
+        config = self.context.config
+        return PRWatcher(self.github, config['pr_watch_min_interval_s'], config['pr_watch_max_interval_s'])
+    
+    def _build_module(self, name: str, factory: Callable[[AgentContext], Any]) -> Any:
+        """Construct a module and record how long it took"""
+        start_time = time.perf_counter()
+        with self.profiler.phase(f"module {name}") if self.profiler else nullcontext():
+            module = factory(self.context)
+        self.context.metrics[f"module_{name}_init_ms"] = (time.perf_counter() - start_time) * 1000
+        logger.debug(f"Loaded module {name}")
+        return module
+    
+    def load_modules(self, names: tuple) -> None:
+        """Make sure the named modules are built"""
+        for name in names:
+            getattr(self, self.MODULES[name])
+    
+    async def prepare_modules(self, names: tuple) -> None:
+        """Run the startup steps the modules need concurrently, then build them"""
+        steps = sorted({step for name in names for step in MODULE_STEPS.get(name, ())})
+        await self.startup.ensure(tuple(steps))
+        self.load_modules(names)
+        if 'github' in names:
+            await self.github.prepare()
+    
+    # ------------------------------------------------------------------------
+    # Startup steps
+    # ------------------------------------------------------------------------
+    
+    async def _step_dirs(self) -> None:
+        project_root = Path(self.context.config['project_root'])
+        for dir_path in (
+            project_root / 'docs' / 'status',
+            project_root / 'docs' / 'roadmap',
+            project_root / 'tests' / 'agent_boot'
+        ):
+            dir_path.mkdir(parents=True, exist_ok=True)
+    
+    async def _step_git_freshness(self) -> bool:
+        # Off unless the CLI turns it on - library use never touches git
+        if not self.context.config['branch_check']:
+            return True
+        return await ensure_correct_branch(self.context.config, self.probes, self.process_runner)
+    
+    async def _step_epic_store(self) -> None:
+        # After git freshness: a checkout or pull may rewrite EPICS.md
+        self.load_modules(('epics',))
+    
+    async def _step_gh_probe(self) -> None:
+        probes = MODULE_PROBES['github']
+        if self.context.config['github_transport'] != 'gh':
+            probes = tuple(name for name in probes if name != 'gh_auth')
+        await self.probes.ensure(probes)
+    
+    def _record_startup_timing(self, step: str, duration_ms: float) -> None:
+        self.context.metrics[f"startup_{step}_ms"] = duration_ms
+    
+    @property
+    def loaded_modules(self) -> List[str]:
+        """Names of modules built so far in this session"""
+        return [name for name, attr in self.MODULES.items() if attr in self.__dict__]
     
     async def initialize(self) -> None:
         """
@@ -1260,20 +3864,18 @@ class AgentBoot:
             if not project_root.exists():
                 raise FileNotFoundError(f"Project root not found: {project_root}")
             
-            # Create required directories
-            required_dirs = [
-                project_root / 'docs' / 'status',
-                project_root / 'docs' / 'roadmap',
-                project_root / 'tests' / 'agent_boot'
-            ]
+            # Directories are cheap and fail fast; other steps wait for a command
+            await self.startup.ensure(('dirs',))
+            
+            # Watch for blocking calls on the shared event loop
+            if self.context.config['loop_lag_monitor']:
+                self.loop_monitor.start()
             
-            for dir_path in required_dirs:
-                dir_path.mkdir(parents=True, exist_ok=True)
+            # Start core workers; the pool scales up on demand
+            self.worker_pool.start()
             
-            # Start worker tasks
-            for i in range(3):  # 3 concurrent workers
-                worker = asyncio.create_task(self._task_worker(f"worker-{i}"))
-                self.workers.append(worker)
+            # Work left unfinished by the previous shutdown goes first
+            await self._replay_spill()
             
             self.context.status = AgentStatus.READY
             logger.info("Agent Boot initialized successfully")
@@ -1288,54 +3890,143 @@ class AgentBoot:
             logger.error(f"Initialization failed: {e}")
             raise
     
-    async def _task_worker(self, worker_id: str) -> None:
+    @property
+    def workers(self) -> List[asyncio.Task]:
+        """Currently running worker tasks"""
+        return list(self.worker_pool.workers.values())
+    
+    async def _handle_queued_task(self, queued: QueuedTask) -> None:
         """
-        Background task worker for async operations.
+        Worker pool handler for one dequeued task.
         WHY: Concurrent processing improves throughput.
         """
-        logger.debug(f"Worker {worker_id} started")
+        logger.debug(f"Processing task: {queued.task.get('type')}")
+        self.coalescer.forget(queued)
+        await self.perf_monitor.record_metric(
+            f"queue_wait_{queued.priority.name.lower()}_ms",
+            queued.wait_ms
+        )
+        start_time = time.perf_counter()
+        result = await self._process_task(queued.task)
+        result['duration_ms'] = (time.perf_counter() - start_time) * 1000
+        queued.resolve(result)
+    
+    async def submit(self, task: Dict[str, Any]) -> asyncio.Future:
+        """
+        Queue a task and return a future for its TaskResult.
+        WHY: Producers get results and backpressure instead of silent loss.
         
-        while self.context.status not in [AgentStatus.SHUTTING_DOWN, AgentStatus.ERROR]:
+        When the bounded queue is full the configured OverflowPolicy decides:
+        BLOCK waits for space, DROP_OLDEST evicts the oldest least urgent task
+        (its future resolves to a failure) unless every queued task is more
+        urgent than the new one, REJECT fails the new task at once.
+        """
+        future = asyncio.get_running_loop().create_future()
+        queued = QueuedTask(task=task, priority=task_priority(task), futures=[future])
+        if self.context.status in (AgentStatus.SHUTTING_DOWN, AgentStatus.COMPLETED):
+            queued.resolve(self._overflow_result("Rejected: agent is shutting down"))
+            return future
+        await self.coalescer.submit(queued)
+        return future
+    
+    async def _enqueue(self, queued: QueuedTask) -> bool:
+        """Put a task on the bounded queue, applying the overflow policy"""
+        if self.overflow_policy == OverflowPolicy.BLOCK or not self.task_queue.full():
+            await self.task_queue.put(queued)
+            return True
+            
+        if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+            # Never make room by dropping work more urgent than the new task
+            dropped = self.task_queue.evict_oldest(at_most=queued.priority)
+            if dropped:
+                logger.warning(f"Task queue full - dropped queued task: {dropped.task.get('type')}")
+                self.coalescer.forget(dropped)
+                dropped.resolve(self._overflow_result("Dropped: task queue overflow"))
+                self.task_queue.put_nowait(queued)
+                return True
+            
+        self.task_queue.rejected_total += 1
+        logger.warning(f"Task queue full - rejected task: {queued.task.get('type')}")
+        queued.resolve(self._overflow_result("Rejected: task queue full"))
+        return False
+    
+    async def submit_many(self, tasks: List[Dict[str, Any]]) -> List[asyncio.Future]:
+        """Submit tasks in order; pair with await_results() to collect them"""
+        return [await self.submit(task) for task in tasks]
+    
+    @property
+    def spill_path(self) -> Path:
+        return Path(self.context.config['project_root']) / self.context.config['task_spill_path']
+    
+    def _spill_tasks(self, items: List[QueuedTask]) -> int:
+        """
+        Append unfinished tasks to the spill file for the next start.
+        WHY: A shutdown under load must not silently drop queued writes.
+        """
+        if not items:
+            return 0
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spill_path, 'a') as f:
+            for queued in items:
+                task = dict(queued.task, priority=queued.priority.name)
+                f.write(json.dumps({'session_id': self.context.session_id, 'task': task}, default=str) + '\n')
+                queued.resolve(TaskResult(
+                    success=False,
+                    data={'spilled': True},
+                    error="Deferred: unfinished at shutdown, replayed on next start",
+                    duration_ms=0,
+                    timestamp=datetime.now(timezone.utc).isoformat()
+                ))
+        logger.warning(f"Spilled {len(items)} unfinished tasks to {self.spill_path}")
+        return len(items)
+    
+    async def _replay_spill(self) -> int:
+        """Resubmit tasks spilled by the previous shutdown (at-least-once)"""
+        try:
+            lines = self.spill_path.read_text().splitlines()
+        except FileNotFoundError:
+            return 0
+        # Removed before resubmitting: a second crash re-spills what is still queued
+        self.spill_path.unlink()
+        
+        replayed = 0
+        for line in lines:
             try:
-                # Wait for task with timeout
-                task = await asyncio.wait_for(self.task_queue.get(), timeout=1.0)
-                
-                # Process task
-                logger.debug(f"Worker {worker_id} processing task: {task.get('type')}")
-                await self._process_task(task)
-                
-            except asyncio.TimeoutError:
-                continue  # No task available, continue waiting
-            except Exception as e:
-                logger.error(f"Worker {worker_id} error: {e}")
+                task = json.loads(line)['task']
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"Skipping unreadable spilled task: {line[:80]}")
+                continue
+            await self.submit(task)
+            replayed += 1
+        
+        self.context.metrics['tasks_replayed'] = replayed
+        logger.info(f"Replayed {replayed} tasks spilled by the previous session")
+        return replayed
     
-    async def _process_task(self, task: Dict[str, Any]) -> None:
+    @staticmethod
+    def _overflow_result(error: str) -> TaskResult:
+        return TaskResult(
+            success=False,
+            data=None,
+            error=error,
+            duration_ms=0,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+    
+    async def _process_task(self, task: Dict[str, Any]) -> TaskResult:
         """Process individual task with error recovery"""
         task_type = task.get('type')
         
         try:
-            if task_type == 'update_docs':
-                await self.docs_manager.update_devlog(task.get('content', ''))
-                await self.docs_manager.update_system_status()
-                
-            elif task_type == 'create_epic':
-                await self.epic_manager.create_epic(
-                    task.get('title'),
-                    task.get('description')
-                )
-                
-            elif task_type == 'security_test':
-                await self.security_lab.test_input_validation(
-                    task.get('input', '')
-                )
-                
-            elif task_type == 'performance_check':
-                await self.perf_monitor.record_metric(
-                    task.get('metric_name'),
-                    task.get('value')
-                )
-                
-            self.context.tasks_completed.append(task_type)
+            spec = TASK_REGISTRY.get(task_type)
+            if spec is None:
+                raise ValueError(f"Unknown task type: {task_type}")
+            
+            await self.prepare_modules(spec.modules)
+            result = await spec.handler(self, task)
+            
+            self.context.tasks_completed.extend([task_type] * task.get('batch_size', 1))
+            return result
             
         except Exception as e:
             logger.error(f"Task processing failed: {e}")
@@ -1344,6 +4035,62 @@ class AgentBoot:
                 'task': task_type,
                 'error': str(e)
             })
+            return TaskResult(
+                success=False,
+                data=None,
+                error=str(e),
+                duration_ms=0,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            )
+    
+    # ------------------------------------------------------------------------
+    # Task handlers (queued work)
+    # ------------------------------------------------------------------------
+    
+    @task_handler('update_docs', modules=('docs',))
+    async def _task_update_docs(self, task: Dict[str, Any]) -> TaskResult:
+        # Coalesced batches carry several entries - still one write
+        content = '\n\n'.join(task['entries']) if 'entries' in task else task.get('content', '')
+        result = await self.docs_manager.update_devlog(content)
+        await self.docs_manager.update_system_status()
+        return result
+    
+    @task_handler('update_status', modules=('docs',))
+    async def _task_update_status(self, task: Dict[str, Any]) -> TaskResult:
+        return await self.docs_manager.update_system_status()
+    
+    @task_handler('create_epic', modules=('epics',))
+    async def _task_create_epic(self, task: Dict[str, Any]) -> TaskResult:
+        return await self.epic_manager.create_epic(
+            task.get('title'),
+            task.get('description')
+        )
+    
+    @task_handler('security_test', modules=('security',))
+    async def _task_security_test(self, task: Dict[str, Any]) -> TaskResult:
+        return await self.security_lab.test_input_validation(
+            task.get('input', '')
+        )
+    
+    @task_handler('performance_check')
+    async def _task_performance_check(self, task: Dict[str, Any]) -> TaskResult:
+        batch = task.get('metrics') or [(task.get('metric_name'), task.get('value'))]
+        await self.perf_monitor.record_metrics(batch)
+        return TaskResult(
+            success=True,
+            data={'recorded': len(batch)},
+            error=None,
+            duration_ms=0,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+    
+    def command_deadline_ms(self, command: str, deadline_ms: Optional[float] = None) -> Optional[float]:
+        """The deadline execute_command enforces: the caller's, else budget x command_deadline_factor"""
+        spec = COMMAND_REGISTRY.get(command)
+        factor = self.context.config['command_deadline_factor']
+        if deadline_ms is not None or spec is None or not factor:
+            return deadline_ms
+        return (spec.budget_ms or self.context.config['performance_budget_ms']) * factor
     
     async def execute_command(self, command: str, **kwargs) -> TaskResult:
         """
@@ -1351,103 +4098,53 @@ class AgentBoot:
         WHY: Command pattern enables extensibility.
         """
         start_time = time.perf_counter()
+        deadline_ms = kwargs.pop('deadline_ms', None)
         
         try:
-            if command == "update_docs":
-                # Update all documentation
-                result = await self.docs_manager.update_devlog(kwargs.get('content', 'Session update'))
-                await self.docs_manager.update_system_status()
-                
-            elif command == "create_epic":
-                result = await self.epic_manager.create_epic(
-                    kwargs.get('title'),
-                    kwargs.get('description')
-                )
-                # Optionally create GitHub issue
-                if kwargs.get('create_issue', False) and result['success']:
-                    epic_id = result['data']['id']
-                    epic = self.epic_manager.epics.get(epic_id)
-                    if epic:
-                        github_result = await self.github.create_issue_from_epic(epic)
-                        result['data']['github_issue'] = github_result['data']
-                        if github_result['success'] and github_result['data']:
-                            # Store the issue number for future updates
-                            self.epic_manager.github_issues[epic_id] = github_result['data'].get('issue_number')
-                
-            elif command == "update_epic":
-                result = await self.epic_manager.update_epic(
-                    kwargs.get('epic_id'),
-                    status=kwargs.get('status'),
-                    completion=kwargs.get('completion')
-                )
-                
-            elif command == "list_epics":
-                result = await self.epic_manager.list_epics()
-                
-            elif command == "sync_github":
-                result = await self.epic_manager.sync_with_github()
-                
-            elif command == "test_security":
-                result = await self.security_lab.test_input_validation(
-                    kwargs.get('input', '')
-                )
-                
-            elif command == "performance_report":
-                report = self.perf_monitor.get_performance_report()
-                result = TaskResult(
-                    success=True,
-                    data=report,
-                    error=None,
-                    duration_ms=(time.perf_counter() - start_time) * 1000,
-                    timestamp=datetime.now(timezone.utc).isoformat()
-                )
-                
-            elif command == "github_status":
-                # Check GitHub PR and issue status
-                pr_status = await self.github.check_pr_status()
-                result = TaskResult(
-                    success=True,
-                    data={
-                        'pr_status': pr_status['data'] if pr_status['success'] else None,
-                        'github_available': self.github.gh_available
-                    },
-                    error=pr_status.get('error'),
-                    duration_ms=(time.perf_counter() - start_time) * 1000,
-                    timestamp=datetime.now(timezone.utc).isoformat()
-                )
-                
-            elif command == "workflow_status":
-                # Get comprehensive workflow status
-                workflow_data = {
-                    'session': self.context.to_dict(),
-                    'performance': self.perf_monitor.get_performance_report(),
-                    'github': {'available': self.github.gh_available}
-                }
-                
-                if self.github.gh_available:
-                    pr_status = await self.github.check_pr_status()
-                    if pr_status['success']:
-                        workflow_data['github']['prs'] = pr_status['data']
-                
-                result = TaskResult(
-                    success=True,
-                    data=workflow_data,
-                    error=None,
-                    duration_ms=(time.perf_counter() - start_time) * 1000,
-                    timestamp=datetime.now(timezone.utc).isoformat()
-                )
-                
-            else:
+            spec = COMMAND_REGISTRY.get(command)
+            if spec is None:
                 raise ValueError(f"Unknown command: {command}")
             
+            budget_ms = spec.budget_ms or self.context.config['performance_budget_ms']
+            deadline_ms = self.command_deadline_ms(command, deadline_ms)
+            deadline_s = deadline_ms / 1000 if deadline_ms else None
+            
+            async def run() -> TaskResult:
+                try:
+                    await self.prepare_modules(spec.modules)
+                    return await spec.handler(self, **kwargs)
+                except asyncio.TimeoutError as e:
+                    # A subprocess or socket timing out, not the deadline (wait_for
+                    # cancels run() instead): report it as an ordinary failure
+                    raise ExternalCallError(str(e) or "Operation timed out", transient=True) from e
+            
+            # The deadline is set before wait_for copies the context into its task,
+            # so subprocesses started by the handler inherit it
+            with deadline_scope(deadline_s):
+                result = await asyncio.wait_for(run(), timeout=deadline_s)
+            result['duration_ms'] = (time.perf_counter() - start_time) * 1000
+            
             # Record performance metric
             await self.perf_monitor.record_metric(
                 f"command_{command}_ms",
-                (time.perf_counter() - start_time) * 1000
+                result['duration_ms']
             )
+            if result['duration_ms'] > budget_ms:
+                await self.perf_monitor.record_budget_violation(command, result['duration_ms'], budget_ms)
             
             return result
             
+        except asyncio.TimeoutError:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            await self.perf_monitor.record_budget_violation(command, duration_ms, budget_ms, timed_out=True)
+            return TaskResult(
+                success=False,
+                data={'command': command, 'timed_out': True, 'deadline_ms': deadline_ms},
+                error=f"Command {command} timed out after {deadline_ms:.0f}ms",
+                duration_ms=duration_ms,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            )
+            
         except Exception as e:
             logger.error(f"Command execution failed: {command} - {e}")
             return TaskResult(
@@ -1458,35 +4155,455 @@ class AgentBoot:
                 timestamp=datetime.now(timezone.utc).isoformat()
             )
     
+    # ------------------------------------------------------------------------
+    # Command handlers
+    # ------------------------------------------------------------------------
+    
+    @command('update_docs', modules=('docs',))
+    async def _cmd_update_docs(self, **kwargs) -> TaskResult:
+        # Update all documentation
+        result = await self.docs_manager.update_devlog(kwargs.get('content', 'Session update'))
+        await self.docs_manager.update_system_status()
+        return result
+    
+    @command('create_epic', modules=('epics',), budget_ms=NETWORK_BUDGET_MS)
+    async def _cmd_create_epic(self, **kwargs) -> TaskResult:
+        result = await self.epic_manager.create_epic(
+            kwargs.get('title'),
+            kwargs.get('description')
+        )
+        # Optionally create GitHub issue
+        if kwargs.get('create_issue', False) and result['success']:
+            epic_id = result['data']['id']
+            epic = self.epic_manager.epics.get(epic_id)
+            if epic:
+                github_result = await self.github.create_issue_from_epic(epic)
+                result['data']['github_issue'] = github_result['data']
+                if github_result['success'] and github_result['data']:
+                    # Store the issue number for future updates
+                    self.epic_manager.link_issue(epic_id, github_result['data']['issue_number'])
+        return result
+    
+    @command('update_epic', modules=('epics',), budget_ms=NETWORK_BUDGET_MS)
+    async def _cmd_update_epic(self, **kwargs) -> TaskResult:
+        epic_id = kwargs.get('epic_id')
+        if not epic_id and kwargs.get('title'):
+            epic = self.epic_manager.find_epic_by_title(kwargs['title'])
+            if epic is None:
+                raise ValueError(f"Epic not found with title '{kwargs['title']}'")
+            epic_id = epic.id
+        return await self.epic_manager.update_epic(
+            epic_id,
+            status=kwargs.get('status'),
+            completion=kwargs.get('completion')
+        )
+    
+    @command('list_epics', modules=('epics',))
+    async def _cmd_list_epics(self, **kwargs) -> TaskResult:
+        return await self.epic_manager.list_epics(
+            status=kwargs.get('status'),
+            tag=kwargs.get('tag'),
+            priority=kwargs.get('priority')
+        )
+    
+    @command('sync_github', modules=('epics',), budget_ms=NETWORK_BUDGET_MS)
+    async def _cmd_sync_github(self, **kwargs) -> TaskResult:
+        return await self.epic_manager.sync_with_github(full=bool(kwargs.get('full', False)))
+    
+    @command('bulk_create_issues', modules=('epics', 'github'), budget_ms=BULK_BUDGET_MS)
+    async def _cmd_bulk_create_issues(self, **kwargs) -> TaskResult:
+        # One issue per epic not yet linked to one; safe to rerun after an abort
+        config = self.context.config
+        epics = {
+            epic_id: epic for epic_id, epic in self.epic_manager.epics.items()
+            if epic_id not in self.epic_manager.github_issues
+        }
+        creator = BulkIssueCreator(
+            self.github,
+            Path(config['project_root']) / config['bulk_issue_journal_path'],
+            concurrency=config['bulk_issue_concurrency'],
+            rate_per_min=config['bulk_issue_rate_per_min'],
+            burst=config['bulk_issue_burst']
+        )
+        summary = await creator.run([IssueSpec(epic_id, *self.github.epic_issue(epic)) for epic_id, epic in epics.items()])
+        for epic_id, entry in summary.pop('issues').items():
+            if epic_id in epics:
+                self.epic_manager.link_issue(epic_id, entry['issue_number'])
+        return TaskResult(
+            success=not summary['failed'],
+            data=summary,
+            error=f"{summary['failed']} issues could not be created" if summary['failed'] else None,
+            duration_ms=0,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+    
+    @command('test_security', modules=('security',))
+    async def _cmd_test_security(self, **kwargs) -> TaskResult:
+        return await self.security_lab.test_input_validation(
+            kwargs.get('input', '')
+        )
+    
+    @command('session')
+    async def _cmd_session(self, **kwargs) -> TaskResult:
+        return TaskResult(
+            success=True,
+            data=self.context.to_dict(),
+            error=None,
+            duration_ms=0,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+    
+    @command('performance_report')
+    async def _cmd_performance_report(self, **kwargs) -> TaskResult:
+        report = self.perf_monitor.get_performance_report()
+        report['event_loop'] = self.loop_monitor.get_report()
+        report['task_queue'] = self.task_queue.stats()
+        report['worker_pool'] = self.worker_pool.stats()
+        report['coalescing'] = self.coalescer.stats()
+        report['resilience'] = self.resilience.stats()
+        report['processes'] = self.process_runner.stats()
+        if 'github' in self.loaded_modules:
+            report['github_transport'] = self.github.transport.stats()
+            report['graphql_batching'] = self.github.batcher.stats()
+            if self.github.cache is not None:
+                report['github_cache'] = self.github.cache.stats()
+        if 'pr_watcher' in self.__dict__:
+            report['pr_watcher'] = self.pr_watcher.stats()
+        report['modules_loaded'] = self.loaded_modules
+        return TaskResult(
+            success=True,
+            data=report,
+            error=None,
+            duration_ms=0,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+    
+    @command('github_status', modules=('github',), budget_ms=NETWORK_BUDGET_MS)
+    async def _cmd_github_status(self, **kwargs) -> TaskResult:
+        # Check GitHub PR and issue status
+        pr_status = await self.github.check_pr_status()
+        return TaskResult(
+            success=True,
+            data={
+                'pr_status': pr_status['data'] if pr_status['success'] else None,
+                'github_available': self.github.gh_available
+            },
+            error=pr_status.get('error'),
+            duration_ms=0,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+    
+    @command('watch_prs', modules=('github',), budget_ms=BULK_BUDGET_MS)
+    async def _cmd_watch_prs(self, **kwargs) -> TaskResult:
+        # Collect PR/CI change events for duration_s (or until max_events)
+        if not self.github.gh_available:
+            return self.github._unavailable()
+        duration_s = float(kwargs.get('duration_s') or 60.0)
+        max_events = kwargs.get('max_events')
+        events = []
+        
+        async def collect():
+            async for event in self.pr_watcher.events():
+                events.append(event)
+                if max_events and len(events) >= max_events:
+                    return
+        
+        try:
+            await asyncio.wait_for(collect(), duration_s)
+        except asyncio.TimeoutError:
+            pass
+        return TaskResult(
+            success=True,
+            data={'events': events, 'watcher': self.pr_watcher.stats()},
+            error=None,
+            duration_ms=0,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+    
+    @command('workflow_status', modules=('github',), budget_ms=NETWORK_BUDGET_MS)
+    async def _cmd_workflow_status(self, **kwargs) -> TaskResult:
+        # Get comprehensive workflow status
+        workflow_data = {
+            'session': self.context.to_dict(),
+            'performance': self.perf_monitor.get_performance_report(),
+            'task_queue': self.task_queue.stats(),
+            'worker_pool': self.worker_pool.stats(),
+            'github': {'available': self.github.gh_available}
+        }
+        
+        if self.github.gh_available:
+            # Issued together, both reads go out as one batched GraphQL request
+            pr_status, issue_counts = await asyncio.gather(
+                self.github.check_pr_status(),
+                self.github.issue_counts(),
+                return_exceptions=True
+            )
+            if not isinstance(pr_status, BaseException) and pr_status['success']:
+                workflow_data['github']['prs'] = pr_status['data']
+            if not isinstance(issue_counts, BaseException):
+                workflow_data['github']['issues'] = issue_counts
+        
+        return TaskResult(
+            success=True,
+            data=workflow_data,
+            error=None,
+            duration_ms=0,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+    
     async def shutdown(self) -> None:
         """
         Graceful shutdown with cleanup.
         WHY: Clean shutdown prevents data corruption.
         """
         logger.info("Initiating Agent Boot shutdown")
-        self.context.status = AgentStatus.SHUTTING_DOWN
-        
-        # Cancel all workers
-        for worker in self.workers:
-            worker.cancel()
+        self.context.status = AgentStatus.SHUTTING_DOWN  # submit() now rejects new tasks
+        await self.coalescer.flush_all()
         
-        # Wait for workers to finish
-        await asyncio.gather(*self.workers, return_exceptions=True)
+        # Drain queued work for a bounded time, then stop the workers and
+        # spill whatever is left (including tasks interrupted mid-run)
+        drain_start = time.perf_counter()
+        drained = await self.worker_pool.drain(self.context.config['drain_timeout_s'])
+        self.context.metrics['shutdown_drain_ms'] = (time.perf_counter() - drain_start) * 1000
+        await self.worker_pool.stop()
+        spilled = self._spill_tasks(self.worker_pool.interrupted + self.task_queue.drain_nowait())
+        if not drained:
+            logger.warning(f"Drain deadline passed with work outstanding - {spilled} tasks spilled")
+        if 'epics' in self.loaded_modules:
+            await self.epic_manager.flush_progress()
+        if 'pr_watcher' in self.__dict__:
+            await self.pr_watcher.stop()
+        await self.startup.cancel()
+        await self.loop_monitor.stop()
+        if 'github' in self.loaded_modules:
+            if self.github.cache is not None:
+                await self.github.cache.wait(self.context.config['drain_timeout_s'])
+                self.github.cache.save()
+            self.github.transport.close()
         
         # Final status update
         await self.docs_manager.update_system_status()
+        self.context.flush()
         
         # Generate final report
         final_report = {
             'session_id': self.context.session_id,
-            'tasks_completed': len(self.context.tasks_completed),
-            'errors': len(self.context.errors),
+            'tasks_completed': self.context.tasks_completed.total,
+            'errors': self.context.errors.total,
+            'tasks_spilled': spilled,
             'performance': self.perf_monitor.get_performance_report()
         }
         
         logger.info(f"Agent Boot shutdown complete: {json.dumps(final_report, indent=2)}")
         self.context.status = AgentStatus.COMPLETED
 
+# ============================================================================
+# DAEMON MODE - Keep a warm agent between CLI invocations
+# ============================================================================
+
+DAEMON_SHUTDOWN = '__shutdown__'
+
+def default_socket_path(project_root: Union[str, Path]) -> Path:
+    return Path(project_root) / '.agent_boot' / 'agent.sock'
+
+class AgentDaemon:
+    """
+    Serve one long-lived AgentBoot over a Unix socket.
+    WHY: Every CLI call otherwise pays interpreter start, config load, git
+    checks and module construction; the daemon pays them once and keeps
+    caches, metrics and the worker pool warm across calls.
+    
+    Protocol: one JSON object per line, {"command": ..., "kwargs": {...}},
+    answered with one TaskResult per line. Connections may send many requests.
+    With "ack": true the request is first acknowledged with
+    {"accepted": true, "deadline_ms": ...}, the deadline this daemon enforces.
+    """
+    
+    def __init__(self, agent: AgentBoot, socket_path: Union[str, Path]):
+        self.agent = agent
+        self.socket_path = Path(socket_path)
+        self.requests_served = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stopped = asyncio.Event()
+    
+    async def start(self) -> None:
+        if not hasattr(asyncio, 'start_unix_server'):
+            raise RuntimeError("Daemon mode requires Unix domain sockets")
+        
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path).available():
+                raise RuntimeError(f"Daemon already running on {self.socket_path}")
+            self.socket_path.unlink()  # stale socket from a crashed daemon
+        
+        await self.agent.initialize()
+        self.agent.startup.start()  # warm every step before the first request
+        self._server = await asyncio.start_unix_server(self._handle_client, path=str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"Agent daemon listening on {self.socket_path}")
+    
+    async def serve(self) -> None:
+        """Run until a shutdown request arrives, then shut the agent down once"""
+        await self.start()
+        try:
+            await self._stopped.wait()
+        finally:
+            await self.close()
+    
+    def stop(self) -> None:
+        self._stopped.set()
+    
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        server, self._server = self._server, None
+        server.close()
+        await server.wait_closed()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        await self.agent.shutdown()
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while not self._stopped.is_set():
+                line = await reader.readline()
+                if not line:
+                    break
+                
+                response = await self._dispatch(line, writer)
+                writer.write(json.dumps(response, default=str).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def _dispatch(self, line: bytes, writer: asyncio.StreamWriter) -> TaskResult:
+        try:
+            request = json.loads(line)
+            command_name = request['command']
+            kwargs = request.get('kwargs') or {}
+        except (ValueError, KeyError, TypeError) as e:
+            return TaskResult(
+                success=False,
+                data=None,
+                error=f"Malformed request: {e}",
+                duration_ms=0,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            )
+        
+        self.requests_served += 1
+        if request.get('ack'):
+            # The client waits as long as our config says, not its own
+            deadline_ms = None if command_name == DAEMON_SHUTDOWN else \
+                self.agent.command_deadline_ms(command_name, kwargs.get('deadline_ms'))
+            writer.write(json.dumps({'accepted': True, 'deadline_ms': deadline_ms}).encode() + b'\n')
+            await writer.drain()
+        if command_name == DAEMON_SHUTDOWN:
+            self.stop()
+            return TaskResult(
+                success=True,
+                data={'requests_served': self.requests_served},
+                error=None,
+                duration_ms=0,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            )
+        
+        return await self.agent.execute_command(command_name, **kwargs)
+
+class DaemonUnavailable(ConnectionError):
+    """The daemon could not be reached; nothing was sent, so running in-process is safe"""
+
+# Slack on top of a command's deadline for queueing and the round trip
+DAEMON_REPLY_GRACE_S = 30.0
+
+class DaemonClient:
+    """
+    Thin client: forwards a command to the daemon and returns its TaskResult.
+    
+    Once a request is sent, the daemon owns it: a late or missing reply is
+    reported as a failed result, never retried, so writes are not duplicated.
+    The daemon acknowledges each request with the deadline it will enforce,
+    and the client waits that long plus DAEMON_REPLY_GRACE_S.
+    """
+    
+    def __init__(self, socket_path: Union[str, Path], timeout_s: Optional[float] = None):
+        self.socket_path = Path(socket_path)
+        self.timeout_s = timeout_s  # None: the daemon's deadline for the command plus grace
+    
+    def available(self) -> bool:
+        """Cheap liveness check - a connect, no request"""
+        if not self.socket_path.exists() or not hasattr(socket, 'AF_UNIX'):
+            return False
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+    
+    def reply_timeout_s(self, deadline_ms: Optional[float]) -> Optional[float]:
+        """How long to wait for a reply, given the deadline the daemon reported"""
+        if self.timeout_s is not None:
+            return self.timeout_s
+        if not deadline_ms:
+            return None  # the daemon runs the command without a deadline
+        return deadline_ms / 1000 + DAEMON_REPLY_GRACE_S
+    
+    async def _read_message(self, reader: asyncio.StreamReader, timeout_s: Optional[float]) -> Dict[str, Any]:
+        line = await asyncio.wait_for(reader.readline(), timeout_s)
+        if not line:
+            raise ConnectionError("Daemon closed the connection")
+        return json.loads(line)
+    
+    async def execute(self, command: str, **kwargs) -> TaskResult:
+        """Send one command; raises DaemonUnavailable only if it was never sent"""
+        try:
+            reader, writer = await asyncio.open_unix_connection(str(self.socket_path))
+        except OSError as e:
+            raise DaemonUnavailable(f"Daemon unavailable: {e}") from e
+        
+        timeout_s = self.timeout_s if self.timeout_s is not None else DAEMON_REPLY_GRACE_S
+        try:
+            try:
+                request = {'command': command, 'kwargs': kwargs, 'ack': True}
+                writer.write(json.dumps(request, default=str).encode() + b'\n')
+            except OSError as e:
+                raise DaemonUnavailable(f"Daemon unavailable: {e}") from e
+            await writer.drain()
+            message = await self._read_message(reader, timeout_s)
+            if not message.get('accepted'):
+                return message  # a daemon that does not acknowledge: this is the reply
+            timeout_s = self.reply_timeout_s(message.get('deadline_ms'))
+            return await self._read_message(reader, timeout_s)
+        except DaemonUnavailable:
+            raise
+        except (OSError, ValueError) as e:
+            timed_out = isinstance(e, asyncio.TimeoutError)
+            error = (f"No reply from daemon within {timeout_s:.0f}s" if timed_out else f"Daemon reply failed: {e}")
+            return TaskResult(
+                success=False,
+                data={'command': command, 'timed_out': timed_out},
+                error=f"{error} - {command} may still be running there; not retried",
+                duration_ms=0,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            )
+        finally:
+            writer.close()
+    
+    async def stop(self) -> bool:
+        if not self.available():
+            return False
+        try:
+            result = await self.execute(DAEMON_SHUTDOWN)
+        except DaemonUnavailable:
+            return False
+        return result['success']
+
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
@@ -1599,43 +4716,44 @@ async def interactive_setup():
     
     return config
 
-async def ensure_correct_branch(config: dict) -> bool:
+async def ensure_correct_branch(config: dict, probes: Optional[ProbeCache] = None,
+                                runner: Optional[ProcessRunner] = None) -> bool:
     """
     Ensure we're on the correct branch and it's up to date.
     WHY: Consistency across sessions prevents confusion.
+    
+    Branch and last fetch time come from the probe cache, so a warm start
+    on the right branch with a recent pull spawns no git processes.
     """
     default_branch = config.get('default_branch', 'dev')
     auto_pull = config.get('auto_pull', True)
+    probes = probes or ProbeCache(Path.cwd(), config.get('cache_ttl_seconds', 300))
+    runner = runner or DEFAULT_PROCESS_RUNNER
+    git_timeout_s = config.get('git_timeout_s', 120.0)
     
     try:
-        # Get current branch
-        current_branch = subprocess.run(
-            ['git', 'branch', '--show-current'],
-            capture_output=True,
-            text=True
-        ).stdout.strip()
+        # Get current branch (cached until .git/HEAD changes)
+        current_branch = (await probes.ensure(('current_branch',)))['current_branch']
         
         # Switch if needed
         if current_branch != default_branch:
             print(f"\n🔄 Switching from {current_branch} to {default_branch}...")
-            result = subprocess.run(
-                ['git', 'checkout', default_branch],
-                capture_output=True,
-                text=True
-            )
+            # Async, so concurrent startup steps keep running
+            result = await runner.run(['git', 'checkout', default_branch], timeout_s=git_timeout_s)
+            probes.invalidate('current_branch')
             if result.returncode != 0:
                 logger.error(f"Failed to switch to {default_branch}: {result.stderr}")
                 return False
         
-        # Pull latest if enabled
-        if auto_pull:
+        # Pull latest if enabled and the last fetch is older than the cache TTL
+        last_fetch_age = probes.age('last_fetch')
+        if auto_pull and last_fetch_age is not None and last_fetch_age < probes.ttl_seconds:
+            logger.debug(f"Skipping pull - last fetch {last_fetch_age:.0f}s ago")
+        elif auto_pull:
             print(f"📥 Pulling latest changes from {default_branch}...")
-            result = subprocess.run(
-                ['git', 'pull', 'origin', default_branch],
-                capture_output=True,
-                text=True
-            )
+            result = await runner.run(['git', 'pull', 'origin', default_branch], timeout_s=git_timeout_s)
             if result.returncode == 0:
+                probes.record('last_fetch', datetime.now(timezone.utc).isoformat())
                 print(f"✅ Updated to latest {default_branch}")
             else:
                 logger.warning(f"Could not pull latest: {result.stderr}")
@@ -1646,6 +4764,91 @@ async def ensure_correct_branch(config: dict) -> bool:
         logger.error(f"Git operations failed: {e}")
         return False
 
+def build_agent_config(config: Dict[str, Any]) -> ConfigDict:
+    """Agent configuration from the saved .agent_boot.config.json settings"""
+    agent_config = ConfigDict(
+        project_root=os.getcwd(),
+        canonical_docs={
+            'devlog': 'docs/status/DEVLOG.md',
+            'epics': 'docs/roadmap/EPICS.md',
+            'status': 'docs/SYSTEM_STATUS.md'
+        },
+        test_coverage_threshold=config.get('test_coverage_threshold', 80.0),
+        performance_budget_ms=200,
+        cache_ttl_seconds=config.get('cache_ttl_seconds', 300),
+        max_retries=3,
+        enable_telemetry=False
+    )
+    # Tuning knobs (including default_branch / auto_pull) may be set in the config file
+    agent_config.update({key: config[key] for key in DEFAULT_TUNING if key in config})
+    agent_config['branch_check'] = True
+    return agent_config
+
+def _dump(value: Any) -> str:
+    return json.dumps(value, indent=2, default=str)
+
+# CLI command -> (agent command, output formatter)
+CLI_COMMANDS: Dict[str, tuple] = {
+    'init': ('session', lambda r: f"Agent Boot initialized - Session ID: {r['data']['session_id']}\n{_dump(r['data'])}"),
+    'update-docs': ('update_docs', lambda r: f"Documentation updated: {r['success']}"),
+    'create-epic': ('create_epic', lambda r: f"Epic created: {_dump(r)}"),
+    'update-epic': ('update_epic', lambda r: f"Epic updated: {_dump(r)}"),
+    'list-epics': ('list_epics', lambda r: f"\nEpics:\n{_dump(r['data'])}"),
+    'sync-github': ('sync_github', lambda r: f"GitHub sync result: {_dump(r)}"),
+    'bulk-create-issues': ('bulk_create_issues', lambda r: f"Bulk issue creation: {_dump(r)}"),
+    'test-security': ('test_security', lambda r: f"Security test result: {_dump(r)}"),
+    'performance-report': ('performance_report', lambda r: f"Performance Report:\n{_dump(r['data'])}"),
+    'github-status': ('github_status', lambda r: f"GitHub Status:\n{_dump(r['data'])}"),
+    'workflow-status': ('workflow_status', lambda r: f"Workflow Status:\n{_dump(r['data'])}"),
+    'watch-prs': ('watch_prs', lambda r: f"PR changes:\n{_dump(r['data'])}"),
+}
+
+def cli_command_kwargs(args) -> Dict[str, Any]:
+    """Agent command kwargs for the parsed CLI arguments"""
+    if args.command == 'update-docs':
+        return {'content': args.content or f"Updated via CLI at {datetime.now(timezone.utc).isoformat()}"}
+    if args.command == 'create-epic':
+        return {'title': args.title, 'description': args.description or "", 'create_issue': args.create_issue}
+    if args.command == 'update-epic':
+        return {'epic_id': args.epic_id, 'title': args.title, 'status': args.status, 'completion': args.completion}
+    if args.command == 'list-epics':
+        return {'status': args.status, 'tag': args.tag, 'priority': args.priority}
+    if args.command == 'sync-github':
+        return {'full': args.full}
+    if args.command == 'test-security':
+        return {'input': args.input or "test input"}
+    if args.command == 'watch-prs':
+        return {'duration_s': args.duration}
+    return {}
+
+async def load_cli_config(command: str) -> Dict[str, Any]:
+    """Load .agent_boot.config.json, running interactive setup when needed"""
+    config_file = Path('.agent_boot.config.json')
+    if command == 'init' or not config_file.exists():
+        return await interactive_setup()
+    try:
+        with open(config_file, 'r') as f:
+            return json.load(f)
+    except:
+        return await interactive_setup()
+
+def report_startup(profiler: Optional[StartupProfiler], budget_ms: Optional[float]) -> None:
+    """Print the startup profile to stderr, warning when over budget"""
+    if profiler is None:
+        return
+    print(profiler.format(budget_ms), file=sys.stderr)
+    if not profiler.report(budget_ms)['within_budget']:
+        logger.warning(f"Startup took {profiler.total_ms:.1f}ms - over the {budget_ms:.0f}ms budget")
+
+def startup_profiler() -> StartupProfiler:
+    """Profiler seeded with this module's import phase"""
+    profiler = StartupProfiler()
+    stdlib_ms = (_STDLIB_IMPORTED - _IMPORT_STARTED) * 1000
+    profiler.record('stdlib imports', stdlib_ms, depth=1)
+    profiler.record('import agent_boot', (_IMPORT_FINISHED - _IMPORT_STARTED) * 1000,
+                    children_ms=stdlib_ms)
+    return profiler
+
 async def main():
     """
     Main entry point with comprehensive CLI.
@@ -1666,142 +4869,105 @@ Examples:
   python agent_boot.py performance-report              # Generate performance report
   python agent_boot.py github-status                   # Check GitHub PR status
   python agent_boot.py workflow-status                 # Get complete workflow status
+  python agent_boot.py watch-prs --duration 300 --daemon # Report PR/CI changes only
+  python agent_boot.py daemon &                        # Keep a warm agent running
+  python agent_boot.py list-epics --daemon             # Forward a command to the daemon
+  python agent_boot.py daemon-stop                     # Stop the daemon
         """
     )
     
-    parser.add_argument('command', choices=[
-        'init', 'update-docs', 'create-epic', 'update-epic', 'list-epics', 'test-security', 'performance-report',
-        'github-status', 'workflow-status', 'sync-github'
-    ], help='Command to execute')
+    parser.add_argument('command', choices=list(CLI_COMMANDS) + ['daemon', 'daemon-stop'],
+                        help='Command to execute')
     
     parser.add_argument('--title', help='Epic title')
     parser.add_argument('--description', help='Epic description')
     parser.add_argument('--epic-id', help='Epic ID to update')
     parser.add_argument('--status', choices=['TODO', 'IN_PROGRESS', 'DONE'], help='Epic status')
     parser.add_argument('--completion', type=int, help='Completion percentage (0-100)')
+    parser.add_argument('--tag', help='Only epics with this tag (list-epics)')
+    parser.add_argument('--priority', choices=[p.name for p in Priority], help='Only epics with this priority (list-epics)')
     parser.add_argument('--input', help='Input to test')
     parser.add_argument('--content', help='Documentation content')
     parser.add_argument('--create-issue', action='store_true', help='Create GitHub issue for epic')
+    parser.add_argument('--full', action='store_true', help='Resync every issue, ignoring the watermark')
+    parser.add_argument('--duration', type=float, default=60.0, help='Seconds to watch PRs for (watch-prs)')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Forward the command to a running daemon (env: AGENT_BOOT_DAEMON=1)')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='Print per-phase startup timings (like python -X importtime)')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     
     args = parser.parse_args()
     
-    if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
+    configure_logging(debug=args.debug)
+    profiler = startup_profiler() if args.profile_startup else None
+    phase = profiler.phase if profiler else lambda name: nullcontext()
     
-    # Load or create configuration
-    config_file = Path('.agent_boot.config.json')
-    if args.command == 'init' or not config_file.exists():
-        config = await interactive_setup()
-    else:
-        try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-        except:
-            config = await interactive_setup()
+    if args.command == 'create-epic' and not args.title:
+        print("Error: --title required for create-epic")
+        sys.exit(1)
     
-    # Ensure we're on the right branch
-    await ensure_correct_branch(config)
+    if args.command == 'update-epic' and not args.epic_id and not args.title:
+        print("Error: --epic-id or --title required for update-epic")
+        sys.exit(1)
     
-    # Initialize agent with loaded config
-    agent_config = ConfigDict(
-        project_root=os.getcwd(),
-        canonical_docs={
-            'devlog': 'docs/status/DEVLOG.md',
-            'epics': 'docs/roadmap/EPICS.md',
-            'status': 'docs/SYSTEM_STATUS.md'
-        },
-        test_coverage_threshold=config.get('test_coverage_threshold', 80.0),
-        performance_budget_ms=200,
-        cache_ttl_seconds=300,
-        max_retries=3,
-        enable_telemetry=False
-    )
+    socket_path = default_socket_path(Path.cwd())
+    
+    if args.command == 'daemon-stop':
+        stopped = await DaemonClient(socket_path).stop()
+        print("Daemon stopped" if stopped else "No daemon running")
+        return
+    
+    agent_command, formatter = CLI_COMMANDS.get(args.command, (None, None))
+    kwargs = cli_command_kwargs(args)
+    
+    # Thin-client path: no config, git or module work in this process
+    use_daemon = args.daemon or os.environ.get('AGENT_BOOT_DAEMON') == '1'
+    if use_daemon and args.command not in ('init', 'daemon'):
+        client = DaemonClient(socket_path)
+        if client.available():
+            try:
+                with phase(f"daemon {agent_command}"):
+                    result = await client.execute(agent_command, **kwargs)
+            except DaemonUnavailable as e:
+                logger.warning(f"{e} - running in-process")
+            else:
+                print(formatter(result))
+                report_startup(profiler, None)
+                if args.command == 'update-epic' and not result['success']:
+                    sys.exit(1)
+                return
+        else:
+            logger.info("No daemon running - running in-process")
+    
+    with phase('load config'):
+        config = await load_cli_config(args.command)
+    with phase('construct agent'):
+        agent = AgentBoot(build_agent_config(config))
+        agent.profiler = profiler
     
-    agent = AgentBoot(agent_config)
-    await agent.initialize()
+    # Branch check, epic load and gh probe run as startup steps, only for
+    # the commands that need them (see MODULE_STEPS)
+    if args.command == 'daemon':
+        await AgentDaemon(agent, socket_path).serve()
+        return
+    
+    with phase('initialize'):
+        await agent.initialize()
     
     try:
-        # Execute command
-        if args.command == 'init':
-            print(f"Agent Boot initialized - Session ID: {agent.context.session_id}")
-            print(json.dumps(agent.context.to_dict(), indent=2))
-            
-        elif args.command == 'update-docs':
-            result = await agent.execute_command(
-                'update_docs',
-                content=args.content or f"Updated via CLI at {datetime.now(timezone.utc).isoformat()}"
-            )
-            print(f"Documentation updated: {result['success']}")
-            
-        elif args.command == 'create-epic':
-            if not args.title:
-                print("Error: --title required for create-epic")
-                sys.exit(1)
-                
-            result = await agent.execute_command(
-                'create_epic',
-                title=args.title,
-                description=args.description or "",
-                create_issue=args.create_issue
-            )
-            print(f"Epic created: {json.dumps(result, indent=2)}")
-            
-        elif args.command == 'update-epic':
-            if not args.epic_id and not args.title:
-                print("Error: --epic-id or --title required for update-epic")
-                sys.exit(1)
-            
-            # Find epic by title if ID not provided
-            epic_id = args.epic_id
-            if not epic_id and args.title:
-                # Find epic by title
-                for e_id, epic in agent.epic_manager.epics.items():
-                    if epic.title == args.title:
-                        epic_id = e_id
-                        break
-            
-            if not epic_id:
-                print(f"Error: Epic not found with title '{args.title}'")
-                sys.exit(1)
-            
-            result = await agent.execute_command(
-                'update_epic',
-                epic_id=epic_id,
-                status=args.status,
-                completion=args.completion
-            )
-            print(f"Epic updated: {json.dumps(result, indent=2)}")
-            
-        elif args.command == 'list-epics':
-            result = await agent.execute_command('list_epics')
-            print(f"\nEpics:\n{json.dumps(result['data'], indent=2)}")
-            
-        elif args.command == 'sync-github':
-            result = await agent.execute_command('sync_github')
-            print(f"GitHub sync result: {json.dumps(result, indent=2)}")
-            
-        elif args.command == 'test-security':
-            result = await agent.execute_command(
-                'test_security',
-                input=args.input or "test input"
-            )
-            print(f"Security test result: {json.dumps(result, indent=2)}")
-            
-        elif args.command == 'performance-report':
-            result = await agent.execute_command('performance_report')
-            print(f"Performance Report:\n{json.dumps(result['data'], indent=2)}")
-            
-        elif args.command == 'github-status':
-            result = await agent.execute_command('github_status')
-            print(f"GitHub Status:\n{json.dumps(result['data'], indent=2)}")
-            
-        elif args.command == 'workflow-status':
-            result = await agent.execute_command('workflow_status')
-            print(f"Workflow Status:\n{json.dumps(result['data'], indent=2)}")
+        with phase(f"first command {agent_command}"):
+            result = await agent.execute_command(agent_command, **kwargs)
+        print(formatter(result))
+        report_startup(profiler, agent.context.config['startup_budget_ms'])
+        
+        if args.command == 'update-epic' and not result['success']:
+            sys.exit(1)
             
     finally:
         await agent.shutdown()
 
+_IMPORT_FINISHED = time.perf_counter()
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Deadlines and errors for calls that leave the process (subprocesses, GitHub).
+- A command's deadline travels in a context variable to every child call
+- ExternalCallError says whether a failure is worth retrying
+Shared by agent_boot and the utils/github_* modules (stdlib only).
+"""
+from __future__ import annotations
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+# time.monotonic() deadline of the command being executed, if any
+_DEADLINE: ContextVar[Optional[float]] = ContextVar('agent_boot_deadline', default=None)
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]):
+    """
+    Run the block under a deadline `seconds` from now.
+    WHY: A context variable reaches every child call (subprocesses, retries)
+    without threading a timeout argument through each signature. Nested
+    scopes can only shorten the deadline, never extend it.
+    """
+    if seconds is None:
+        yield _DEADLINE.get()
+        return
+    deadline = time.monotonic() + seconds
+    outer = _DEADLINE.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _DEADLINE.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _DEADLINE.reset(token)
+
+def remaining_s() -> Optional[float]:
+    """Seconds left before the current deadline (None when there is none)"""
+    deadline = _DEADLINE.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+def detach_deadline() -> None:
+    """
+    Drop the deadline for the rest of the current task.
+    WHY: Background tasks copy the context of the command that started them
+    but must not die with that command's deadline.
+    """
+    _DEADLINE.set(None)
+
+def clamp_timeout(timeout_s: float) -> float:
+    """Shrink a child operation's timeout so it cannot outlive the current deadline"""
+    remaining = remaining_s()
+    return timeout_s if remaining is None else max(0.0, min(timeout_s, remaining))
+
+class ExternalCallError(Exception):
+    """A failed external command; transient failures are worth retrying"""
+    
+    TRANSIENT = re.compile(
+        r'time[sd]? ?out|rate limit|HTTP 5\d\d|\b50[234]\b|connection (reset|refused)|'
+        r'could not resolve|temporarily|unexpected EOF',
+        re.IGNORECASE
+    )
+    
+    def __init__(self, message: str, transient: bool = False, retry_after_s: Optional[float] = None):
+        super().__init__(message)
+        self.transient = transient
+        self.retry_after_s = retry_after_s  # server-requested wait (Retry-After), if any
+
+class NotFoundError(ExternalCallError):
+    """The addressed object does not exist (HTTP 404, GraphQL NOT_FOUND)"""
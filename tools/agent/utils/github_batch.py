@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+GraphQL request batching.
+- Fields requested within a short window go out as one aliased request
+- Errors are routed back to the caller whose field failed
+"""
+from __future__ import annotations
+import asyncio
+import json
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .external import ExternalCallError, NotFoundError
+
+class GraphQLBatcher:
+    """
+    Merge GraphQL fields requested close together into one aliased request.
+    WHY: A status refresh needs PR checks, issue states and comment ids;
+    batched, that is one round trip instead of one per PR or issue.
+    
+    `field` is one top-level selection that may use $variables, and
+    `variables` maps each name to (graphql_type, value). Reads and mutations
+    batch separately; identical reads in one batch share an alias.
+    """
+    
+    def __init__(self, send: Callable[[str, Dict[str, Any], bool], Awaitable[Dict[str, Any]]],
+                 window_s: float = 0.005, max_batch: int = 25):
+        self.send = send  # (document, variables, is_mutation) -> {'data': ..., 'errors': [...]}
+        self.window_s = window_s
+        self.max_batch = max_batch
+        self.counters = {'requests': 0, 'fields': 0, 'deduplicated': 0}
+        self._pending: Dict[str, List[tuple]] = {'query': [], 'mutation': []}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set = set()
+    
+    async def query(self, field: str, variables: Optional[Dict[str, tuple]] = None) -> Any:
+        return await self._enqueue('query', field, variables or {})
+    
+    async def mutate(self, field: str, variables: Optional[Dict[str, tuple]] = None) -> Any:
+        return await self._enqueue('mutation', field, variables or {})
+    
+    async def _enqueue(self, operation: str, field: str, variables: Dict[str, tuple]) -> Any:
+        pending = self._pending[operation]
+        key = (field, json.dumps(variables, sort_keys=True, default=str))
+        if operation == 'query':
+            for entry_key, _, _, future in pending:
+                if entry_key == key:
+                    self.counters['deduplicated'] += 1
+                    return await asyncio.shield(future)
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # Mark failures retrieved even if every waiter was cancelled
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        pending.append((key, field, variables, future))
+        self.counters['fields'] += 1
+        if len(pending) >= self.max_batch:
+            self._flush(operation)
+        elif operation not in self._timers:
+            self._timers[operation] = loop.call_later(self.window_s, self._flush, operation)
+        # Shielded: one waiter giving up must not cancel the batch for the others
+        return await asyncio.shield(future)
+    
+    def _flush(self, operation: str) -> None:
+        timer = self._timers.pop(operation, None)
+        if timer is not None:
+            timer.cancel()
+        batch, self._pending[operation] = self._pending[operation], []
+        if batch:
+            task = asyncio.ensure_future(self._execute(operation, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    @staticmethod
+    def build(operation: str, fields: List[tuple]) -> tuple:
+        """(document, variables) for [(field, variables), ...] aliased f0, f1, ..."""
+        definitions, selections, variables = [], [], {}
+        for index, (field, field_variables) in enumerate(fields):
+            alias = f"f{index}"
+            for name, (type_name, value) in field_variables.items():
+                definitions.append(f"${alias}_{name}: {type_name}")
+                variables[f"{alias}_{name}"] = value
+            selections.append(f"{alias}: " + re.sub(r'\$(\w+)', rf'${alias}_\1', field))
+        header = f"{operation}({', '.join(definitions)})" if definitions else operation
+        return f"{header} {{ {' '.join(selections)} }}", variables
+    
+    async def _execute(self, operation: str, batch: List[tuple]) -> None:
+        document, variables = self.build(operation, [(field, field_vars) for _, field, field_vars, _ in batch])
+        self.counters['requests'] += 1
+        try:
+            response = await self.send(document, variables, operation == 'mutation')
+        except asyncio.CancelledError:
+            for *_, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        # Errors carry the alias they belong to as the first path element
+        data = response.get('data') or {}
+        errors: Dict[Optional[str], Dict[str, Any]] = {}
+        for error in response.get('errors') or []:
+            path = error.get('path') or [None]
+            errors.setdefault(path[0], error)
+        for index, (*_, future) in enumerate(batch):
+            alias = f"f{index}"
+            error = errors.get(alias) or (errors.get(None) if data.get(alias) is None else None)
+            if future.done():
+                continue
+            if error:
+                error_type = NotFoundError if error.get('type') == 'NOT_FOUND' else ExternalCallError
+                future.set_exception(error_type(f"GitHub GraphQL: {error.get('message', str(error))}"))
+            else:
+                future.set_result(data.get(alias))
+    
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.counters)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Persistent cache for GitHub reads.
+- Fresh entries answer at once; stale ones answer at once and refresh behind
+- ETags are kept so expired REST reads revalidate with a cheap 304
+"""
+from __future__ import annotations
+import asyncio
+import copy
+import json
+import logging
+import os
+import time
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .external import detach_deadline
+
+logger = logging.getLogger(__name__)
+
+class ResponseCache:
+    """
+    Persistent cache for GitHub reads with stale-while-revalidate.
+    WHY: Repeated status commands answer from disk, and conditional
+    revalidation keeps us well inside the API rate limits.
+    
+    Within ttl_s an entry is served as is. For stale_s after that it is served
+    at once while one background refresh updates it; older or expired entries
+    are refreshed first. fetch(previous) gets the old entry so it can
+    revalidate conditionally, and returns it unchanged when nothing changed.
+    
+    Inside an event loop, changes are written to disk at most once per
+    save_delay_s (and when the loop cancels the pending save on exit).
+    """
+    
+    def __init__(self, path: Optional[Path] = None, ttl_s: float = 300.0, stale_s: float = 600.0,
+                 max_entries: int = 256, clock: Callable[[], float] = time.time, save_delay_s: float = 1.0):
+        self.path = path
+        self.ttl_s = ttl_s
+        self.stale_s = stale_s
+        self.max_entries = max_entries
+        self.clock = clock  # wall clock - entries outlive the process
+        self.save_delay_s = save_delay_s
+        self.counters = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'not_modified': 0,
+                         'refresh_failures': 0, 'saves': 0}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._dirty = False
+        self._saving: Optional[asyncio.Task] = None
+    
+    @cached_property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Loaded from disk on first use"""
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable GitHub cache {self.path}: {e}")
+            return {}
+    
+    async def get(self, key: str, fetch: Callable[[Optional[Dict[str, Any]]], Awaitable[Dict[str, Any]]],
+                  max_age_s: Optional[float] = None) -> Any:
+        """
+        The cached value for key; fetch returns an entry {'value': ..., 'etag': ...}.
+        max_age_s overrides the TTL and disables serving stale.
+        """
+        entry = self.entries.get(key)
+        ttl_s, stale_s = (self.ttl_s, self.stale_s) if max_age_s is None else (max_age_s, 0.0)
+        age = self.clock() - entry['stored_at'] if entry and not entry.get('expired') else None
+        if age is not None and age < ttl_s:
+            self.counters['hits'] += 1
+            return copy.deepcopy(entry['value'])
+        if age is not None and age < ttl_s + stale_s:
+            self.counters['stale_hits'] += 1
+            if key not in self._refreshing:
+                task = asyncio.ensure_future(self._background_refresh(key, fetch, entry))
+                self._refreshing[key] = task
+                task.add_done_callback(lambda done, key=key: self._refresh_done(key, done))
+            return copy.deepcopy(entry['value'])
+        self.counters['misses'] += 1
+        return copy.deepcopy(await self._refresh(key, fetch, entry))
+    
+    async def _refresh(self, key: str, fetch: Callable, previous: Optional[Dict[str, Any]]) -> Any:
+        entry = await fetch(previous)
+        if previous is not None and entry is previous:
+            self.counters['not_modified'] += 1
+        self.store(key, entry)
+        return entry['value']
+    
+    async def _background_refresh(self, key: str, fetch: Callable, previous: Dict[str, Any]) -> None:
+        detach_deadline()  # outlives the command that triggered it (copied context)
+        await self._refresh(key, fetch, previous)
+    
+    def _refresh_done(self, key: str, task: asyncio.Task) -> None:
+        self._refreshing.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.counters['refresh_failures'] += 1
+            logger.debug(f"Background refresh of {key} failed: {task.exception()}")
+    
+    def store(self, key: str, entry: Dict[str, Any]) -> None:
+        entry = {name: value for name, value in entry.items() if name != 'expired'}
+        entry['stored_at'] = self.clock()
+        self.entries[key] = entry
+        if len(self.entries) > self.max_entries:
+            oldest = sorted(self.entries, key=lambda name: self.entries[name]['stored_at'])
+            for name in oldest[:len(self.entries) - self.max_entries]:
+                del self.entries[name]
+        self._schedule_save()
+    
+    def expire(self, *prefixes: str) -> None:
+        """
+        Force a refresh on next read of keys starting with any of `prefixes`
+        (all keys without any), keeping ETags for revalidation (read-your-writes).
+        """
+        prefixes = prefixes or ('',)
+        changed = False
+        for key, entry in self.entries.items():
+            if not entry.get('expired') and key.startswith(prefixes):
+                entry['expired'] = changed = True
+        if changed:
+            self._schedule_save()
+    
+    async def wait(self, timeout_s: float) -> None:
+        """Let in-flight background refreshes finish (bounded)"""
+        if self._refreshing:
+            await asyncio.wait(list(self._refreshing.values()), timeout=timeout_s)
+    
+    def _schedule_save(self) -> None:
+        """
+        Save soon rather than now.
+        WHY: A bulk run stores or expires entries hundreds of times; rewriting
+        the whole file on the event loop for each one would stall it.
+        """
+        if self.path is None:
+            return
+        self._dirty = True
+        if self._saving is not None and not self._saving.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()  # no loop to defer to
+            return
+        self._saving = loop.create_task(self._save_later())
+    
+    async def _save_later(self) -> None:
+        try:
+            await asyncio.sleep(self.save_delay_s)
+        finally:
+            # Also when cancelled (the loop is shutting down): never lose the changes
+            self.save()
+    
+    def save(self) -> None:
+        """Write the entries to disk now (if they changed)"""
+        if self.path is None or not self._dirty:
+            return
+        self._dirty = False
+        self.counters['saves'] += 1
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix('.tmp')
+            temp_path.write_text(json.dumps(self.entries))
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save GitHub cache: {e}")
+    
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, 'entries': len(self.entries), 'refreshing': len(self._refreshing)}
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+How GitHub API requests travel: the gh CLI or pooled HTTPS.
+- GitHubResponse: status, lower-cased headers and a lazily decoded body
+- GhCliTransport: one `gh api` process per request
+- HttpTransport: keep-alive http.client connections (imported on first use)
+"""
+from __future__ import annotations
+import asyncio
+import json
+import re
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from .external import ExternalCallError, NotFoundError, clamp_timeout
+
+if TYPE_CHECKING:
+    from tools.agent.agent_boot import ProbeCache, ProcessRunner
+
+_JSON_WHITESPACE = re.compile(r'\s*')
+
+@dataclass
+class GitHubResponse:
+    """One REST/GraphQL response; header names are lower-cased"""
+    status: int
+    headers: Dict[str, str]
+    raw: str
+    
+    @classmethod
+    def parse(cls, status: int, headers: Dict[str, str], raw: str) -> 'GitHubResponse':
+        return cls(status, {name.lower(): value for name, value in headers.items()}, raw)
+    
+    @cached_property
+    def data(self) -> Any:
+        """The decoded body (decoded on first use; iter_items() avoids it)"""
+        try:
+            return json.loads(self.raw) if self.raw.strip() else None
+        except json.JSONDecodeError:
+            return self.raw
+    
+    def iter_items(self) -> Iterator[Any]:
+        """
+        Decode a JSON array body one element at a time.
+        WHY: A page is handled item by item without building the whole list.
+        """
+        decoder = json.JSONDecoder()
+        text = self.raw
+        index = _JSON_WHITESPACE.match(text).end()
+        if text[index:index + 1] != '[':
+            raise ValueError(f"Expected a JSON array, got {text[index:index + 20]!r}")
+        index += 1
+        while True:
+            index = _JSON_WHITESPACE.match(text, index).end()
+            if text[index:index + 1] == ']':
+                return
+            item, index = decoder.raw_decode(text, index)
+            yield item
+            index = _JSON_WHITESPACE.match(text, index).end()
+            if text[index:index + 1] == ',':
+                index += 1
+    
+    def next_page_query(self) -> Optional[str]:
+        """Query string of the Link rel="next" URL, if there is another page"""
+        match = re.search(r'<([^>]*)>;\s*rel="next"', self.headers.get('link', ''))
+        return match.group(1).partition('?')[2] if match else None
+    
+    def raise_for_status(self) -> 'GitHubResponse':
+        """5xx, 429 and rate-limit 403s are transient; other 4xx are not"""
+        if self.status < 400:
+            return self
+        message = self.data.get('message', '') if isinstance(self.data, dict) else str(self.data or '')
+        transient = (self.status >= 500 or self.status == 429
+                     or (self.status == 403 and 'rate limit' in message.lower()))
+        error_type = NotFoundError if self.status == 404 else ExternalCallError
+        raise error_type(f"GitHub API {self.status}: {message or 'request failed'}",
+                         transient=transient, retry_after_s=self.retry_after_s())
+    
+    def retry_after_s(self) -> Optional[float]:
+        """Retry-After, or the primary limit's reset time once it is exhausted"""
+        if 'retry-after' in self.headers:
+            try:
+                return float(self.headers['retry-after'])
+            except ValueError:
+                return None
+        if self.headers.get('x-ratelimit-remaining') == '0' and 'x-ratelimit-reset' in self.headers:
+            return max(0.0, float(self.headers['x-ratelimit-reset']) - time.time())
+        return None
+
+class GitHubTransport(ABC):
+    """
+    How a GitHub API request travels.
+    `path` is relative to the API root ('repos/o/r/issues?state=all');
+    'graphql' is the GraphQL endpoint.
+    """
+    
+    name = 'base'
+    
+    @abstractmethod
+    def available(self) -> bool:
+        """Whether requests can be sent at all (logged in / token present)"""
+    
+    async def probe(self) -> bool:
+        """available(), for coroutines; override when checking it may block"""
+        return self.available()
+    
+    @abstractmethod
+    async def request(self, method: str, path: str, body: Any = None,
+                      headers: Optional[Dict[str, str]] = None) -> GitHubResponse:
+        """Send one request; non-2xx statuses are returned, not raised"""
+    
+    async def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        response = await self.request('POST', 'graphql', {'query': query, 'variables': variables or {}})
+        errors = (response.data or {}).get('errors')
+        if errors:
+            raise ExternalCallError(f"GitHub GraphQL: {errors[0].get('message', errors[0])}")
+        return response.data.get('data') or {}
+    
+    def stats(self) -> Dict[str, Any]:
+        return {'transport': self.name}
+    
+    def close(self) -> None:
+        """Release pooled resources"""
+
+class GhCliTransport(GitHubTransport):
+    """
+    One `gh api` process per request.
+    WHY: Works wherever the user is logged in with gh - no token handling.
+    """
+    
+    name = 'gh'
+    STATUS_LINE = re.compile(r'^HTTP/[\d.]+ (\d{3})')
+    
+    def __init__(self, probes: ProbeCache, runner: ProcessRunner, timeout_s: float = 10.0):
+        self.probes = probes
+        self.runner = runner
+        self.timeout_s = timeout_s
+    
+    def available(self) -> bool:
+        return self.probes.ensure_sync(('gh_auth',))['gh_auth']
+    
+    async def probe(self) -> bool:
+        return (await self.probes.ensure(('gh_auth',)))['gh_auth']
+    
+    async def request(self, method: str, path: str, body: Any = None,
+                      headers: Optional[Dict[str, str]] = None) -> GitHubResponse:
+        argv = ['gh', 'api', '--method', method, '--include', path.lstrip('/')]
+        for name, value in (headers or {}).items():
+            argv.extend(['-H', f"{name}: {value}"])
+        payload = None
+        if body is not None:
+            argv.extend(['--input', '-'])
+            payload = json.dumps(body).encode()
+        
+        timeout = clamp_timeout(self.timeout_s)
+        if timeout <= 0:
+            raise ExternalCallError("gh api not started - command deadline passed")
+        try:
+            result = await self.runner.run(argv, timeout_s=timeout, input=payload)
+        except subprocess.TimeoutExpired:
+            raise ExternalCallError(f"gh api timed out after {timeout:.1f}s",
+                                    transient=timeout == self.timeout_s)
+        
+        response = self.parse_include(result.stdout)
+        if response is None:
+            # gh failed before any HTTP exchange (not logged in, offline, ...)
+            stderr = result.stderr.strip()
+            raise ExternalCallError(
+                stderr or f"gh api exited with {result.returncode}",
+                transient=bool(ExternalCallError.TRANSIENT.search(stderr))
+            )
+        return response.raise_for_status()
+    
+    @classmethod
+    def parse_include(cls, output: str) -> Optional[GitHubResponse]:
+        """Split `gh api --include` output into status line, headers and body"""
+        parts = re.split(r'\r?\n\r?\n', output, maxsplit=1)
+        lines = parts[0].splitlines()
+        match = cls.STATUS_LINE.match(lines[0]) if lines else None
+        if not match:
+            return None
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip()] = value.strip()
+        return GitHubResponse.parse(int(match.group(1)), headers, parts[1] if len(parts) > 1 else '')
+
+class HttpTransport(GitHubTransport):
+    """
+    REST/GraphQL over pooled keep-alive http.client connections.
+    WHY: Reusing a connection skips the process spawn and TLS handshake that
+    every `gh` call pays. http.client blocks, so requests run on threads.
+    """
+    
+    name = 'http'
+    
+    def __init__(self, base_url: str = 'https://api.github.com', token: Optional[str] = None,
+                 pool_size: int = 4, timeout_s: float = 10.0):
+        from urllib.parse import urlsplit
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or 'https'
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip('/')
+        self.token = token
+        self.pool_size = pool_size
+        self.timeout_s = timeout_s
+        self.counters = {'requests': 0, 'connections_opened': 0, 'reconnects': 0}
+        self._idle: List[Any] = []
+        self._lock = threading.Lock()
+    
+    def available(self) -> bool:
+        # api.github.com needs a token; enterprise or local servers may not
+        return bool(self.token) or self.host != 'api.github.com'
+    
+    def _acquire(self, timeout: float) -> tuple:
+        """(connection, reused) - an idle pooled connection or a new one"""
+        import http.client
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+            self.counters['connections_opened'] += 1
+        connection_class = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+        return connection_class(self.host, self.port, timeout=timeout), False
+    
+    def _release(self, connection: Any) -> None:
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(connection)
+                return
+        connection.close()
+    
+    async def request(self, method: str, path: str, body: Any = None,
+                      headers: Optional[Dict[str, str]] = None) -> GitHubResponse:
+        timeout = clamp_timeout(self.timeout_s)
+        if timeout <= 0:
+            raise ExternalCallError("GitHub request not started - command deadline passed")
+        payload = json.dumps(body).encode() if body is not None else None
+        response = await asyncio.to_thread(self._send, method, path, payload, headers or {}, timeout)
+        return response.raise_for_status()
+    
+    def _send(self, method: str, path: str, payload: Optional[bytes],
+              extra_headers: Dict[str, str], timeout: float) -> GitHubResponse:
+        import http.client
+        headers = {'Accept': 'application/vnd.github+json', 'User-Agent': 'agent-boot', **extra_headers}
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        if payload is not None:
+            headers['Content-Type'] = 'application/json'
+        url = f"{self.prefix}/{path.lstrip('/')}"
+        with self._lock:
+            self.counters['requests'] += 1
+        
+        while True:
+            connection, reused = self._acquire(timeout)
+            # The socket timeout also bounds the thread, which cannot be cancelled
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            try:
+                connection.request(method, url, body=payload, headers=headers)
+                response = connection.getresponse()
+                raw = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                connection.close()
+                if reused:
+                    # The server dropped an idle keep-alive connection - use a fresh one
+                    with self._lock:
+                        self.counters['reconnects'] += 1
+                    continue
+                raise ExternalCallError(f"GitHub connection failed: {e}", transient=True)
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                raise ExternalCallError(f"GitHub request failed: {e}", transient=True)
+            
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+            return GitHubResponse.parse(response.status, dict(response.getheaders()),
+                                        raw.decode(errors='replace'))
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'transport': self.name, **self.counters, 'idle_connections': len(self._idle)}
+    
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()